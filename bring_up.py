@@ -16,12 +16,13 @@ import argparse
 import sys
 import threading
 import time
-import urllib.request
-import urllib.error
+import http.client
 import json
+from urllib.parse import urlsplit
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 # ---------------------------------------------------------------------------
 # sys.path — make moniker-svc and moniker-data importable
@@ -38,6 +39,27 @@ for p in (_SVC_SRC, _DATA_SRC, _CLIENT_ROOT):
 import os
 os.environ.setdefault("DOMAINS_CONFIG", str(Path.home() / "open-moniker-svc" / "domains.yaml"))
 
+# ---------------------------------------------------------------------------
+# Adapter modules — imported once up front so the parallel warm-up threads
+# don't serialize on the import lock. A missing module is kept as its
+# ImportError and re-raised by the warm function that needs it.
+# ---------------------------------------------------------------------------
+import importlib
+
+_ADAPTER_MODULES: dict[str, Any] = {}
+for _name in ("oracle", "snowflake", "mssql", "rest", "excel"):
+    try:
+        _ADAPTER_MODULES[_name] = importlib.import_module(f"moniker_data.adapters.{_name}")
+    except ImportError as _exc:
+        _ADAPTER_MODULES[_name] = _exc
+
+
+def _adapter_module(name: str) -> Any:
+    mod = _ADAPTER_MODULES[name]
+    if isinstance(mod, ImportError):
+        raise mod
+    return mod
+
 # ---------------------------------------------------------------------------
 # Colorama fallback (same pattern as open-moniker-svc/demo.py)
 # ---------------------------------------------------------------------------
@@ -53,7 +75,7 @@ except ImportError:
 # ---------------------------------------------------------------------------
 # Dataclasses
 # ---------------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class AdapterInfo:
     name: str
     engine: str
@@ -62,14 +84,14 @@ class AdapterInfo:
     description: str
 
 
-@dataclass
+@dataclass(slots=True)
 class SmokeResult:
     name: str
     passed: bool
     detail: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class EnvironmentInfo:
     port: int
     adapters: list[AdapterInfo] = field(default_factory=list)
@@ -83,188 +105,266 @@ class EnvironmentInfo:
 # ---------------------------------------------------------------------------
 
 def _warm_oracle() -> AdapterInfo:
-    from moniker_data.adapters.oracle import execute_query
-    rows = execute_query("SELECT COUNT(*) AS CNT FROM te_stress_tail_risk_pnl")
+    rows = _adapter_module("oracle").execute_query("SELECT COUNT(*) AS CNT FROM te_stress_tail_risk_pnl")
     count = rows[0]["CNT"] if rows else 0
     return AdapterInfo("Oracle", "SQLite", 1, count, "CVaR risk data")
 
 
 def _warm_snowflake() -> AdapterInfo:
-    from moniker_data.adapters.snowflake import MockSnowflakeAdapter
-    sf = MockSnowflakeAdapter()
+    sf = _adapter_module("snowflake").MockSnowflakeAdapter()
+    tables = list(sf.list_tables())
     total = 0
-    table_count = 0
-    for tbl in sf.list_tables():
-        r = sf.execute(f"SELECT COUNT(*) AS CNT FROM {tbl}")
-        total += r[0]["CNT"] if r else 0
-        table_count += 1
-    return AdapterInfo("Snowflake", "SQLite", table_count, total, "Govies, rates, sovereign")
+    if tables:
+        # One statement for all tables instead of a COUNT(*) round-trip per table
+        counts = " UNION ALL ".join(f"SELECT COUNT(*) AS CNT FROM {tbl}" for tbl in tables)
+        r = sf.execute(f"SELECT SUM(CNT) AS TOTAL FROM ({counts})")
+        total = (r[0]["TOTAL"] or 0) if r else 0
+    return AdapterInfo("Snowflake", "SQLite", len(tables), total, "Govies, rates, sovereign")
 
 
 def _warm_mssql() -> AdapterInfo:
-    from moniker_data.adapters.mssql import execute_query
-    r1 = execute_query("SELECT COUNT(*) AS CNT FROM credit_exposures")
-    r2 = execute_query("SELECT COUNT(*) AS CNT FROM credit_limits")
-    cnt1 = r1[0]["CNT"] if r1 else 0
-    cnt2 = r2[0]["CNT"] if r2 else 0
-    return AdapterInfo("MS-SQL", "SQLite", 2, cnt1 + cnt2, "Credit exposures & limits")
+    r = _adapter_module("mssql").execute_query(
+        "SELECT (SELECT COUNT(*) FROM credit_exposures)"
+        " + (SELECT COUNT(*) FROM credit_limits) AS CNT"
+    )
+    count = r[0]["CNT"] if r else 0
+    return AdapterInfo("MS-SQL", "SQLite", 2, count, "Credit exposures & limits")
 
 
 def _warm_rest() -> AdapterInfo:
-    from moniker_data.adapters.rest import MockRestAdapter
-    rest = MockRestAdapter()
+    rest = _adapter_module("rest").MockRestAdapter()
     energy = rest.get_energy()
     metals = rest.get_metals()
     return AdapterInfo("REST", "in-memory", 2, len(energy) + len(metals), "Energy & metals commodities")
 
 
 def _warm_excel() -> AdapterInfo:
-    from moniker_data.adapters.excel import MockExcelAdapter
-    xl = MockExcelAdapter()
+    xl = _adapter_module("excel").MockExcelAdapter()
     pools = xl.get_pool_data()
     return AdapterInfo("Excel", "in-memory", 3, len(pools), "MBS pool-level data")
 
 
 def warm_adapters() -> list[AdapterInfo]:
-    """Pre-initialize all mock data stores and return inventory info."""
-    results = []
-    for fn in (_warm_oracle, _warm_snowflake, _warm_mssql, _warm_rest, _warm_excel):
+    """Pre-initialize all mock data stores in parallel and return inventory info."""
+    warmers = (_warm_oracle, _warm_snowflake, _warm_mssql, _warm_rest, _warm_excel)
+
+    def _safely(fn) -> AdapterInfo:
         try:
-            results.append(fn())
+            return fn()
         except Exception as exc:
-            results.append(AdapterInfo(fn.__name__, "error", 0, 0, str(exc)))
-    return results
+            return AdapterInfo(fn.__name__, "error", 0, 0, str(exc))
+
+    # The stores are independent; results stay in the order listed above
+    with ThreadPoolExecutor(max_workers=len(warmers)) as ex:
+        return list(ex.map(_safely, warmers))
 
 # ---------------------------------------------------------------------------
 # Server management
 # ---------------------------------------------------------------------------
 
-def start_server(port: int = 8050, timeout: float = 15.0) -> None:
-    """Start the FastAPI server in a daemon thread and wait until healthy."""
-    import warnings
-    with warnings.catch_warnings():
-        warnings.simplefilter("ignore")
-        import uvicorn
-        from moniker_svc.main import app  # noqa: F811
+@dataclass(slots=True)
+class ServerHandle:
+    """Readiness handle for a server started in the background."""
+    port: int
+    ready: threading.Event = field(default_factory=threading.Event)
+    error: BaseException | None = None
+
+    def wait(self, timeout: float = 15.0) -> None:
+        """Block until the server is serving; raise if it failed or timed out."""
+        if not self.ready.wait(timeout):
+            raise RuntimeError(f"Server did not become healthy within {timeout}s")
+        if self.error is not None:
+            raise RuntimeError(f"Server failed to start: {self.error}") from self.error
+
+
+def start_server(port: int = 8050, timeout: float = 15.0, wait: bool = True) -> ServerHandle:
+    """Start the FastAPI server in a daemon thread and wait until it is serving.
+
+    With ``wait=False`` the app import and startup happen entirely in the
+    background; call ``handle.wait()`` once the server is needed.
+    """
+    handle = ServerHandle(port=port)
 
     def _run():
-        uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning")
+        try:
+            import warnings
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                import uvicorn
+                from moniker_svc.main import app  # noqa: F811
+
+            class _Server(uvicorn.Server):
+                # Signal readiness as soon as the listening sockets are bound,
+                # instead of polling /health from the outside.
+                async def startup(self, sockets=None):
+                    await super().startup(sockets=sockets)
+                    if self.started:
+                        handle.ready.set()
+
+            config = uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning")
+            _Server(config).run()
+        except BaseException as exc:  # uvicorn raises SystemExit on bind failure
+            handle.error = exc
+        if not handle.ready.is_set():
+            handle.error = handle.error or RuntimeError("server exited during startup")
+            handle.ready.set()
 
     t = threading.Thread(target=_run, daemon=True, name="moniker-svc")
     t.start()
 
-    # Poll /health until ready
-    url = f"http://127.0.0.1:{port}/health"
-    deadline = time.monotonic() + timeout
-    while time.monotonic() < deadline:
-        try:
-            req = urllib.request.Request(url)
-            with urllib.request.urlopen(req, timeout=2) as resp:
-                if resp.status == 200:
-                    return
-        except Exception:
-            pass
-        time.sleep(0.3)
-
-    raise RuntimeError(f"Server did not become healthy within {timeout}s")
+    if wait:
+        handle.wait(timeout)
+    return handle
 
 # ---------------------------------------------------------------------------
 # HTTP helpers (stdlib only — no httpx dependency for the bootstrap script)
 # ---------------------------------------------------------------------------
 
+# Optional acceleration: orjson parses bytes directly, skipping the decode copy
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# Idle keep-alive connections, keyed by (host, port). The smoke tests and
+# catalog probes all hit the same server, so one TCP connection is reused
+# instead of opening a fresh one per request.
+_POOL: dict[tuple[str, int], list[http.client.HTTPConnection]] = {}
+_POOL_LOCK = threading.Lock()
+
+
+def _acquire(host: str, port: int, timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+    """Return (connection, reused) — an idle pooled connection or a new one."""
+    with _POOL_LOCK:
+        idle = _POOL.get((host, port))
+        if idle:
+            return idle.pop(), True
+    return http.client.HTTPConnection(host, port, timeout=timeout), False
+
+
+def _release(conn: http.client.HTTPConnection) -> None:
+    with _POOL_LOCK:
+        _POOL.setdefault((conn.host, conn.port), []).append(conn)
+
+
+def close_connections() -> None:
+    """Close all pooled keep-alive connections."""
+    with _POOL_LOCK:
+        conns = [c for idle in _POOL.values() for c in idle]
+        _POOL.clear()
+    for conn in conns:
+        conn.close()
+
+
 def _get(url: str, timeout: float = 10.0) -> tuple[int, dict | list | None]:
     """GET *url*, return (status_code, parsed_json_or_None)."""
-    try:
-        req = urllib.request.Request(url)
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            body = json.loads(resp.read().decode())
-            return resp.status, body
-    except urllib.error.HTTPError as exc:
+    parts = urlsplit(url)
+    target = f"{parts.path}?{parts.query}" if parts.query else (parts.path or "/")
+
+    conn, reused = _acquire(parts.hostname or "127.0.0.1", parts.port or 80, timeout)
+    while True:
         try:
-            body = json.loads(exc.read().decode())
+            conn.request("GET", target)
+            resp = conn.getresponse()
+            raw = resp.read()
+            break
         except Exception:
-            body = None
-        return exc.code, body
-    except Exception:
-        return 0, None
+            conn.close()
+            if not reused:
+                return 0, None
+            # The server may have dropped an idle keep-alive connection — retry once fresh
+            conn, reused = http.client.HTTPConnection(conn.host, conn.port, timeout=timeout), False
+
+    if resp.will_close:
+        conn.close()
+    else:
+        _release(conn)
+
+    # Empty (e.g. 204) and non-JSON bodies carry nothing to parse — skip the
+    # parser rather than letting it raise.
+    if not raw or "json" not in (resp.getheader("Content-Type") or ""):
+        return resp.status, None
+    try:
+        body = _json_loads(raw)
+    except ValueError:
+        body = None
+    return resp.status, body
 
 # ---------------------------------------------------------------------------
 # Smoke tests
 # ---------------------------------------------------------------------------
 
-def run_smoke_tests(base_url: str) -> list[SmokeResult]:
-    """Hit key API endpoints and return pass/fail results."""
-    results: list[SmokeResult] = []
+def _ok_health(s, b):
+    return s == 200 and b.get("status") == "healthy"
+
+
+def _ok_stats(s, b):
+    return s == 200 and b.get("total_monikers", 0) > 0
+
+
+def _ok_search(s, b):
+    return s == 200 and len(b.get("results", [])) > 0
 
-    def _test(name: str, url: str, check):
-        status, body = _get(url)
-        try:
-            ok = check(status, body)
-            results.append(SmokeResult(name, ok, f"HTTP {status}"))
-        except Exception as exc:
-            results.append(SmokeResult(name, False, str(exc)))
-
-    # 1. Health
-    _test("Health check",
-          f"{base_url}/health",
-          lambda s, b: s == 200 and b.get("status") == "healthy")
-
-    # 2. Catalog stats
-    _test("Catalog stats",
-          f"{base_url}/catalog/stats",
-          lambda s, b: s == 200 and b.get("total_monikers", 0) > 0)
-
-    # 3. Catalog search
-    _test("Catalog search",
-          f"{base_url}/catalog/search?q=credit",
-          lambda s, b: s == 200 and len(b.get("results", [])) > 0)
-
-    # 4. Fetch: MS-SQL (credit.exposures)
-    _test("Fetch: MS-SQL",
-          f"{base_url}/fetch/credit.exposures?limit=5",
-          lambda s, b: s == 200 and len(b.get("data", [])) > 0)
-
-    # 5. Fetch: MS-SQL (credit.limits)
-    _test("Fetch: credit.limits",
-          f"{base_url}/fetch/credit.limits?limit=5",
-          lambda s, b: s == 200 and len(b.get("data", [])) > 0)
-
-    # 6. Fetch: Excel (reports/regulatory)
-    _test("Fetch: Excel",
-          f"{base_url}/fetch/reports/regulatory/2026Q1/summary?limit=5",
-          lambda s, b: s == 200 and isinstance(b.get("data"), list))
-
-    # 7. Fetch: REST (commodities.derivatives)
-    _test("Fetch: REST",
-          f"{base_url}/fetch/commodities.derivatives/energy/CL?limit=5",
-          lambda s, b: s == 200 and isinstance(b.get("data"), list))
-
-    # 8. Metadata
-    _test("Metadata",
-          f"{base_url}/metadata/credit.exposures",
-          lambda s, b: s == 200 and b.get("schema") is not None)
-
-    # 9. Resolve: MS-SQL
-    _test("Resolve: MS-SQL",
-          f"{base_url}/resolve/credit.exposures",
-          lambda s, b: s == 200 and b.get("source_type") == "mssql")
-
-    # 10. Resolve: Snowflake
-    _test("Resolve: Snowflake",
-          f"{base_url}/resolve/prices.equity/AAPL",
-          lambda s, b: s == 200 and b.get("source_type") == "snowflake")
-
-    # 11. Describe
-    _test("Describe",
-          f"{base_url}/describe/credit",
-          lambda s, b: s == 200 and "ownership" in (b or {}))
-
-    # 12. Lineage
-    _test("Lineage",
-          f"{base_url}/lineage/credit.exposures",
-          lambda s, b: s == 200 and "ownership" in (b or {}))
-
-    return results
+
+def _ok_rows(s, b):
+    return s == 200 and len(b.get("data", [])) > 0
+
+
+def _ok_data_list(s, b):
+    return s == 200 and isinstance(b.get("data"), list)
+
+
+def _ok_schema(s, b):
+    return s == 200 and b.get("schema") is not None
+
+
+def _ok_mssql(s, b):
+    return s == 200 and b.get("source_type") == "mssql"
+
+
+def _ok_snowflake(s, b):
+    return s == 200 and b.get("source_type") == "snowflake"
+
+
+def _ok_ownership(s, b):
+    return s == 200 and "ownership" in (b or {})
+
+
+# (name, path relative to the server root, check(status, body))
+SMOKE_TESTS: tuple[tuple[str, str, Callable[[int, Any], bool]], ...] = (
+    ("Health check", "/health", _ok_health),
+    ("Catalog stats", "/catalog/stats", _ok_stats),
+    ("Catalog search", "/catalog/search?q=credit", _ok_search),
+    ("Fetch: MS-SQL", "/fetch/credit.exposures?limit=5", _ok_rows),
+    ("Fetch: credit.limits", "/fetch/credit.limits?limit=5", _ok_rows),
+    ("Fetch: Excel", "/fetch/reports/regulatory/2026Q1/summary?limit=5", _ok_data_list),
+    ("Fetch: REST", "/fetch/commodities.derivatives/energy/CL?limit=5", _ok_data_list),
+    ("Metadata", "/metadata/credit.exposures", _ok_schema),
+    ("Resolve: MS-SQL", "/resolve/credit.exposures", _ok_mssql),
+    ("Resolve: Snowflake", "/resolve/prices.equity/AAPL", _ok_snowflake),
+    ("Describe", "/describe/credit", _ok_ownership),
+    ("Lineage", "/lineage/credit.exposures", _ok_ownership),
+)
+
+
+def _run_smoke_test(name: str, url: str, check: Callable[[int, Any], bool]) -> SmokeResult:
+    status, body = _get(url)
+    try:
+        return SmokeResult(name, check(status, body), f"HTTP {status}")
+    except Exception as exc:
+        return SmokeResult(name, False, str(exc))
+
+
+def run_smoke_tests(base_url: str) -> list[SmokeResult]:
+    """Hit key API endpoints concurrently and return pass/fail results in order."""
+    # Each check is an independent GET, so overlap the round-trips; results
+    # are collected in submission order to keep the summary stable.
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        futures = [
+            ex.submit(_run_smoke_test, name, base_url + path, check)
+            for name, path, check in SMOKE_TESTS
+        ]
+        return [f.result() for f in futures]
 
 # ---------------------------------------------------------------------------
 # Pretty-print summary
@@ -281,31 +381,33 @@ def print_summary(env: EnvironmentInfo) -> None:
     W = Fore.WHITE
     RED = Fore.RED
 
-    print()
-    print(f"{B}{C}{'=' * 63}{R}")
-    print(f"{B}{C}  MONIKER — Simulated Environment{R}")
-    print(f"{B}{C}{'=' * 63}{R}")
+    # Build the whole banner, then emit it with a single write
+    out: list[str] = []
+    out.append("")
+    out.append(f"{B}{C}{'=' * 63}{R}")
+    out.append(f"{B}{C}  MONIKER — Simulated Environment{R}")
+    out.append(f"{B}{C}{'=' * 63}{R}")
 
     # -- Data Inventory --
-    print(f"\n  {B}{W}DATA INVENTORY{R}")
-    print(f"  {'─' * 50}")
+    out.append(f"\n  {B}{W}DATA INVENTORY{R}")
+    out.append(f"  {'─' * 50}")
     total_rows = 0
     for a in env.adapters:
         unit = "tables" if a.engine == "SQLite" else ("feeds" if a.name == "REST" else "agencies")
         rows_label = f"~{a.rows:,} {'rows' if a.engine == 'SQLite' else ('items' if a.name == 'REST' else 'pools')}"
-        print(f"  {G}{a.name:<18}{R} ({a.engine})  {a.tables} {unit:<10} {rows_label:<16} {Style.DIM}{a.description}{R}")
+        out.append(f"  {G}{a.name:<18}{R} ({a.engine})  {a.tables} {unit:<10} {rows_label:<16} {Style.DIM}{a.description}{R}")
         total_rows += a.rows
-    print(f"  {'':18}               {'─' * 12}")
-    print(f"  {'':18}  Total        {B}{W}~{total_rows:,} rows{R}")
+    out.append(f"  {'':18}               {'─' * 12}")
+    out.append(f"  {'':18}  Total        {B}{W}~{total_rows:,} rows{R}")
 
     # -- Catalog --
-    print(f"\n  {B}{W}CATALOG{R}")
-    print(f"  {'─' * 50}")
-    print(f"  {env.catalog_monikers} monikers | {env.catalog_source_types} source types | {env.catalog_domains} domains")
+    out.append(f"\n  {B}{W}CATALOG{R}")
+    out.append(f"  {'─' * 50}")
+    out.append(f"  {env.catalog_monikers} monikers | {env.catalog_source_types} source types | {env.catalog_domains} domains")
 
     # -- Smoke Tests --
-    print(f"\n  {B}{W}SMOKE TESTS{R}")
-    print(f"  {'─' * 50}")
+    out.append(f"\n  {B}{W}SMOKE TESTS{R}")
+    out.append(f"  {'─' * 50}")
     passed = [r for r in env.smoke_results if r.passed]
     failed = [r for r in env.smoke_results if not r.passed]
 
@@ -317,33 +419,68 @@ def print_summary(env: EnvironmentInfo) -> None:
 
     for i in range(0, len(names), 3):
         row = names[i:i + 3]
-        print("  " + "   ".join(f"{n:<24}" for n in row))
+        out.append("  " + "   ".join(f"{n:<24}" for n in row))
 
     color = G if not failed else RED
-    print(f"  {color}{B}{len(passed)}/{len(env.smoke_results)} passed{R}")
+    out.append(f"  {color}{B}{len(passed)}/{len(env.smoke_results)} passed{R}")
 
     if failed:
-        print(f"\n  {RED}Failed:{R}")
+        out.append(f"\n  {RED}Failed:{R}")
         for r in failed:
-            print(f"    {RED}✗{R} {r.name}: {r.detail}")
+            out.append(f"    {RED}✗{R} {r.name}: {r.detail}")
 
     # -- Server --
     base = f"http://localhost:{env.port}"
-    print(f"\n  {B}{W}SERVER: {C}{base}{R}")
-    print(f"  {'─' * 50}")
-    print(f"  API docs:    {C}{base}/docs{R}")
-    print(f"  Health:      {C}{base}/health{R}")
-    print(f"  Catalog:     {C}{base}/catalog/stats{R}")
-    print()
+    out.append(f"\n  {B}{W}SERVER: {C}{base}{R}")
+    out.append(f"  {'─' * 50}")
+    out.append(f"  API docs:    {C}{base}/docs{R}")
+    out.append(f"  Health:      {C}{base}/health{R}")
+    out.append(f"  Catalog:     {C}{base}/catalog/stats{R}")
+    out.append("")
+
+    sys.stdout.write("\n".join(out) + "\n")
+    sys.stdout.flush()
 
 # ---------------------------------------------------------------------------
 # Orchestrator
 # ---------------------------------------------------------------------------
 
+def _domain_of(path: str) -> str:
+    """Top-level segment of a catalog path — everything before the first '.' or '/'."""
+    i = path.find(".")
+    j = path.find("/")
+    if i < 0:
+        return path if j < 0 else path[:j]
+    return path[:i] if j < 0 or i < j else path[:j]
+
+
+def _load_catalog_info(env: EnvironmentInfo, base_url: str) -> None:
+    """Fill the catalog counters on *env* from the running server."""
+    # Stats and the catalog listing, fetched concurrently
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        stats_future = ex.submit(_get, f"{base_url}/catalog/stats")
+        catalog_future = ex.submit(_get, f"{base_url}/catalog?limit=200")
+        status, stats = stats_future.result()
+        _, catalog_body = catalog_future.result()
+    if status == 200 and stats:
+        env.catalog_monikers = stats.get("total_monikers", 0)
+        env.catalog_source_types = len(stats.get("by_source_type", {}))
+        env.catalog_domains = len(stats.get("by_status", {}))
+        # Try to get domain count from the by_source_type keys or use a heuristic
+        # The "domains" count is best estimated from top-level catalog paths
+        if catalog_body and "paths" in catalog_body:
+            domains = {_domain_of(p) for p in catalog_body["paths"] if p}
+            env.catalog_domains = len(domains)
+
+
 def boot_environment(port: int = 8050) -> EnvironmentInfo:
     """Boot the full simulated environment. Importable from notebooks/scripts."""
     env = EnvironmentInfo(port=port)
 
+    # The server import/startup is independent of the data stores, so let it
+    # boot in the background while the adapters warm up.
+    server = start_server(port=port, wait=False)
+
     # 1. Warm adapters
     print(f"\n{Style.BRIGHT}{Fore.CYAN}[1/3]{Style.RESET_ALL} Warming data adapters …")
     env.adapters = warm_adapters()
@@ -353,26 +490,19 @@ def boot_environment(port: int = 8050) -> EnvironmentInfo:
 
     # 2. Start server
     print(f"\n{Style.BRIGHT}{Fore.CYAN}[2/3]{Style.RESET_ALL} Starting FastAPI server on port {port} …")
-    start_server(port=port)
+    server.wait()
     print(f"  {Fore.GREEN}✓{Style.RESET_ALL} Server healthy")
 
     # Grab catalog stats
     base_url = f"http://127.0.0.1:{port}"
-    status, stats = _get(f"{base_url}/catalog/stats")
-    if status == 200 and stats:
-        env.catalog_monikers = stats.get("total_monikers", 0)
-        env.catalog_source_types = len(stats.get("by_source_type", {}))
-        env.catalog_domains = len(stats.get("by_status", {}))
-        # Try to get domain count from the by_source_type keys or use a heuristic
-        # The "domains" count is best estimated from top-level catalog paths
-        _, catalog_body = _get(f"{base_url}/catalog?limit=200")
-        if catalog_body and "paths" in catalog_body:
-            domains = {p.split(".")[0].split("/")[0] for p in catalog_body["paths"] if p}
-            env.catalog_domains = len(domains)
+    _load_catalog_info(env, base_url)
 
     # 3. Smoke tests
     print(f"\n{Style.BRIGHT}{Fore.CYAN}[3/3]{Style.RESET_ALL} Running smoke tests …")
-    env.smoke_results = run_smoke_tests(base_url)
+    try:
+        env.smoke_results = run_smoke_tests(base_url)
+    finally:
+        close_connections()
     passed = sum(1 for r in env.smoke_results if r.passed)
     total = len(env.smoke_results)
     color = Fore.GREEN if passed == total else Fore.RED
@@ -394,6 +524,15 @@ def get_client(port: int = 8050):
 # CLI
 # ---------------------------------------------------------------------------
 
+def _block_forever() -> None:
+    """Park the main thread until Ctrl+C without periodic wakeups."""
+    if sys.platform == "win32":
+        # Lock waits aren't interruptible by Ctrl+C on Windows
+        while True:
+            time.sleep(3600)
+    threading.Event().wait()
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Boot the Moniker simulated environment",
@@ -417,8 +556,7 @@ def main():
     if args.server:
         print(f"  Ready for demo. Press Ctrl+C to stop.\n")
         try:
-            while True:
-                time.sleep(1)
+            _block_forever()
         except KeyboardInterrupt:
             print(f"\n{Fore.CYAN}Shutting down.{Style.RESET_ALL}")
     else:
@@ -9,10 +9,11 @@ Usage:
 """
 import argparse
 import os
+import socket
 import sys
 import subprocess
+import threading
 import time
-import webbrowser
 from pathlib import Path
 
 # Colors (fallback-safe)
@@ -25,6 +26,45 @@ except ImportError:
     class Style:
         RESET_ALL = BRIGHT = ""
 
+
+def _wait_port(port: int, timeout: float = 15.0, proc: subprocess.Popen | None = None) -> bool:
+    """Wait until 127.0.0.1:port accepts connections; False on timeout or if proc exits."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc is not None and proc.poll() is not None:
+            return False
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return True
+        except OSError:
+            time.sleep(0.05)
+    return False
+
+
+def _block_until(event: threading.Event) -> None:
+    """Park until *event* is set, staying responsive to Ctrl+C."""
+    if sys.platform == "win32":
+        # Lock waits aren't interruptible by Ctrl+C on Windows
+        while not event.wait(1.0):
+            pass
+    else:
+        event.wait()
+
+
+def _open_browser(url: str) -> None:
+    """Open *url* with the platform opener; fall back to the webbrowser module."""
+    try:
+        if sys.platform == "win32":
+            os.startfile(url)
+        elif sys.platform == "darwin":
+            subprocess.Popen(["open", url])
+        else:
+            subprocess.Popen(["xdg-open", url], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    except OSError:
+        import webbrowser
+        webbrowser.open(url)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Launch Moniker service + Jupyter")
     parser.add_argument("--port", type=int, default=8050, help="Service port (default: 8050)")
@@ -52,29 +92,20 @@ def main():
 
     # Start service using bring_up.py --server
     service_cmd = [sys.executable, str(client_root / "bring_up.py"), "--server", "--port", str(args.port)]
+    # Output goes straight to our terminal; readiness is the port accepting
+    # connections rather than a marker string in the child's log.
     service_proc = subprocess.Popen(
         service_cmd,
         env=env,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
         cwd=str(client_root),
-        text=True,
-        bufsize=1
     )
 
-    # Wait for service startup by reading output
-    startup_complete = False
-    for line in service_proc.stdout:
-        print(f"  {line.rstrip()}")
-        if "Ready for demo" in line or "SERVER:" in line:
-            startup_complete = True
-            break
-        if service_proc.poll() is not None:
-            print(f"{Fore.RED}✗ Service failed to start{Style.RESET_ALL}")
-            return 1
+    if not _wait_port(args.port, timeout=30.0, proc=service_proc):
+        print(f"{Fore.RED}✗ Service failed to start{Style.RESET_ALL}")
+        service_proc.terminate()
+        return 1
 
-    if startup_complete:
-        print(f"  {Fore.GREEN}✓ Service ready on http://localhost:{args.port}{Style.RESET_ALL}\n")
+    print(f"  {Fore.GREEN}✓ Service ready on http://localhost:{args.port}{Style.RESET_ALL}\n")
 
     print(f"{Style.BRIGHT}[2/2]{Style.RESET_ALL} Starting Jupyter notebook on port {args.jupyter_port}...")
 
@@ -97,15 +128,21 @@ def main():
         stderr=subprocess.DEVNULL
     )
 
-    # Give Jupyter a moment to start
-    time.sleep(2)
-    print(f"  {Fore.GREEN}✓ Jupyter ready on http://localhost:{args.jupyter_port}{Style.RESET_ALL}\n")
+    # Wait for Jupyter to accept connections before pointing a browser at it
+    if _wait_port(args.jupyter_port, timeout=10.0, proc=jupyter_proc):
+        print(f"  {Fore.GREEN}✓ Jupyter ready on http://localhost:{args.jupyter_port}{Style.RESET_ALL}\n")
+    elif jupyter_proc.poll() is not None:
+        print(f"{Fore.RED}✗ Jupyter failed to start{Style.RESET_ALL}")
+        service_proc.terminate()
+        return 1
+    else:
+        print(f"  {Fore.YELLOW}! Jupyter not answering on port {args.jupyter_port} yet{Style.RESET_ALL}\n")
 
     # Open browser to notebook
     notebook_url = f"http://localhost:{args.jupyter_port}/notebooks/practical_workflows.ipynb"
     if not args.no_browser:
         print(f"{Style.BRIGHT}Opening browser...{Style.RESET_ALL}")
-        webbrowser.open(notebook_url)
+        _open_browser(notebook_url)
 
     print(f"\n{Style.BRIGHT}{Fore.GREEN}✓ All services running{Style.RESET_ALL}")
     print(f"\n  {Style.BRIGHT}Service:{Style.RESET_ALL}  {Fore.CYAN}http://localhost:{args.port}{Style.RESET_ALL}")
@@ -113,17 +150,22 @@ def main():
     print(f"  {Style.BRIGHT}API Docs:{Style.RESET_ALL} {Fore.CYAN}http://localhost:{args.port}/docs{Style.RESET_ALL}")
     print(f"\n{Fore.YELLOW}Press Ctrl+C to stop all services{Style.RESET_ALL}\n")
 
-    # Keep running and monitor processes
+    # Keep running until a child exits or Ctrl+C — each watcher thread blocks
+    # in proc.wait(), so the launcher itself never wakes up while idle.
+    stopped = threading.Event()
+    exited: list[str] = []
+
+    def _watch(name: str, proc: subprocess.Popen) -> None:
+        proc.wait()
+        exited.append(name)
+        stopped.set()
+
+    for name, proc in (("Service", service_proc), ("Jupyter", jupyter_proc)):
+        threading.Thread(target=_watch, args=(name, proc), daemon=True).start()
+
     try:
-        while True:
-            time.sleep(1)
-            # Check if processes are still alive
-            if service_proc.poll() is not None:
-                print(f"\n{Fore.RED}✗ Service stopped unexpectedly{Style.RESET_ALL}")
-                break
-            if jupyter_proc.poll() is not None:
-                print(f"\n{Fore.RED}✗ Jupyter stopped unexpectedly{Style.RESET_ALL}")
-                break
+        _block_until(stopped)
+        print(f"\n{Fore.RED}✗ {exited[0]} stopped unexpectedly{Style.RESET_ALL}")
     except KeyboardInterrupt:
         print(f"\n\n{Fore.CYAN}Shutting down...{Style.RESET_ALL}")
         service_proc.terminate()
@@ -33,7 +33,13 @@ _adapters: dict[str, BaseAdapter] = {
 
 
 def get_adapter(source_type: str) -> BaseAdapter:
-    """Get an adapter for a source type."""
+    """
+    Get an adapter for a source type.
+
+    Adapters are shared instances created once at import, so this is a single
+    dict lookup. Callers should not cache the result; that way a later
+    register_adapter() replacement is picked up on the next read.
+    """
     adapter = _adapters.get(source_type)
     if adapter is None:
         raise ValueError(f"No adapter for source type: {source_type}")
@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
+from collections import namedtuple
 from dataclasses import dataclass, field
-from typing import Any, TYPE_CHECKING
+from functools import lru_cache
+from typing import Any, Iterator, Sequence, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..client import ResolvedSource
     from ..config import ClientConfig
 
 
-@dataclass
+@dataclass(slots=True)
 class AdapterResult:
     """
     Result from adapter fetch operations.
@@ -43,6 +46,77 @@ class AdapterResult:
     metadata: dict[str, Any] = field(default_factory=dict)
     """Additional metadata from the fetch operation."""
 
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Shallow dict view, ready for json/orjson encoding.
+
+        Unlike dataclasses.asdict(), the data payload is not deep-copied,
+        so this stays cheap for large result sets.
+        """
+        return {
+            "data": self.data,
+            "row_count": self.row_count,
+            "columns": self.columns,
+            "execution_time_ms": self.execution_time_ms,
+            "source_type": self.source_type,
+            "query_executed": self.query_executed,
+            "truncated": self.truncated,
+            "metadata": self.metadata,
+        }
+
+
+def rows_to_columns(columns: Sequence[str], rows: list[Any]) -> dict[str, list[Any]]:
+    """
+    Transpose fetched rows into column-oriented output.
+
+    Returns {column: [values...]} - one list per column instead of one
+    dict per row, which is far lighter for large result sets.
+    """
+    if not rows:
+        return {col: [] for col in columns}
+    return {col: list(values) for col, values in zip(columns, zip(*rows))}
+
+
+def rows_to_arrow(columns: Sequence[str], rows: list[Any]) -> Any:
+    """Transpose fetched rows into a pyarrow.Table."""
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise ImportError("pyarrow required for arrow output: pip install pyarrow")
+    return pa.table(rows_to_columns(columns, rows))
+
+
+@lru_cache(maxsize=128)
+def _row_type(columns: tuple[str, ...]) -> type:
+    """Row namedtuple for a column set; invalid field names are renamed _0, _1..."""
+    return namedtuple("Row", columns, rename=True)
+
+
+def rows_to_records(columns: Sequence[str], rows: list[Any]) -> list[tuple]:
+    """
+    Materialize fetched rows as namedtuples.
+
+    All rows share one class holding the field names, instead of every row
+    carrying its own dict of keys. Use row._asdict() where a dict is needed.
+    """
+    row_type = _row_type(tuple(columns))
+    return [row_type._make(row) for row in rows]
+
+
+def iter_row_dicts(cursor: Any, columns: list[str]) -> Iterator[dict[str, Any]]:
+    """
+    Stream rows as dicts, one cursor.arraysize batch per round-trip.
+
+    Only one batch is held in memory at a time. The cursor is closed once
+    the iterator is exhausted or discarded.
+    """
+    try:
+        while batch := cursor.fetchmany():
+            for row in batch:
+                yield dict(zip(columns, row))
+    finally:
+        cursor.close()
+
 
 class BaseAdapter(ABC):
     """
@@ -52,6 +126,11 @@ class BaseAdapter(ABC):
     and fetches the data.
     """
 
+    # Whether fetch() may run on several threads at once. Adapters that
+    # share a connection between calls set this to False, and batch_read()
+    # then runs their fetches one after another.
+    thread_safe: bool = True
+
     @abstractmethod
     def fetch(
         self,
@@ -72,6 +151,44 @@ class BaseAdapter(ABC):
         """
         ...
 
+    async def afetch(
+        self,
+        resolved: ResolvedSource,
+        config: ClientConfig,
+        **kwargs,
+    ) -> Any:
+        """
+        Async variant of fetch().
+
+        Default runs the blocking fetch() in the default thread pool so it
+        does not stall the event loop. Adapters with a native async client
+        should override this.
+        """
+        return await asyncio.to_thread(self.fetch, resolved, config, **kwargs)
+
+    def fetch_many(
+        self,
+        resolved_list: list[ResolvedSource],
+        config: ClientConfig,
+        **kwargs,
+    ) -> list[Any]:
+        """
+        Fetch data for several resolved sources.
+
+        Default calls fetch() once per source. Adapters that can coalesce
+        requests (one SQL query with IN (...), one batch HTTP call) should
+        override this to turn N round-trips into one.
+
+        Args:
+            resolved_list: Resolved sources to fetch
+            config: Client configuration (includes credentials)
+            **kwargs: Additional adapter-specific parameters
+
+        Returns:
+            List of fetch results, aligned by index with resolved_list
+        """
+        return [self.fetch(resolved, config, **kwargs) for resolved in resolved_list]
+
     def list_children(
         self,
         resolved: ResolvedSource,
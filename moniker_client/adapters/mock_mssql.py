@@ -5,8 +5,10 @@ Uses SQLite in-memory to simulate SQL Server responses.
 
 from __future__ import annotations
 
+import logging
 import sqlite3
 from datetime import date, timedelta
+from functools import lru_cache
 from typing import Any, TYPE_CHECKING
 import random
 import re
@@ -15,7 +17,9 @@ if TYPE_CHECKING:
     from ..client import ResolvedSource
     from ..config import ClientConfig
 
-from .base import BaseAdapter
+from .base import BaseAdapter, rows_to_arrow, rows_to_columns, rows_to_records
+
+logger = logging.getLogger(__name__)
 
 
 # Sample data configuration
@@ -41,6 +45,219 @@ PRODUCTS = [
     ("PROD-006", "Analytics Suite", "Software", 499.99),
 ]
 
+_ORDER_COUNT = 200
+
+# Compiled statements kept per connection by the sqlite3 module (default 128).
+# Translated queries come from the _translate LRU, so repeats hit this cache.
+_STATEMENT_CACHE_SIZE = 512
+
+# Read-side tuning for the adapter connection: in-memory temp tables, no
+# rollback journal (the demo data is never written after seeding)
+_CONNECTION_PRAGMAS = (
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA journal_mode=OFF",
+)
+
+
+# T-SQL -> SQLite translation, as one compiled alternation so the query is
+# scanned once. Function arguments are matched paren-aware (two levels of
+# nesting) and translated recursively, e.g. DATEADD(MONTH, -3, GETDATE()).
+_EXPR = r"(?:[^()]|\((?:[^()]|\([^()]*\))*\))+?"
+
+_TSQL_PATTERN = re.compile(
+    "|".join([
+        # dbo.employees -> dbo_employees (case-sensitive, like the schema)
+        r"(?P<dbo>(?-i:\bdbo\.))",
+        # GETDATE() -> date('now')
+        r"(?P<getdate>\bGETDATE\s*\(\s*\))",
+        # CAST(expr AS DATE) -> date(expr)
+        rf"(?P<cast>\bCAST\s*\(\s*(?P<cast_expr>{_EXPR})\s+AS\s+DATE\s*\))",
+        # CONVERT(DATE, 'YYYYMMDD', 112) -> date literal
+        r"(?P<convert>\bCONVERT\s*\(\s*DATE\s*,\s*'(?P<convert_ymd>\d{8})'\s*,\s*112\s*\))",
+        # DATEADD(unit, -N, expr) -> date(expr, 'N unit')
+        rf"(?P<dateadd>\bDATEADD\s*\(\s*(?P<dateadd_unit>\w+)\s*,\s*(?P<dateadd_n>-?\d+)\s*,"
+        rf"\s*(?P<dateadd_expr>{_EXPR})\s*\))",
+        # ISNULL -> COALESCE
+        r"(?P<isnull>\bISNULL\s*\()",
+    ]),
+    re.IGNORECASE,
+)
+
+_DATEADD_UNITS = {"YEAR": "years", "MONTH": "months", "WEEK": "days", "DAY": "days"}
+
+
+def _dateadd_to_sqlite(unit: str, offset: str, expr: str) -> str:
+    """DATEADD(unit, N, expr) -> date(expr, 'N unit')."""
+    unit = unit.upper()
+    sqlite_unit = _DATEADD_UNITS.get(unit, "days")
+    val = int(offset)
+    if unit == "WEEK":
+        val = val * 7
+    return f"date({expr}, '{val} {sqlite_unit}')"
+
+
+def _translate_match(m: re.Match) -> str:
+    kind = m.lastgroup
+    if kind == "dbo":
+        return "dbo_"
+    if kind == "getdate":
+        return "date('now')"
+    if kind == "cast":
+        return f"date({_translate_tsql(m.group('cast_expr'))})"
+    if kind == "convert":
+        d = m.group("convert_ymd")
+        return f"'{d[:4]}-{d[4:6]}-{d[6:8]}'"
+    if kind == "dateadd":
+        return _dateadd_to_sqlite(
+            m.group("dateadd_unit"),
+            m.group("dateadd_n"),
+            _translate_tsql(m.group("dateadd_expr").strip()),
+        )
+    return "COALESCE("
+
+
+def _translate_tsql(query: str) -> str:
+    """Translate MS-SQL T-SQL syntax to SQLite in a single pass."""
+    return _TSQL_PATTERN.sub(_translate_match, query)
+
+
+# Keyed on the exact query text, so a repeat is one dict lookup returning the
+# finished SQL. Literals are not templated out: CONVERT/DATEADD translation
+# depends on them.
+@lru_cache(maxsize=256)
+def _translate(query: str) -> str:
+    """Cached translation - the same monikers produce the same SQL on every fetch."""
+    return _translate_tsql(query)
+
+
+# Upper-cased result column names per translated query. The mock schema never
+# changes after seeding, so a query's columns are fixed.
+_COLUMNS_CACHE: dict[str, tuple[str, ...]] = {}
+_COLUMNS_CACHE_SIZE = 256
+
+
+def _column_names(sqlite_query: str, description: Any) -> tuple[str, ...]:
+    """Column names for a query, computed from cursor.description once."""
+    columns = _COLUMNS_CACHE.get(sqlite_query)
+    if columns is None:
+        if len(_COLUMNS_CACHE) >= _COLUMNS_CACHE_SIZE:
+            _COLUMNS_CACHE.clear()
+        columns = _COLUMNS_CACHE[sqlite_query] = tuple(desc[0].upper() for desc in description)
+    return columns
+
+
+# Host parameters per statement on older SQLite builds (SQLITE_MAX_VARIABLE_NUMBER)
+_MAX_SQL_VARIABLES = 999
+
+_SEED_PRAGMAS = (
+    "PRAGMA journal_mode=MEMORY",
+    "PRAGMA synchronous=OFF",
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+def _insert_rows(
+    conn: sqlite3.Connection, table: str, columns: tuple[str, ...], rows: list[tuple]
+) -> None:
+    """Insert rows with multi-row VALUES statements instead of one per row."""
+    placeholder = "(" + ", ".join("?" * len(columns)) + ")"
+    batch = _MAX_SQL_VARIABLES // len(columns)
+    for start in range(0, len(rows), batch):
+        chunk = rows[start:start + batch]
+        conn.execute(
+            f"INSERT INTO {table} ({', '.join(columns)}) VALUES "
+            + ", ".join([placeholder] * len(chunk)),
+            [value for row in chunk for value in row],
+        )
+
+
+def _build_sample_db() -> sqlite3.Connection:
+    """Create the in-memory SQLite template database with sample data."""
+    # Autocommit mode so the explicit BEGIN/COMMIT below is the only transaction
+    conn = sqlite3.connect(":memory:", check_same_thread=False, isolation_level=None)
+    for pragma in _SEED_PRAGMAS:
+        conn.execute(pragma)
+    conn.execute("BEGIN")
+
+    # Create employees table
+    conn.execute("""
+        CREATE TABLE dbo_employees (
+            employee_id INTEGER PRIMARY KEY,
+            full_name TEXT,
+            department TEXT,
+            title TEXT,
+            hire_date TEXT,
+            salary REAL,
+            is_active INTEGER
+        )
+    """)
+
+    # Create orders table
+    conn.execute("""
+        CREATE TABLE dbo_orders (
+            order_id INTEGER PRIMARY KEY,
+            product_code TEXT,
+            product_name TEXT,
+            category TEXT,
+            quantity INTEGER,
+            unit_price REAL,
+            order_date TEXT,
+            customer_region TEXT
+        )
+    """)
+
+    # Generate employee data
+    rng = random.Random(42)
+    randint, uniform, choice = rng.randint, rng.uniform, rng.choice
+    base_date = date(2020, 1, 15)
+    emp_rows = []
+    for i, (name, dept, title) in enumerate(EMPLOYEES, start=1):
+        hire_date = base_date + timedelta(days=randint(0, 1000))
+        salary = uniform(60000, 180000)
+        emp_rows.append((
+            i, name, dept, title,
+            hire_date.strftime("%Y-%m-%d"),
+            round(salary, 2),
+            1,
+        ))
+
+    _insert_rows(conn, "dbo_employees", (
+        "employee_id", "full_name", "department", "title",
+        "hire_date", "salary", "is_active",
+    ), emp_rows)
+
+    # Generate order data
+    regions = ["East", "West", "Central", "South"]
+    order_rows = []
+    order_base = date(2024, 1, 1)
+    for order_id in range(1, _ORDER_COUNT + 1):
+        prod = choice(PRODUCTS)
+        order_date = order_base + timedelta(days=randint(0, 365))
+        qty = randint(1, 50)
+        order_rows.append((
+            order_id,
+            prod[0],
+            prod[1],
+            prod[2],
+            qty,
+            prod[3],
+            order_date.strftime("%Y-%m-%d"),
+            choice(regions),
+        ))
+
+    _insert_rows(conn, "dbo_orders", (
+        "order_id", "product_code", "product_name", "category", "quantity",
+        "unit_price", "order_date", "customer_region",
+    ), order_rows)
+
+    conn.execute("COMMIT")
+    return conn
+
+
+# Generated once per process; adapters clone it with the sqlite backup API,
+# which copies pages instead of replaying the DDL and inserts.
+_TEMPLATE_DB = _build_sample_db()
+
 
 class MockMSSQLAdapter(BaseAdapter):
     """
@@ -51,6 +268,8 @@ class MockMSSQLAdapter(BaseAdapter):
     """
 
     _db: sqlite3.Connection | None = None
+    # Every fetch shares the one sqlite connection
+    thread_safe = False
 
     def __init__(self):
         self._ensure_db()
@@ -62,140 +281,24 @@ class MockMSSQLAdapter(BaseAdapter):
         return MockMSSQLAdapter._db
 
     def _create_mock_db(self) -> sqlite3.Connection:
-        """Create an in-memory SQLite database with sample data."""
-        conn = sqlite3.connect(":memory:", check_same_thread=False)
+        """Create an in-memory SQLite database as a page copy of the seeded template."""
+        conn = sqlite3.connect(
+            ":memory:",
+            check_same_thread=False,
+            cached_statements=_STATEMENT_CACHE_SIZE,
+        )
+        _TEMPLATE_DB.backup(conn)
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
         conn.row_factory = sqlite3.Row
-
-        # Create employees table
-        conn.execute("""
-            CREATE TABLE dbo_employees (
-                employee_id INTEGER PRIMARY KEY,
-                full_name TEXT,
-                department TEXT,
-                title TEXT,
-                hire_date TEXT,
-                salary REAL,
-                is_active INTEGER
-            )
-        """)
-
-        # Create orders table
-        conn.execute("""
-            CREATE TABLE dbo_orders (
-                order_id INTEGER PRIMARY KEY,
-                product_code TEXT,
-                product_name TEXT,
-                category TEXT,
-                quantity INTEGER,
-                unit_price REAL,
-                order_date TEXT,
-                customer_region TEXT
-            )
-        """)
-
-        # Generate employee data
-        random.seed(42)
-        base_date = date(2020, 1, 15)
-        emp_rows = []
-        for i, (name, dept, title) in enumerate(EMPLOYEES, start=1):
-            hire_date = base_date + timedelta(days=random.randint(0, 1000))
-            salary = random.uniform(60000, 180000)
-            emp_rows.append((
-                i, name, dept, title,
-                hire_date.strftime("%Y-%m-%d"),
-                round(salary, 2),
-                1,
-            ))
-
-        conn.executemany("""
-            INSERT INTO dbo_employees
-            (employee_id, full_name, department, title, hire_date, salary, is_active)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, emp_rows)
-
-        # Generate order data
-        regions = ["East", "West", "Central", "South"]
-        order_rows = []
-        order_base = date(2024, 1, 1)
-        for order_id in range(1, 201):
-            prod = random.choice(PRODUCTS)
-            order_date = order_base + timedelta(days=random.randint(0, 365))
-            qty = random.randint(1, 50)
-            order_rows.append((
-                order_id,
-                prod[0],
-                prod[1],
-                prod[2],
-                qty,
-                prod[3],
-                order_date.strftime("%Y-%m-%d"),
-                random.choice(regions),
-            ))
-
-        conn.executemany("""
-            INSERT INTO dbo_orders
-            (order_id, product_code, product_name, category, quantity,
-             unit_price, order_date, customer_region)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, order_rows)
-
-        conn.commit()
-        print(f"[MockMSSQL] Initialized with {len(emp_rows)} employees, {len(order_rows)} orders")
+        logger.info(
+            "Mock MS-SQL initialized with %d employees, %d orders", len(EMPLOYEES), _ORDER_COUNT
+        )
         return conn
 
     def _translate_mssql_to_sqlite(self, query: str) -> str:
         """Translate MS-SQL T-SQL syntax to SQLite."""
-        translated = query
-
-        # Remove dbo. prefix (e.g., dbo.employees -> dbo_employees)
-        translated = re.sub(r"\bdbo\.", "dbo_", translated)
-
-        # Handle GETDATE() -> date('now')
-        translated = re.sub(r"\bGETDATE\s*\(\s*\)", "date('now')", translated, flags=re.IGNORECASE)
-
-        # Handle CAST(expr AS DATE) -> date(expr)
-        translated = re.sub(
-            r"\bCAST\s*\(\s*(.+?)\s+AS\s+DATE\s*\)",
-            r"date(\1)",
-            translated,
-            flags=re.IGNORECASE,
-        )
-
-        # Handle CONVERT(DATE, 'YYYYMMDD', 112) -> date literal
-        translated = re.sub(
-            r"\bCONVERT\s*\(\s*DATE\s*,\s*'(\d{8})'\s*,\s*112\s*\)",
-            lambda m: f"'{m.group(1)[:4]}-{m.group(1)[4:6]}-{m.group(1)[6:8]}'",
-            translated,
-            flags=re.IGNORECASE,
-        )
-
-        # Handle DATEADD(unit, -N, expr) -> date(expr, 'N unit')
-        def _dateadd_to_sqlite(m):
-            unit = m.group(1).upper()
-            offset = m.group(2).strip()
-            expr = m.group(3).strip()
-            unit_map = {"YEAR": "years", "MONTH": "months", "WEEK": "days", "DAY": "days"}
-            sqlite_unit = unit_map.get(unit, "days")
-            # Parse the offset (e.g., -3)
-            try:
-                val = int(offset)
-            except ValueError:
-                val = offset
-            if unit == "WEEK" and isinstance(val, int):
-                val = val * 7
-            return f"date({expr}, '{val} {sqlite_unit}')"
-
-        translated = re.sub(
-            r"\bDATEADD\s*\(\s*(\w+)\s*,\s*(-?\d+)\s*,\s*(.+?)\s*\)",
-            _dateadd_to_sqlite,
-            translated,
-            flags=re.IGNORECASE,
-        )
-
-        # Handle ISNULL -> COALESCE
-        translated = re.sub(r"\bISNULL\s*\(", "COALESCE(", translated, flags=re.IGNORECASE)
-
-        return translated
+        return _translate(query)
 
     def fetch(
         self,
@@ -209,24 +312,30 @@ class MockMSSQLAdapter(BaseAdapter):
             raise ValueError("No query provided for MS-SQL source")
 
         # Translate T-SQL syntax to SQLite
-        sqlite_query = self._translate_mssql_to_sqlite(query)
+        sqlite_query = _translate(query)
 
         db = self._ensure_db()
         cursor = db.cursor()
 
         try:
             cursor.execute(sqlite_query)
-            columns = [desc[0].upper() for desc in cursor.description]
+            columns = _column_names(sqlite_query, cursor.description)
             rows = cursor.fetchall()
 
-            # Convert to list of dicts
-            result = [dict(zip(columns, tuple(row))) for row in rows]
-            print(f"[MockMSSQL] Query returned {len(result)} rows")
-            return result
+            logger.debug("Mock MS-SQL query returned %d rows", len(rows))
+
+            # Convert to list of dicts by default; columnar gives {column: [values]},
+            # arrow a pyarrow.Table, namedtuples rows sharing one set of field names
+            if kwargs.get("columnar"):
+                return rows_to_columns(columns, rows)
+            if kwargs.get("arrow"):
+                return rows_to_arrow(columns, rows)
+            if kwargs.get("namedtuples"):
+                return rows_to_records(columns, rows)
+            return [dict(zip(columns, tuple(row))) for row in rows]
 
         except Exception as e:
-            print(f"[MockMSSQL] Query error: {e}")
-            print(f"[MockMSSQL] Query was: {sqlite_query[:200]}...")
+            logger.error("Mock MS-SQL query error: %s; query was: %.200s...", e, sqlite_query)
             raise
 
     def list_children(
@@ -249,4 +358,4 @@ def enable_mock_mssql():
     """
     from . import register_adapter
     register_adapter("mssql", MockMSSQLAdapter())
-    print("[MockMSSQL] Mock MS-SQL adapter enabled")
+    logger.info("Mock MS-SQL adapter enabled")
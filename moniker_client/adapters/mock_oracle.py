@@ -58,6 +58,8 @@ class MockOracleAdapter(BaseAdapter):
     """
 
     _db: sqlite3.Connection | None = None
+    # Every fetch shares the one sqlite connection
+    thread_safe = False
 
     def __init__(self):
         self._ensure_db()
@@ -2,13 +2,61 @@
 
 from __future__ import annotations
 
-from typing import Any, TYPE_CHECKING
+import threading
+import weakref
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Iterator, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..client import ResolvedSource
     from ..config import ClientConfig
 
-from .base import BaseAdapter
+from .base import (
+    BaseAdapter,
+    iter_row_dicts,
+    rows_to_arrow,
+    rows_to_columns,
+    rows_to_records,
+)
+
+# Rows per fetchmany() call when streaming
+_DEFAULT_ARRAYSIZE = 1000
+
+# Prepared cursors kept per thread before the oldest is evicted
+_MAX_PREPARED = 128
+
+
+@lru_cache(maxsize=32)
+def _build_conn_str(server: str, port: int, database: str | None, driver: str, user: str) -> str:
+    """
+    Connection string without the password.
+
+    Also serves as the connection cache key; callers append PWD so the
+    password never lands in the cache.
+    """
+    return (
+        f"DRIVER={{{driver}}};"
+        f"SERVER={server},{port};"
+        f"DATABASE={database};"
+        f"UID={user};"
+    )
+
+
+def _stream_rows(conn: Any, cursor: Any, columns: list[str]) -> Iterator[dict[str, Any]]:
+    """Stream rows as dicts, closing the connection when done."""
+    try:
+        yield from iter_row_dicts(cursor, columns)
+    finally:
+        conn.close()
+
+
+class _ThreadConnections:
+    """One thread's cached connections and prepared cursors."""
+
+    def __init__(self):
+        self.connections: dict[str, Any] = {}
+        self.prepared: OrderedDict[tuple[int, str], Any] = OrderedDict()
 
 
 class MSSQLAdapter(BaseAdapter):
@@ -17,8 +65,26 @@ class MSSQLAdapter(BaseAdapter):
 
     Credentials come from ClientConfig (environment variables).
     Requires pyodbc and an appropriate ODBC driver.
+    Connections are cached within the adapter instance, one set per
+    thread: pyodbc connections and cursors must not be shared between
+    threads (pyodbc.threadsafety is 1).
     """
 
+    def __init__(self):
+        self._local = threading.local()
+        # Every thread's cache, so close_connections() can reach them all
+        self._all_threads: weakref.WeakSet[_ThreadConnections] = weakref.WeakSet()
+        self._all_threads_lock = threading.Lock()
+
+    def _thread_connections(self) -> _ThreadConnections:
+        """Connection cache of the calling thread."""
+        state = getattr(self._local, "state", None)
+        if state is None:
+            state = self._local.state = _ThreadConnections()
+            with self._all_threads_lock:
+                self._all_threads.add(state)
+        return state
+
     def fetch(
         self,
         resolved: ResolvedSource,
@@ -32,7 +98,7 @@ class MSSQLAdapter(BaseAdapter):
 
         conn_info = resolved.connection
 
-        # Build connection string
+        # Connection details
         server = conn_info.get("server", "localhost")
         port = conn_info.get("port", 1433)
         database = conn_info.get("database")
@@ -48,31 +114,115 @@ class MSSQLAdapter(BaseAdapter):
                 "Set MSSQL_USER and MSSQL_PASSWORD environment variables."
             )
 
-        conn_str = (
-            f"DRIVER={{{driver}}};"
-            f"SERVER={server},{port};"
-            f"DATABASE={database};"
-            f"UID={user};"
-            f"PWD={password}"
-        )
+        conn_key = _build_conn_str(server, port, database, driver, user)
 
         # Execute query
         query = resolved.query
         if not query:
             raise ValueError("No query provided for MS-SQL source")
 
-        conn = pyodbc.connect(conn_str)
+        conn_str = conn_key + f"PWD={password}"
+        # Positional values for ? placeholders in the query
+        binds = kwargs.get("binds") or ()
+
+        # Lazily yield dicts batch by batch instead of materializing the result.
+        # A live result set keeps the connection busy, so the stream gets its
+        # own connection and the generator closes it.
+        if kwargs.get("stream"):
+            conn = pyodbc.connect(conn_str)
+            try:
+                cursor = conn.cursor()
+                cursor.arraysize = int(kwargs.get("arraysize", _DEFAULT_ARRAYSIZE))
+                cursor.execute(query, *binds)
+                columns = [desc[0] for desc in cursor.description]
+            except Exception:
+                conn.close()
+                raise
+            return _stream_rows(conn, cursor, columns)
+
+        conn = self._get_connection(conn_str, conn_key, pyodbc)
         try:
-            cursor = conn.cursor()
-            cursor.execute(query)
+            cursor = self._prepared_cursor(conn, query)
+            cursor.execute(query, *binds)
             columns = [desc[0] for desc in cursor.description]
             rows = cursor.fetchall()
-            cursor.close()
+        except Exception:
+            # Best effort: on a dead connection rollback fails too, and the
+            # query error is the one worth reporting
+            try:
+                conn.rollback()
+            except Exception:
+                pass
+            raise
+        # Nothing from a fetch is ever committed on the cached connection
+        conn.rollback()
 
-            # Convert to list of dicts
-            return [dict(zip(columns, row)) for row in rows]
-        finally:
-            conn.close()
+        # Convert to list of dicts by default; columnar gives {column: [values]},
+        # arrow a pyarrow.Table, namedtuples rows sharing one set of field names
+        if kwargs.get("columnar"):
+            return rows_to_columns(columns, rows)
+        if kwargs.get("arrow"):
+            return rows_to_arrow(columns, rows)
+        if kwargs.get("namedtuples"):
+            return rows_to_records(columns, rows)
+        return [dict(zip(columns, row)) for row in rows]
+
+    def _get_connection(self, conn_str: str, cache_key: str, pyodbc: Any) -> Any:
+        """Get this thread's cached connection or create new one."""
+        state = self._thread_connections()
+        if cache_key in state.connections:
+            conn = state.connections[cache_key]
+            # Verify connection is still valid
+            try:
+                conn.execute("SELECT 1").fetchone()
+                return conn
+            except Exception:
+                # Connection is stale, remove it and its prepared cursors
+                del state.connections[cache_key]
+                for key in [k for k in state.prepared if k[0] == id(conn)]:
+                    del state.prepared[key]
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+
+        # Create new connection
+        conn = pyodbc.connect(conn_str)
+        state.connections[cache_key] = conn
+        return conn
+
+    def _prepared_cursor(self, conn: Any, query: str) -> Any:
+        """
+        Get the cursor last used for this SQL text on this connection.
+
+        pyodbc keeps the statement prepared while a cursor re-executes the
+        same SQL, so repeated fetches skip the server-side prepare.
+        """
+        prepared = self._thread_connections().prepared
+        key = (id(conn), query)
+        cursor = prepared.get(key)
+        if cursor is None:
+            if len(prepared) >= _MAX_PREPARED:
+                _, oldest = prepared.popitem(last=False)
+                try:
+                    oldest.close()
+                except Exception:
+                    pass
+            cursor = prepared[key] = conn.cursor()
+        return cursor
+
+    def close_connections(self) -> None:
+        """Close all cached connections, across every thread."""
+        with self._all_threads_lock:
+            states = list(self._all_threads)
+        for state in states:
+            state.prepared.clear()
+            for conn in list(state.connections.values()):
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+            state.connections.clear()
 
     def list_children(
         self,
@@ -97,16 +247,10 @@ class MSSQLAdapter(BaseAdapter):
         database = conn_info.get("database")
         driver = conn_info.get("driver", "ODBC Driver 18 for SQL Server")
 
-        conn_str = (
-            f"DRIVER={{{driver}}};"
-            f"SERVER={server},{port};"
-            f"DATABASE={database};"
-            f"UID={user};"
-            f"PWD={password}"
-        )
+        conn_key = _build_conn_str(server, port, database, driver, user)
 
         try:
-            conn = pyodbc.connect(conn_str)
+            conn = self._get_connection(conn_key + f"PWD={password}", conn_key, pyodbc)
             cursor = conn.cursor()
             cursor.execute(
                 "SELECT TABLE_NAME FROM INFORMATION_SCHEMA.TABLES "
@@ -114,7 +258,7 @@ class MSSQLAdapter(BaseAdapter):
             )
             tables = [row[0] for row in cursor.fetchall()]
             cursor.close()
-            conn.close()
+            conn.rollback()
             return tables
         except Exception:
             return []
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 import time
 from typing import Any, TYPE_CHECKING
 
@@ -9,7 +10,14 @@ if TYPE_CHECKING:
     from ..client import ResolvedSource
     from ..config import ClientConfig
 
-from .base import BaseAdapter, AdapterResult
+from .base import (
+    BaseAdapter,
+    AdapterResult,
+    iter_row_dicts,
+    rows_to_arrow,
+    rows_to_columns,
+    rows_to_records,
+)
 
 
 # Reserved parameter keys that should not be used as WHERE filters
@@ -24,8 +32,62 @@ _RESERVED_PARAMS = frozenset({
     "response_path",
     "query_params",
     "moniker_params",
+    "arraysize",
 })
 
+# Rows per network round-trip; oracledb defaults to 100
+_DEFAULT_ARRAYSIZE = 5000
+
+# Clause boundaries used when splicing generated SQL into a query
+_SQL_MARKERS = re.compile(
+    r" (FROM|WHERE|GROUP|ORDER|HAVING|UNION)(?= )|(;)|(FETCH) ",
+    re.IGNORECASE,
+)
+
+# Markers that end the FROM table reference / the WHERE clause
+_FROM_END = ("WHERE", "GROUP", "ORDER", "HAVING", "UNION", ";")
+_WHERE_END = ("GROUP", "ORDER", "HAVING", "UNION", ";")
+
+
+def _scan_sql(query: str) -> dict[str, list[int]]:
+    """
+    Locate clause markers in one pass.
+
+    Returns {marker: [positions]} with upper-cased keyword keys (plus ";"),
+    positions ascending. Keyword positions point at the leading space.
+    """
+    scan: dict[str, list[int]] = {}
+    for m in _SQL_MARKERS.finditer(query):
+        idx = m.lastindex
+        scan.setdefault(m.group(idx).upper(), []).append(m.start(idx) - (idx == 1))
+    return scan
+
+
+def _first_marker(scan: dict[str, list[int]], markers: tuple[str, ...], start: int = 0) -> int | None:
+    """Position of the earliest of markers at or after start, if any."""
+    first = None
+    for marker in markers:
+        for pos in scan.get(marker, ()):
+            if pos >= start:
+                if first is None or pos < first:
+                    first = pos
+                break
+    return first
+
+
+def _apply_splices(query: str, splices: list[tuple[int, str]]) -> str:
+    """Insert (position, text) pairs into query with a single join."""
+    if not splices:
+        return query
+    parts = []
+    prev = 0
+    for pos, text in sorted(splices, key=lambda splice: splice[0]):
+        parts.append(query[prev:pos])
+        parts.append(text)
+        prev = pos
+    parts.append(query[prev:])
+    return "".join(parts)
+
 
 class OracleAdapter(BaseAdapter):
     """
@@ -40,6 +102,9 @@ class OracleAdapter(BaseAdapter):
     - Improved error handling
     """
 
+    # The cached connection is shared by every fetch
+    thread_safe = False
+
     def __init__(self):
         self._connection_cache: dict[str, Any] = {}
 
@@ -71,8 +136,8 @@ class OracleAdapter(BaseAdapter):
                 "Set ORACLE_USER and ORACLE_PASSWORD environment variables."
             )
 
-        # Build query with temporal and filter support
-        query = self._build_query(resolved)
+        # Build query with temporal and filter support; filter values are binds
+        query, binds = self._build_query(resolved)
         if not query:
             raise ValueError("No query provided for Oracle source")
 
@@ -81,13 +146,30 @@ class OracleAdapter(BaseAdapter):
 
         try:
             cursor = conn.cursor()
-            cursor.execute(query)
+            cursor.arraysize = int(params.get("arraysize", _DEFAULT_ARRAYSIZE))
+            cursor.execute(query, binds)
             columns = [desc[0] for desc in cursor.description]
-            rows = cursor.fetchall()
-            cursor.close()
 
-            # Convert to list of dicts
-            data = [dict(zip(columns, row)) for row in rows]
+            # Lazily yield dicts batch by batch instead of materializing the result
+            if kwargs.get("stream"):
+                return iter_row_dicts(cursor, columns)
+
+            if kwargs.get("columnar") or kwargs.get("arrow") or kwargs.get("namedtuples"):
+                rows = cursor.fetchall()
+                # Columnar gives {column: [values]}, arrow a pyarrow.Table,
+                # namedtuples rows sharing one set of field names
+                if kwargs.get("columnar"):
+                    data = rows_to_columns(columns, rows)
+                elif kwargs.get("arrow"):
+                    data = rows_to_arrow(columns, rows)
+                else:
+                    data = rows_to_records(columns, rows)
+            else:
+                # Default list of dicts: the driver boxes each row as a dict while
+                # fetching, so there is no second pass over a list of tuples
+                cursor.rowfactory = lambda *row: dict(zip(columns, row))
+                data = rows = cursor.fetchall()
+            cursor.close()
 
             execution_time = (time.perf_counter() - start_time) * 1000
 
@@ -95,11 +177,12 @@ class OracleAdapter(BaseAdapter):
             if kwargs.get("return_result"):
                 return AdapterResult(
                     data=data,
-                    row_count=len(data),
+                    row_count=len(rows),
                     columns=columns,
                     execution_time_ms=execution_time,
                     source_type="oracle",
                     query_executed=query,
+                    metadata={"binds": binds},
                 )
 
             return data
@@ -141,38 +224,60 @@ class OracleAdapter(BaseAdapter):
 
         raise ValueError("Oracle DSN or host/port/service_name required")
 
-    def _build_query(self, resolved: ResolvedSource) -> str | None:
-        """Build query with temporal and filter support."""
+    def _build_query(self, resolved: ResolvedSource) -> tuple[str | None, dict[str, Any]]:
+        """
+        Build query with temporal and filter support.
+
+        Returns (query, binds). Filter values are passed as bind variables,
+        so the SQL text stays the same across values and Oracle reuses the
+        parsed cursor instead of hard-parsing every variant.
+        """
         query = resolved.query
+        binds: dict[str, Any] = {}
         if not query:
-            return None
+            return None, binds
 
         params = resolved.params
+        scan = _scan_sql(query)
+        splices: list[tuple[int, str]] = []
 
         # Handle temporal queries (Oracle Flashback)
         as_of = params.get("as_of") or params.get("moniker_version")
         if as_of:
             # Inject AS OF clause for temporal queries
             # Query should be like "SELECT * FROM table" -> "SELECT * FROM table AS OF TIMESTAMP ..."
-            query = self._inject_flashback(query, as_of)
+            splice = self._flashback_splice(query, as_of, scan)
+            if splice:
+                splices.append(splice)
 
         # Handle parameter filtering
         filters = self._extract_filters(params)
         if filters:
-            query = self._inject_where_clause(query, filters)
+            condition_str, binds = self._where_conditions(filters)
+            splices.append(self._where_splice(query, condition_str, scan))
+
+        # Splice everything into the original text in one pass; sort is
+        # stable so flashback stays ahead of WHERE at the same position
+        query = _apply_splices(query, splices)
 
         # Handle limit
         limit = params.get("limit")
         if limit is not None:
-            query = self._inject_limit(query, limit)
+            query = self._inject_limit(query, limit, scan)
 
-        return query
+        return query, binds
 
     def _inject_flashback(self, query: str, as_of: str) -> str:
         """Inject Oracle Flashback AS OF clause."""
-        # Find the FROM clause and inject AS OF after table name
+        splice = self._flashback_splice(query, as_of, _scan_sql(query))
+        return _apply_splices(query, [splice] if splice else [])
+
+    def _flashback_splice(
+        self, query: str, as_of: str, scan: dict[str, list[int]]
+    ) -> tuple[int, str] | None:
+        """Position and text of the AS OF clause, or None without a FROM."""
+        # Inject AS OF after the table name
         # This is a simplified approach - a full SQL parser would be better
-        query_upper = query.upper()
 
         # Handle different timestamp formats
         if as_of.isdigit():
@@ -183,87 +288,84 @@ class OracleAdapter(BaseAdapter):
             flashback_clause = f" AS OF TIMESTAMP TO_TIMESTAMP('{as_of}', 'YYYY-MM-DD HH24:MI:SS')"
 
         # Find FROM clause position
-        from_pos = query_upper.find(" FROM ")
-        if from_pos == -1:
-            return query
+        from_positions = scan.get("FROM")
+        if not from_positions:
+            return None
 
         # Find end of table name (next keyword or end)
-        end_markers = [" WHERE ", " GROUP ", " ORDER ", " HAVING ", " UNION ", ";"]
-        end_pos = len(query)
-
-        for marker in end_markers:
-            pos = query_upper.find(marker, from_pos + 6)
-            if pos != -1 and pos < end_pos:
-                end_pos = pos
-
-        # Insert flashback clause after table name
-        return query[:end_pos] + flashback_clause + query[end_pos:]
+        end_pos = _first_marker(scan, _FROM_END, from_positions[0] + 6)
+        return (len(query) if end_pos is None else end_pos), flashback_clause
 
     def _extract_filters(self, params: dict[str, Any]) -> dict[str, Any]:
         """Extract filter parameters (non-reserved params)."""
-        filters = {}
-
         # Get params from moniker_params if present
-        moniker_params = params.get("moniker_params", {})
+        moniker_params = params.get("moniker_params")
         if isinstance(moniker_params, dict):
-            for key, value in moniker_params.items():
-                if key not in _RESERVED_PARAMS and value is not None:
-                    filters[key] = value
+            filters = {
+                key: value
+                for key, value in moniker_params.items()
+                if key not in _RESERVED_PARAMS and value is not None
+            }
+        else:
+            filters = {}
 
-        # Also check top-level params
-        for key, value in params.items():
-            if key not in _RESERVED_PARAMS and not isinstance(value, dict) and value is not None:
-                filters[key] = value
+        # Also check top-level params (these win on duplicate keys)
+        filters.update({
+            key: value
+            for key, value in params.items()
+            if key not in _RESERVED_PARAMS and value is not None and not isinstance(value, dict)
+        })
 
         return filters
 
-    def _inject_where_clause(self, query: str, filters: dict[str, Any]) -> str:
-        """Inject WHERE clause for filters."""
+    def _inject_where_clause(
+        self, query: str, filters: dict[str, Any]
+    ) -> tuple[str, dict[str, Any]]:
+        """Inject WHERE clause for filters. Returns (query, binds)."""
         if not filters:
-            return query
-
-        query_upper = query.upper()
+            return query, {}
+        condition_str, binds = self._where_conditions(filters)
+        splice = self._where_splice(query, condition_str, _scan_sql(query))
+        return _apply_splices(query, [splice]), binds
 
-        # Build conditions
+    def _where_conditions(self, filters: dict[str, Any]) -> tuple[str, dict[str, Any]]:
+        """Build ANDed filter conditions with :pN bind placeholders."""
         conditions = []
-        for key, value in filters.items():
-            if isinstance(value, str):
-                conditions.append(f"{key} = '{value}'")
-            elif isinstance(value, (list, tuple)):
-                # IN clause
-                if all(isinstance(v, str) for v in value):
-                    values_str = ", ".join(f"'{v}'" for v in value)
-                else:
-                    values_str = ", ".join(str(v) for v in value)
-                conditions.append(f"{key} IN ({values_str})")
+        binds: dict[str, Any] = {}
+        for i, (key, value) in enumerate(filters.items()):
+            if isinstance(value, (list, tuple)):
+                # IN clause, one bind per element
+                names = [f"p{i}_{j}" for j in range(len(value))]
+                binds.update(zip(names, value))
+                conditions.append(f"{key} IN ({', '.join(':' + name for name in names)})")
             else:
-                conditions.append(f"{key} = {value}")
-
-        condition_str = " AND ".join(conditions)
-
+                binds[f"p{i}"] = value
+                conditions.append(f"{key} = :p{i}")
+        return " AND ".join(conditions), binds
+
+    def _where_splice(
+        self, query: str, condition_str: str, scan: dict[str, list[int]]
+    ) -> tuple[int, str]:
+        """Position and text of the filter conditions."""
         # Find if WHERE already exists
-        where_pos = query_upper.find(" WHERE ")
-        if where_pos != -1:
+        where_positions = scan.get("WHERE")
+        if where_positions:
             # Append to existing WHERE
-            return query[:where_pos + 7] + condition_str + " AND " + query[where_pos + 7:]
+            return where_positions[0] + 7, condition_str + " AND "
 
         # Find position to insert WHERE
-        end_markers = [" GROUP ", " ORDER ", " HAVING ", " UNION ", ";"]
-        insert_pos = len(query)
-
-        for marker in end_markers:
-            pos = query_upper.find(marker)
-            if pos != -1 and pos < insert_pos:
-                insert_pos = pos
+        insert_pos = _first_marker(scan, _WHERE_END)
+        return (len(query) if insert_pos is None else insert_pos), " WHERE " + condition_str
 
-        return query[:insert_pos] + " WHERE " + condition_str + query[insert_pos:]
-
-    def _inject_limit(self, query: str, limit: int) -> str:
+    def _inject_limit(
+        self, query: str, limit: int, scan: dict[str, list[int]] | None = None
+    ) -> str:
         """Inject row limit using FETCH FIRST (Oracle 12c+)."""
-        query_upper = query.upper()
+        if scan is None:
+            scan = _scan_sql(query)
 
         # Check if already has FETCH clause
-        if "FETCH " in query_upper:
+        if "FETCH" in scan:
             return query
 
         # Remove trailing semicolon if present
@@ -370,11 +472,10 @@ class OracleAdapter(BaseAdapter):
 
         start = time.perf_counter()
         try:
-            conn = self._get_connection(dsn, user, password, oracledb)
-            cursor = conn.cursor()
-            cursor.execute("SELECT 1 FROM DUAL")
-            cursor.fetchone()
-            cursor.close()
+            # One round trip either way: a cached connection is validated with
+            # conn.ping() (driver level, no SQL parse or cursor), and a fresh
+            # one has just proven connectivity by connecting
+            self._get_connection(dsn, user, password, oracledb)
             latency = (time.perf_counter() - start) * 1000
 
             return {
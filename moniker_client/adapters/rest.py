@@ -2,9 +2,32 @@
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import base64
+import http.cookiejar
+import random
+import threading
 import time
+import weakref
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Any, TYPE_CHECKING
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlsplit
+
+import httpx
+
+# Optional jsonschema import for response validation
+try:
+    import jsonschema
+except ImportError:
+    jsonschema = None  # type: ignore
+
+# Optional orjson import - parses large bodies several times faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
 
 if TYPE_CHECKING:
     from ..client import ResolvedSource
@@ -13,6 +36,176 @@ if TYPE_CHECKING:
 from .base import BaseAdapter, AdapterResult
 
 
+def _backoff_delay(attempt: int, config: ClientConfig) -> float:
+    """
+    Full-jitter exponential backoff for the given attempt (0-based).
+
+    Sleeps a random time in [0, min(factor * 2^(attempt+1), max_delay)], so
+    clients retrying the same failing endpoint spread out instead of
+    retrying in lockstep. The mean matches the old fixed factor * 2^attempt.
+    """
+    cap = min(config.retry_backoff_factor * (2 ** (attempt + 1)), config.retry_max_delay)
+    return random.uniform(0, cap)
+
+
+def _json_body(response: Any) -> Any:
+    """Decode a JSON response body, via orjson when it is installed."""
+    if orjson is None:
+        return response.json()
+    return orjson.loads(response.content)
+
+
+@lru_cache(maxsize=512)
+def _join_url(base_url: str, path: str) -> str:
+    """urljoin() memoized - it re-parses both URLs on every call."""
+    return urljoin(base_url, path)
+
+
+@lru_cache(maxsize=32)
+def _basic_header(username: str, password: str) -> str:
+    """Basic auth header value, shared by every adapter instance."""
+    return "Basic " + base64.b64encode(f"{username}:{password}".encode()).decode()
+
+
+# Compiled validators keyed by id(schema). Each entry holds its schema, so
+# the id can't be reused by another dict while the entry is cached.
+_VALIDATORS: OrderedDict[int, tuple[dict[str, Any], Any]] = OrderedDict()
+_VALIDATORS_LOCK = threading.Lock()
+_MAX_VALIDATORS = 128
+
+
+def _schema_validator(schema: dict[str, Any]) -> Any:
+    """
+    Compiled jsonschema validator for a response_schema dict.
+
+    jsonschema.validate() re-checks the schema against its meta-schema and
+    builds a validator on every call; this does that once per schema object.
+    The schema comes from the cached resolution's params, so the same dict
+    recurs until the moniker is resolved again. Lookup is by identity, which
+    costs nothing per call; a schema mutated in place is not re-checked.
+    Raises jsonschema.SchemaError for an invalid schema.
+    """
+    key = id(schema)
+    with _VALIDATORS_LOCK:
+        entry = _VALIDATORS.get(key)
+        if entry is not None:
+            _VALIDATORS.move_to_end(key)
+            return entry[1]
+
+    cls = jsonschema.validators.validator_for(schema)
+    cls.check_schema(schema)
+    validator = cls(schema)
+
+    with _VALIDATORS_LOCK:
+        _VALIDATORS[key] = (schema, validator)
+        while len(_VALIDATORS) > _MAX_VALIDATORS:
+            _VALIDATORS.popitem(last=False)
+    return validator
+
+
+@lru_cache(maxsize=256)
+def _compile_path(path: str) -> tuple[tuple[str, int | None], ...]:
+    """
+    Split a dot-notation response_path into (key, list_index) steps once.
+
+    list_index is the key as an int when it is all digits (usable on a list),
+    otherwise None.
+    """
+    steps = []
+    for key in path.split("."):
+        try:
+            idx = int(key) if key.isdigit() else None
+        except ValueError:
+            idx = None
+        steps.append((key, idx))
+    return tuple(steps)
+
+
+# Shared keep-alive clients keyed by (host, timeout, connect retries), so
+# repeat calls to a host reuse pooled connections instead of a fresh TCP/TLS
+# handshake each time
+_CLIENT_CACHE: dict[tuple[str, float, int], Any] = {}
+_CLIENT_LOCK = threading.Lock()
+
+_POOL_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+
+def _no_cookies() -> http.cookiejar.CookieJar:
+    """
+    Cookie jar that refuses every cookie.
+
+    The shared clients serve every caller and credential set for a host, so
+    a Set-Cookie from one response must not ride along on the next request.
+    """
+    return http.cookiejar.CookieJar(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+
+
+def _get_client(url: str, timeout: float, retries: int = 0) -> Any:
+    """
+    Get the shared httpx.Client for url's host, creating it on first use.
+
+    retries is handed to the transport, which retries failed connects at the
+    socket layer before an httpx.ConnectError ever reaches the caller.
+    """
+    key = (urlsplit(url).netloc, timeout, retries)
+    client = _CLIENT_CACHE.get(key)
+    if client is None:
+        with _CLIENT_LOCK:
+            client = _CLIENT_CACHE.get(key)
+            if client is None:
+                client = _CLIENT_CACHE[key] = httpx.Client(
+                    timeout=timeout,
+                    cookies=_no_cookies(),
+                    transport=httpx.HTTPTransport(limits=_POOL_LIMITS, retries=retries),
+                )
+    return client
+
+
+def close_clients() -> None:
+    """Close all shared HTTP clients."""
+    with _CLIENT_LOCK:
+        for client in _CLIENT_CACHE.values():
+            try:
+                client.close()
+            except Exception:
+                pass
+        _CLIENT_CACHE.clear()
+
+
+atexit.register(close_clients)
+
+
+# Async clients are bound to the event loop that created them, so they are
+# shared per running loop rather than process-wide
+_ASYNC_CLIENTS: weakref.WeakKeyDictionary[Any, dict[tuple[str, float, int], Any]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_async_client(url: str, timeout: float, retries: int = 0) -> Any:
+    """Get the shared httpx.AsyncClient for url's host on the running loop."""
+    clients = _ASYNC_CLIENTS.setdefault(asyncio.get_running_loop(), {})
+    key = (urlsplit(url).netloc, timeout, retries)
+    client = clients.get(key)
+    if client is None:
+        client = clients[key] = httpx.AsyncClient(
+            timeout=timeout,
+            cookies=_no_cookies(),
+            transport=httpx.AsyncHTTPTransport(limits=_POOL_LIMITS, retries=retries),
+        )
+    return client
+
+
+async def aclose_clients() -> None:
+    """Close the shared async HTTP clients of the running event loop."""
+    clients = _ASYNC_CLIENTS.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        try:
+            await client.aclose()
+        except Exception:
+            pass
+
+
 class RestAdapter(BaseAdapter):
     """
     Adapter for REST API sources.
@@ -27,13 +220,63 @@ class RestAdapter(BaseAdapter):
     - Health check endpoint support
     """
 
+    def __init__(self):
+        # (auth_type, credentials...) -> (header_name, header_value)
+        self._auth_header_cache: dict[tuple, tuple[str, str]] = {}
+
     def fetch(
         self,
         resolved: ResolvedSource,
         config: ClientConfig,
         **kwargs,
     ) -> Any:
-        start_time = time.perf_counter()
+        # Only timed when the caller asked for an AdapterResult
+        start_time = time.perf_counter() if kwargs.get("return_result") else 0.0
+        method, url, headers, merged_params = self._build_request(resolved, config)
+
+        # Make request with retry logic
+        data = self._request_with_retry(
+            method=method,
+            url=url,
+            headers=headers,
+            params=merged_params,
+            config=config,
+        )
+
+        return self._process_response(data, resolved.params, start_time, **kwargs)
+
+    async def afetch(
+        self,
+        resolved: ResolvedSource,
+        config: ClientConfig,
+        **kwargs,
+    ) -> Any:
+        """
+        Async variant of fetch() on a shared httpx.AsyncClient.
+
+        Callers can run many fetches concurrently with asyncio.gather().
+        """
+        # Only timed when the caller asked for an AdapterResult
+        start_time = time.perf_counter() if kwargs.get("return_result") else 0.0
+        method, url, headers, merged_params = self._build_request(resolved, config)
+
+        # Make request with retry logic
+        data = await self._arequest_with_retry(
+            method=method,
+            url=url,
+            headers=headers,
+            params=merged_params,
+            config=config,
+        )
+
+        return self._process_response(data, resolved.params, start_time, **kwargs)
+
+    def _build_request(
+        self,
+        resolved: ResolvedSource,
+        config: ClientConfig,
+    ) -> tuple[str, str, dict, dict | None]:
+        """Build (method, url, headers, params) for a fetch."""
         conn_info = resolved.connection
         params = resolved.params
 
@@ -42,8 +285,7 @@ class RestAdapter(BaseAdapter):
             raise ValueError("base_url required for REST source")
 
         # Build URL
-        url_path = resolved.query or ""
-        url = urljoin(base_url, url_path)
+        url = _join_url(base_url, resolved.query or "")
 
         # Method
         method = params.get("method", "GET").upper()
@@ -56,22 +298,33 @@ class RestAdapter(BaseAdapter):
         self._apply_auth(headers, auth_type, config, resolved)
 
         # Query params - use query_params with moniker_params as fallback for backwards compatibility
-        query_params = params.get("query_params", {})
-        moniker_params = params.get("moniker_params", {})
-
-        # Merge: query_params takes precedence
-        merged_params = {**moniker_params, **query_params}
-
-        # Make request with retry logic
-        data = self._request_with_retry(
-            method=method,
-            url=url,
-            headers=headers,
-            params=merged_params,
-            config=config,
-        )
-
-        execution_time = (time.perf_counter() - start_time) * 1000
+        query_params = params.get("query_params")
+        moniker_params = params.get("moniker_params")
+
+        # Merge: query_params takes precedence. Only copy when both are set;
+        # httpx never mutates the mapping it is given.
+        if not query_params and not moniker_params:
+            merged_params = None
+        elif not moniker_params:
+            merged_params = query_params
+        elif not query_params:
+            merged_params = moniker_params
+        else:
+            merged_params = {**moniker_params, **query_params}
+
+        return method, url, headers, merged_params
+
+    def _process_response(
+        self,
+        data: Any,
+        params: dict[str, Any],
+        start_time: float,
+        **kwargs,
+    ) -> Any:
+        """Extract, validate and wrap a decoded response."""
+        return_result = kwargs.get("return_result")
+        if return_result:
+            execution_time = (time.perf_counter() - start_time) * 1000
 
         # Extract nested data if response_path is set
         response_path = params.get("response_path")
@@ -84,7 +337,7 @@ class RestAdapter(BaseAdapter):
             self._validate_response(data, response_schema)
 
         # Return AdapterResult if requested
-        if kwargs.get("return_result"):
+        if return_result:
             row_count = len(data) if isinstance(data, list) else 1
             return AdapterResult(
                 data=data,
@@ -100,62 +353,124 @@ class RestAdapter(BaseAdapter):
         method: str,
         url: str,
         headers: dict,
-        params: dict,
+        params: dict | None,
         config: ClientConfig,
     ) -> Any:
-        """Make HTTP request with retry logic for transient failures."""
-        import httpx
+        """
+        Make HTTP request with retry logic for transient failures.
 
+        Failed and timed-out connects are retried by the client's transport;
+        this loop only retries retryable status codes and read/write/pool
+        timeouts, with jittered backoff.
+        """
         max_attempts = config.retry_max_attempts
-        backoff_factor = config.retry_backoff_factor
         retry_status_codes = config.retry_status_codes
 
         last_exception: Exception | None = None
 
+        client = _get_client(url, config.timeout, max_attempts - 1)
+
         for attempt in range(max_attempts):
             try:
-                with httpx.Client(timeout=config.timeout) as client:
-                    response = client.request(
-                        method,
-                        url,
-                        headers=headers,
-                        params=params if params else None,
-                    )
-
-                    # Check if we should retry based on status code
-                    if response.status_code in retry_status_codes and attempt < max_attempts - 1:
-                        wait_time = backoff_factor * (2 ** attempt)
-                        time.sleep(wait_time)
-                        continue
-
-                    if response.status_code == 404:
-                        from ..client import NotFoundError
-                        raise NotFoundError(f"Resource not found: {url}")
-
-                    response.raise_for_status()
-                    return response.json()
+                response = client.request(
+                    method,
+                    url,
+                    headers=headers,
+                    params=params,
+                )
+
+                # Check if we should retry based on status code
+                if response.status_code in retry_status_codes and attempt < max_attempts - 1:
+                    wait_time = _backoff_delay(attempt, config)
+                    time.sleep(wait_time)
+                    continue
+
+                return self._decode_response(response, url)
+
+            except httpx.ConnectTimeout as e:
+                # The transport has already retried the connect
+                raise TimeoutError(f"Connecting to {url} timed out after {max_attempts} attempts") from e
+
+            except httpx.ConnectError as e:
+                # The transport has already retried the connect
+                raise ConnectionError(f"Failed to connect to {url} after {max_attempts} attempts") from e
 
             except httpx.TimeoutException as e:
                 last_exception = e
                 if attempt < max_attempts - 1:
-                    wait_time = backoff_factor * (2 ** attempt)
+                    wait_time = _backoff_delay(attempt, config)
                     time.sleep(wait_time)
                     continue
                 raise TimeoutError(f"Request to {url} timed out after {max_attempts} attempts") from e
 
+        # Should not reach here, but just in case
+        if last_exception:
+            raise last_exception
+        raise RuntimeError("Unexpected retry loop exit")
+
+    async def _arequest_with_retry(
+        self,
+        method: str,
+        url: str,
+        headers: dict,
+        params: dict | None,
+        config: ClientConfig,
+    ) -> Any:
+        """Async variant of _request_with_retry()."""
+        max_attempts = config.retry_max_attempts
+        retry_status_codes = config.retry_status_codes
+
+        last_exception: Exception | None = None
+
+        client = _get_async_client(url, config.timeout, max_attempts - 1)
+
+        for attempt in range(max_attempts):
+            try:
+                response = await client.request(
+                    method,
+                    url,
+                    headers=headers,
+                    params=params,
+                )
+
+                # Check if we should retry based on status code
+                if response.status_code in retry_status_codes and attempt < max_attempts - 1:
+                    wait_time = _backoff_delay(attempt, config)
+                    await asyncio.sleep(wait_time)
+                    continue
+
+                return self._decode_response(response, url)
+
+            except httpx.ConnectTimeout as e:
+                # The transport has already retried the connect
+                raise TimeoutError(f"Connecting to {url} timed out after {max_attempts} attempts") from e
+
             except httpx.ConnectError as e:
+                # The transport has already retried the connect
+                raise ConnectionError(f"Failed to connect to {url} after {max_attempts} attempts") from e
+
+            except httpx.TimeoutException as e:
                 last_exception = e
                 if attempt < max_attempts - 1:
-                    wait_time = backoff_factor * (2 ** attempt)
-                    time.sleep(wait_time)
+                    wait_time = _backoff_delay(attempt, config)
+                    await asyncio.sleep(wait_time)
                     continue
-                raise ConnectionError(f"Failed to connect to {url} after {max_attempts} attempts") from e
+                raise TimeoutError(f"Request to {url} timed out after {max_attempts} attempts") from e
 
         # Should not reach here, but just in case
         if last_exception:
             raise last_exception
         raise RuntimeError("Unexpected retry loop exit")
 
+    def _decode_response(self, response: Any, url: str) -> Any:
+        """Raise for error statuses, otherwise return the decoded JSON body."""
+        if response.status_code == 404:
+            from ..client import NotFoundError
+            raise NotFoundError(f"Resource not found: {url}")
+
+        response.raise_for_status()
+        return _json_body(response)
+
     def _apply_auth(
         self,
         headers: dict,
@@ -163,48 +478,73 @@ class RestAdapter(BaseAdapter):
         config: ClientConfig,
         resolved: ResolvedSource,
     ) -> None:
-        """Apply authentication to headers."""
+        """
+        Apply authentication to headers.
+
+        The produced header is cached per credential set, so repeat calls
+        skip the formatting and base64 encoding.
+        """
         params = resolved.params
+        credentials = config.credentials
 
         if auth_type == "bearer":
             # Check params first, then config
-            token = params.get("bearer_token") or config.credentials.get("rest_bearer_token")
-            if token:
-                headers["Authorization"] = f"Bearer {token}"
-
+            token = params.get("bearer_token") or credentials.get("rest_bearer_token")
+            if not token:
+                return
+            key = (auth_type, token)
         elif auth_type == "api_key":
-            key = params.get("api_key") or config.credentials.get("rest_api_key")
-            header_name = resolved.connection.get("api_key_header", "X-API-Key")
-            if key:
-                headers[header_name] = key
-
+            api_key = params.get("api_key") or credentials.get("rest_api_key")
+            if not api_key:
+                return
+            key = (auth_type, resolved.connection.get("api_key_header", "X-API-Key"), api_key)
         elif auth_type == "basic":
-            import base64
-            username = params.get("username") or config.credentials.get("rest_username", "")
-            password = params.get("password") or config.credentials.get("rest_password", "")
-            creds = base64.b64encode(f"{username}:{password}".encode()).decode()
-            headers["Authorization"] = f"Basic {creds}"
+            username = params.get("username") or credentials.get("rest_username", "")
+            password = params.get("password") or credentials.get("rest_password", "")
+            key = (auth_type, username, password)
+        else:
+            return
+
+        cached = self._auth_header_cache.get(key)
+        if cached is None:
+            if auth_type == "bearer":
+                cached = ("Authorization", f"Bearer {key[1]}")
+            elif auth_type == "api_key":
+                cached = (key[1], key[2])
+            else:
+                cached = ("Authorization", _basic_header(key[1], key[2]))
+            # Rotating tokens would otherwise grow this without bound
+            if len(self._auth_header_cache) >= 256:
+                self._auth_header_cache.clear()
+            self._auth_header_cache[key] = cached
+        headers[cached[0]] = cached[1]
 
     def _extract_path(self, data: Any, path: str) -> Any:
-        """Extract nested data using dot notation."""
-        for key in path.split("."):
+        """
+        Extract nested data using dot notation.
+
+        The path is parsed once per distinct string by _compile_path().
+        """
+        for key, idx in _compile_path(path):
             if isinstance(data, dict):
                 data = data.get(key)
-            elif isinstance(data, list) and key.isdigit():
-                idx = int(key)
-                data = data[idx] if 0 <= idx < len(data) else None
+            elif idx is not None and isinstance(data, list):
+                data = data[idx] if idx < len(data) else None
             else:
                 return None
         return data
 
     def _validate_response(self, data: Any, schema: dict[str, Any]) -> None:
         """Validate response against JSON schema (if jsonschema is available)."""
-        try:
-            import jsonschema
-            jsonschema.validate(data, schema)
-        except ImportError:
+        if jsonschema is None:
             # jsonschema not installed, skip validation
-            pass
+            return
+        try:
+            validator = _schema_validator(schema)
+        except jsonschema.SchemaError as e:
+            raise ValueError(f"Invalid response_schema: {e.message}") from e
+        try:
+            validator.validate(data)
         except Exception as e:
             raise ValueError(f"Response validation failed: {e}") from e
 
@@ -218,19 +558,59 @@ class RestAdapter(BaseAdapter):
 
         Requires children_endpoint in connection config.
         """
-        import httpx
+        request = self._build_children_request(resolved, config)
+        if request is None:
+            return []
+        url, headers = request
+
+        try:
+            response = _get_client(
+                url, config.timeout, config.retry_max_attempts - 1
+            ).get(url, headers=headers)
+            response.raise_for_status()
+            return self._parse_children(_json_body(response))
+
+        except Exception:
+            return []
+
+    async def alist_children(
+        self,
+        resolved: ResolvedSource,
+        config: ClientConfig,
+    ) -> list[str]:
+        """Async variant of list_children()."""
+        request = self._build_children_request(resolved, config)
+        if request is None:
+            return []
+        url, headers = request
+
+        try:
+            response = await _get_async_client(
+                url, config.timeout, config.retry_max_attempts - 1
+            ).get(url, headers=headers)
+            response.raise_for_status()
+            return self._parse_children(_json_body(response))
 
+        except Exception:
+            return []
+
+    def _build_children_request(
+        self,
+        resolved: ResolvedSource,
+        config: ClientConfig,
+    ) -> tuple[str, dict] | None:
+        """Build (url, headers) for the children endpoint, or None if not configured."""
         conn_info = resolved.connection
         children_endpoint = conn_info.get("children_endpoint")
 
         if not children_endpoint:
-            return []
+            return None
 
         base_url = conn_info.get("base_url")
         if not base_url:
-            return []
+            return None
 
-        url = urljoin(base_url, children_endpoint)
+        url = _join_url(base_url, children_endpoint)
 
         # Headers
         headers = dict(conn_info.get("headers", {}))
@@ -239,45 +619,32 @@ class RestAdapter(BaseAdapter):
         auth_type = conn_info.get("auth_type", "none")
         self._apply_auth(headers, auth_type, config, resolved)
 
-        try:
-            with httpx.Client(timeout=config.timeout) as client:
-                response = client.get(url, headers=headers)
-                response.raise_for_status()
-                data = response.json()
-
-                # Handle different response formats
-                if isinstance(data, list):
-                    # Assume list of strings or dicts with 'name' key
-                    children = []
-                    for item in data:
-                        if isinstance(item, str):
-                            children.append(item)
-                        elif isinstance(item, dict):
-                            name = item.get("name") or item.get("id") or item.get("path")
-                            if name:
-                                children.append(str(name))
-                    return children
-                elif isinstance(data, dict):
-                    # Look for children in common keys
-                    for key in ["children", "items", "results", "data"]:
-                        if key in data and isinstance(data[key], list):
-                            return self._extract_children_names(data[key])
-                return []
-
-        except Exception:
-            return []
+        return url, headers
+
+    def _parse_children(self, data: Any) -> list[str]:
+        """Extract child names from a children endpoint response."""
+        # Handle different response formats
+        if isinstance(data, list):
+            # Assume list of strings or dicts with 'name' key
+            return self._extract_children_names(data)
+        elif isinstance(data, dict):
+            # Look for children in common keys
+            for key in ("children", "items", "results", "data"):
+                if key in data and isinstance(data[key], list):
+                    return self._extract_children_names(data[key])
+        return []
 
     def _extract_children_names(self, items: list) -> list[str]:
-        """Extract names from list of items."""
-        children = []
-        for item in items:
-            if isinstance(item, str):
-                children.append(item)
-            elif isinstance(item, dict):
-                name = item.get("name") or item.get("id") or item.get("path")
-                if name:
-                    children.append(str(name))
-        return children
+        """Extract names from list of items (strings, or dicts with name/id/path)."""
+        return [
+            item if isinstance(item, str) else str(name)
+            for item in items
+            if isinstance(item, str)
+            or (
+                isinstance(item, dict)
+                and (name := item.get("name") or item.get("id") or item.get("path"))
+            )
+        ]
 
     def health_check(
         self,
@@ -289,20 +656,61 @@ class RestAdapter(BaseAdapter):
 
         Uses health_endpoint from connection config, or falls back to base_url.
         """
-        import httpx
+        request = self._build_health_request(resolved, config)
+        if request is None:
+            return {
+                "healthy": False,
+                "message": "base_url not configured",
+            }
+        url, headers = request
 
-        conn_info = resolved.connection
-        base_url = conn_info.get("base_url")
+        start = time.perf_counter()
+        try:
+            response = _get_client(url, config.timeout).get(
+                url, headers=headers, timeout=min(config.timeout, 10)
+            )
+            return self._health_result(response, url, start)
+        except Exception as e:
+            return self._health_failure(e, start)
 
-        if not base_url:
+    async def ahealth_check(
+        self,
+        resolved: ResolvedSource,
+        config: ClientConfig,
+    ) -> dict[str, Any]:
+        """Async variant of health_check()."""
+        request = self._build_health_request(resolved, config)
+        if request is None:
             return {
                 "healthy": False,
                 "message": "base_url not configured",
             }
+        url, headers = request
+
+        start = time.perf_counter()
+        try:
+            response = await _get_async_client(url, config.timeout).get(
+                url, headers=headers, timeout=min(config.timeout, 10)
+            )
+            return self._health_result(response, url, start)
+        except Exception as e:
+            return self._health_failure(e, start)
+
+    def _build_health_request(
+        self,
+        resolved: ResolvedSource,
+        config: ClientConfig,
+    ) -> tuple[str, dict] | None:
+        """Build (url, headers) for the health endpoint, or None without base_url."""
+        conn_info = resolved.connection
+        base_url = conn_info.get("base_url")
+
+        if not base_url:
+            return None
 
         # Use specific health endpoint if configured
         health_endpoint = conn_info.get("health_endpoint", "")
-        url = urljoin(base_url, health_endpoint)
+        url = _join_url(base_url, health_endpoint)
 
         # Headers
         headers = dict(conn_info.get("headers", {}))
@@ -311,42 +719,54 @@ class RestAdapter(BaseAdapter):
         auth_type = conn_info.get("auth_type", "none")
         self._apply_auth(headers, auth_type, config, resolved)
 
-        start = time.perf_counter()
-        try:
-            with httpx.Client(timeout=min(config.timeout, 10)) as client:
-                response = client.get(url, headers=headers)
-                latency = (time.perf_counter() - start) * 1000
-
-                if response.status_code < 400:
-                    return {
-                        "healthy": True,
-                        "message": f"OK (status {response.status_code})",
-                        "latency_ms": latency,
-                        "details": {"url": url},
-                    }
-                else:
-                    return {
-                        "healthy": False,
-                        "message": f"Unhealthy (status {response.status_code})",
-                        "latency_ms": latency,
-                        "details": {"url": url},
-                    }
-
-        except httpx.TimeoutException:
+        return url, headers
+
+    def _health_result(self, response: Any, url: str, start: float) -> dict[str, Any]:
+        """Health check result for a received response."""
+        latency = (time.perf_counter() - start) * 1000
+
+        if response.status_code < 400:
             return {
-                "healthy": False,
-                "message": "Health check timed out",
-                "latency_ms": (time.perf_counter() - start) * 1000,
+                "healthy": True,
+                "message": f"OK (status {response.status_code})",
+                "latency_ms": latency,
+                "details": {"url": url},
             }
-        except httpx.ConnectError as e:
+        else:
             return {
                 "healthy": False,
-                "message": f"Connection failed: {e}",
-                "latency_ms": (time.perf_counter() - start) * 1000,
-            }
-        except Exception as e:
-            return {
-                "healthy": False,
-                "message": str(e),
-                "latency_ms": (time.perf_counter() - start) * 1000,
+                "message": f"Unhealthy (status {response.status_code})",
+                "latency_ms": latency,
+                "details": {"url": url},
             }
+
+    def _health_failure(self, error: Exception, start: float) -> dict[str, Any]:
+        """Health check result for a request that raised."""
+        if isinstance(error, httpx.TimeoutException):
+            message = "Health check timed out"
+        elif isinstance(error, httpx.ConnectError):
+            message = f"Connection failed: {error}"
+        else:
+            message = str(error)
+        return {
+            "healthy": False,
+            "message": message,
+            "latency_ms": (time.perf_counter() - start) * 1000,
+        }
+
+
+async def health_check_many(
+    resolveds: list[ResolvedSource],
+    config: ClientConfig,
+) -> list[dict[str, Any]]:
+    """
+    Health-check many REST sources concurrently.
+
+    Checks run with asyncio.gather() on the running loop's shared
+    AsyncClients, so N endpoints take roughly one round trip rather than N.
+    Results are in the same order as resolveds.
+    """
+    adapter = RestAdapter()
+    return list(
+        await asyncio.gather(*(adapter.ahealth_check(r, config) for r in resolveds))
+    )
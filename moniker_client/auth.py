@@ -5,16 +5,28 @@ from __future__ import annotations
 import base64
 import logging
 import os
+import time
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Mapping
 
 if TYPE_CHECKING:
     from .config import ClientConfig
 
 logger = logging.getLogger(__name__)
 
-# Empty dict singleton - avoid allocation on hot path
-_EMPTY_HEADERS: dict[str, str] = {}
+# Empty read-only singleton - avoid allocation on hot path. Shared header
+# mappings are read-only so a caller cannot mutate them for everyone else;
+# callers needing a mutable copy use dict(headers).
+_EMPTY_HEADERS: Mapping[str, str] = MappingProxyType({})
+
+# Upper bound (seconds) on how long acquired Kerberos credentials are reused
+_KERBEROS_CACHE_TTL = 300.0
+
+# Auth methods whose header must be built for every request rather than
+# once per pooled client: a SPNEGO token is replay-protected, so a token
+# the service has already seen is rejected
+PER_REQUEST_AUTH_METHODS = frozenset({"kerberos"})
 
 # Optional gssapi import for Kerberos
 try:
@@ -30,10 +42,18 @@ class ClientAuth:
     """Authentication helper for moniker-client."""
 
     # Cache for JWT headers (token doesn't change often)
-    _jwt_cache: dict[str, str] = field(default_factory=dict, repr=False)
+    _jwt_cache: Mapping[str, str] = field(default_factory=dict, repr=False)
     _jwt_cache_token: str | None = field(default=None, repr=False)
+    # (path, mtime_ns, token) of the last JWT token file read
+    _jwt_file_cache: tuple[str, int, str] | None = field(default=None, repr=False)
 
-    def get_auth_headers(self, config: ClientConfig) -> dict[str, str]:
+    # Cache for the Kerberos credentials and target name (acquiring them is
+    # the expensive part); each request still steps a fresh security context
+    _kerberos_cache: tuple[object, object] | None = field(default=None, repr=False)
+    _kerberos_cache_principal: str | None = field(default=None, repr=False)
+    _kerberos_cache_expiry: float = field(default=0.0, repr=False)
+
+    def get_auth_headers(self, config: ClientConfig) -> Mapping[str, str]:
         """
         Get Authorization header based on config.
 
@@ -43,25 +63,33 @@ class ClientAuth:
             config: Client configuration with auth settings
 
         Returns:
-            Dictionary with Authorization header, or empty dict if no auth
+            Read-only mapping with Authorization header, or empty mapping if no auth
         """
         # Fast path - no auth configured (most common in dev/notebooks)
         auth_method = config.auth_method
         if not auth_method:
             return _EMPTY_HEADERS
 
-        if auth_method == "kerberos":
-            return self._get_kerberos_headers(config)
-        elif auth_method == "jwt":
-            return self._get_jwt_headers_cached(config)
-        return _EMPTY_HEADERS
+        handler = _AUTH_DISPATCH.get(auth_method)
+        return handler(self, config) if handler else _EMPTY_HEADERS
 
-    def _get_kerberos_headers(self, config: ClientConfig) -> dict[str, str]:
+    def clear_cache(self) -> None:
+        """Drop cached tokens so the next call builds fresh headers."""
+        self._kerberos_cache = None
+        self._kerberos_cache_expiry = 0.0
+        self._jwt_cache = _EMPTY_HEADERS
+        self._jwt_cache_token = None
+        self._jwt_file_cache = None
+
+    def _get_kerberos_headers(self, config: ClientConfig) -> Mapping[str, str]:
         """
         Get Kerberos SPNEGO Negotiate header.
 
         Uses gssapi to obtain a SPNEGO token for the configured service principal.
-        Requires a valid Kerberos ticket (obtained via kinit).
+        Requires a valid Kerberos ticket (obtained via kinit). The credentials
+        are reused for up to 5 minutes, or their lifetime if shorter, but every
+        call steps a new security context: tokens are replay-protected, so each
+        request needs its own.
 
         Args:
             config: Client configuration with kerberos_service_principal
@@ -80,24 +108,19 @@ class ClientAuth:
             return _EMPTY_HEADERS
 
         try:
-            # Create the target service name
-            service_name = gssapi.Name(
-                config.kerberos_service_principal,
-                name_type=gssapi.NameType.kerberos_principal,
-            )
+            service_name, creds = self._get_kerberos_credentials(config.kerberos_service_principal)
 
-            # Create security context
+            # Create security context and get the initial SPNEGO token
             ctx = gssapi.SecurityContext(
                 name=service_name,
+                creds=creds,
                 usage="initiate",
             )
-
-            # Get the initial SPNEGO token
             token = ctx.step()
 
             if token:
                 token_b64 = base64.b64encode(token).decode("ascii")
-                return {"Authorization": f"Negotiate {token_b64}"}
+                return MappingProxyType({"Authorization": f"Negotiate {token_b64}"})
             else:
                 logger.warning("Failed to obtain Kerberos token")
                 return _EMPTY_HEADERS
@@ -106,7 +129,31 @@ class ClientAuth:
             logger.warning(f"Kerberos authentication failed: {e}")
             return _EMPTY_HEADERS
 
-    def _get_jwt_headers_cached(self, config: ClientConfig) -> dict[str, str]:
+    def _get_kerberos_credentials(self, principal: str) -> tuple[object, object]:
+        """Get the cached (target name, initiator credentials), acquiring them on a miss."""
+        # Cache hit - same principal and not yet expired
+        now = time.monotonic()
+        if (
+            self._kerberos_cache
+            and self._kerberos_cache_principal == principal
+            and now < self._kerberos_cache_expiry
+        ):
+            return self._kerberos_cache
+
+        # Create the target service name
+        service_name = gssapi.Name(principal, name_type=gssapi.NameType.kerberos_principal)
+        creds = gssapi.Credentials(usage="initiate")
+        try:
+            ttl = min(creds.lifetime or _KERBEROS_CACHE_TTL, _KERBEROS_CACHE_TTL)
+        except Exception:
+            ttl = _KERBEROS_CACHE_TTL
+
+        self._kerberos_cache = (service_name, creds)
+        self._kerberos_cache_principal = principal
+        self._kerberos_cache_expiry = now + ttl
+        return self._kerberos_cache
+
+    def _get_jwt_headers_cached(self, config: ClientConfig) -> Mapping[str, str]:
         """Get JWT headers with caching to avoid repeated token lookups."""
         token = self._get_jwt_token(config)
         if not token:
@@ -117,11 +164,11 @@ class ClientAuth:
             return self._jwt_cache
 
         # Cache miss - build and cache
-        self._jwt_cache = {"Authorization": f"Bearer {token}"}
+        self._jwt_cache = MappingProxyType({"Authorization": f"Bearer {token}"})
         self._jwt_cache_token = token
         return self._jwt_cache
 
-    def _get_jwt_headers(self, config: ClientConfig) -> dict[str, str]:
+    def _get_jwt_headers(self, config: ClientConfig) -> Mapping[str, str]:
         """
         Get JWT Bearer token header.
 
@@ -153,21 +200,39 @@ class ClientAuth:
             if token:
                 return token
 
-        # 3. Token file
+        # 3. Token file - re-read only when its mtime changes
         if config.jwt_token_file:
+            path = config.jwt_token_file
             try:
-                with open(config.jwt_token_file, "r") as f:
-                    return f.read().strip()
+                mtime_ns = os.stat(path).st_mtime_ns
+                cached = self._jwt_file_cache
+                if cached and cached[0] == path and cached[1] == mtime_ns:
+                    return cached[2]
+                with open(path, "r") as f:
+                    token = f.read().strip()
+                self._jwt_file_cache = (path, mtime_ns, token)
+                return token
             except Exception as e:
                 logger.warning(f"Failed to read JWT token file: {e}")
 
         return None
 
 
+# auth_method -> header builder, so dispatch is a single dict lookup
+_AUTH_DISPATCH = {
+    "kerberos": ClientAuth._get_kerberos_headers,
+    "jwt": ClientAuth._get_jwt_headers_cached,
+}
+
 # Default instance
 _client_auth = ClientAuth()
 
 
-def get_auth_headers(config: ClientConfig) -> dict[str, str]:
+def get_auth_headers(config: ClientConfig) -> Mapping[str, str]:
     """Get authentication headers for the given config."""
     return _client_auth.get_auth_headers(config)
+
+
+def clear_auth_cache() -> None:
+    """Drop cached authentication tokens, e.g. after the service rejects one."""
+    _client_auth.clear_cache()
@@ -2,19 +2,36 @@
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import copy
 import logging
+import sys
+import threading
 import time
 import warnings
+import weakref
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Callable, Iterator
 
 import httpx
 
-from .auth import get_auth_headers
+from .auth import PER_REQUEST_AUTH_METHODS, clear_auth_cache, get_auth_headers
 from .config import ClientConfig
 from .adapters import get_adapter
 from .resilience import RetryConfig, retry_with_backoff, ClientCircuitBreaker
 
+# Optional orjson import - parses large bodies several times faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+
+logger = logging.getLogger("moniker_client")
+
 
 class MonikerError(Exception):
     """Base exception for moniker client errors."""
@@ -41,7 +58,22 @@ class AccessDeniedError(MonikerError):
     pass
 
 
-@dataclass
+def _records_to_arrow(columns: list[str], data: list[dict[str, Any]]) -> Any:
+    """
+    Transpose row dicts into a pyarrow.Table.
+
+    Builds one list per column rather than going through from_pylist, so
+    column order follows the result's columns list.
+    """
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise ImportError("pyarrow is required for to_arrow(). Install with: pip install pyarrow")
+    names = columns or (list(data[0]) if data else [])
+    return pa.table({name: [row.get(name) for row in data] for name in names})
+
+
+@dataclass(slots=True, frozen=True)
 class FetchResult:
     """Result from server-side data fetch."""
     moniker: str
@@ -67,8 +99,12 @@ class FetchResult:
         """Lazy DataFrame property."""
         return self.to_dataframe()
 
+    def to_arrow(self):
+        """Convert result to a columnar pyarrow.Table."""
+        return _records_to_arrow(self.columns, self.data)
 
-@dataclass
+
+@dataclass(slots=True)
 class MetadataResult:
     """Rich metadata for AI/agent discoverability."""
     moniker: str
@@ -90,7 +126,7 @@ class MetadataResult:
     use_cases: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SampleResult:
     """Sample data preview from a source."""
     moniker: str
@@ -100,8 +136,12 @@ class SampleResult:
     columns: list[str]
     data: list[dict[str, Any]]
 
+    def to_arrow(self):
+        """Convert sample to a columnar pyarrow.Table."""
+        return _records_to_arrow(self.columns, self.data)
 
-@dataclass
+
+@dataclass(slots=True)
 class TreeNode:
     """A node in the moniker tree hierarchy."""
     path: str
@@ -129,38 +169,44 @@ class TreeNode:
             show_ownership: Include ownership annotations
             show_source: Include source type annotations
         """
-        lines = []
-
-        # Build the line prefix
-        if not _is_root:
-            connector = "└── " if is_last else "├── "
-        else:
-            connector = ""
-
-        # Build annotations
-        annotations = []
-        if show_ownership and self.ownership:
-            owner = self.ownership.get("accountable_owner") or self.ownership.get("adop")
-            if owner:
-                annotations.append(f"owner: {owner}")
-        if show_source and self.source_type:
-            annotations.append(f"source: {self.source_type}")
-
-        annotation_str = f"  [{', '.join(annotations)}]" if annotations else ""
-
-        # Add this node
-        lines.append(f"{indent}{connector}{self.name}/{annotation_str}")
-
-        # Prepare indent for children
-        if not _is_root:
-            child_indent = indent + ("    " if is_last else "│   ")
-        else:
-            child_indent = ""
-
-        # Add children
-        for i, child in enumerate(self.children):
-            is_last_child = (i == len(self.children) - 1)
-            lines.append(child.print(child_indent, is_last_child, show_ownership, show_source, _is_root=False))
+        # Iterative pre-order walk into one flat list of lines, joined once,
+        # so deep catalogs neither re-join subtrees nor hit the recursion limit
+        lines: list[str] = []
+        stack = [(self, indent, is_last, _is_root)]
+        while stack:
+            node, node_indent, node_is_last, node_is_root = stack.pop()
+
+            # Build the line prefix
+            if not node_is_root:
+                connector = "└── " if node_is_last else "├── "
+            else:
+                connector = ""
+
+            # Build annotations
+            annotations = []
+            if show_ownership and node.ownership:
+                owner = node.ownership.get("accountable_owner") or node.ownership.get("adop")
+                if owner:
+                    annotations.append(f"owner: {owner}")
+            if show_source and node.source_type:
+                annotations.append(f"source: {node.source_type}")
+
+            annotation_str = f"  [{', '.join(annotations)}]" if annotations else ""
+
+            # Add this node
+            lines.append(f"{node_indent}{connector}{node.name}/{annotation_str}")
+
+            # Prepare indent for children
+            if not node_is_root:
+                child_indent = node_indent + ("    " if node_is_last else "│   ")
+            else:
+                child_indent = ""
+
+            # Push children in reverse so the first child is emitted first
+            children = node.children
+            last_index = len(children) - 1
+            for i in range(last_index, -1, -1):
+                stack.append((children[i], child_indent, i == last_index, False))
 
         return "\n".join(lines)
 
@@ -168,7 +214,7 @@ class TreeNode:
         return self.print()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SearchResult:
     """Result from catalog search."""
     query: str
@@ -176,7 +222,7 @@ class SearchResult:
     results: list[dict[str, Any]]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CatalogStats:
     """Catalog statistics."""
     total_monikers: int
@@ -186,7 +232,7 @@ class CatalogStats:
     ownership_coverage: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SchemaInfo:
     """Schema information for a moniker."""
     moniker: str
@@ -199,7 +245,7 @@ class SchemaInfo:
     related_monikers: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ResolvedSource:
     """Resolved source information from the service."""
     moniker: str
@@ -226,6 +272,199 @@ class ResolvedSource:
         return self.status == "deprecated"
 
 
+def _json_body(response: httpx.Response) -> Any:
+    """Decode a JSON response body, via orjson when it is installed."""
+    if orjson is None:
+        return response.json()
+    return orjson.loads(response.content)
+
+
+def _ensure_uri(moniker: str) -> str:
+    """Add the moniker:// scheme if it is missing."""
+    return moniker if moniker.startswith("moniker://") else f"moniker://{moniker}"
+
+
+def _strip_scheme(moniker: str) -> str:
+    """
+    Path part of a moniker, with or without the moniker:// scheme.
+
+    A scheme-less path is returned as-is without copying, so Moniker can pass
+    its normalized path straight through.
+    """
+    return moniker.removeprefix("moniker://")
+
+
+class _TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire ttl seconds after being stored.
+
+    Expired entries are dropped when looked up and the least recently used
+    are evicted past maxsize, so memory stays bounded. Ages are measured on
+    time.monotonic(), so wall-clock steps (NTP, DST) don't extend or cut
+    short an entry's life. A ttl of 0 disables it.
+
+    With a copier, get() and put() hand out copier(value) so callers never
+    share, and can't mutate, the cached object itself.
+    """
+
+    __slots__ = ("ttl", "maxsize", "copier", "_data", "_lock")
+
+    def __init__(self, ttl: float, maxsize: int, copier: Callable[[Any], Any] | None = None):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.copier = copier
+        self._data: OrderedDict[Any, tuple[Any, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Any) -> Any:
+        """Return a fresh cached value, or None."""
+        if self.ttl <= 0:
+            return None
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[1] >= self.ttl:
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            value = entry[0]
+        return self.copier(value) if self.copier else value
+
+    def put(self, key: Any, value: Any, copy_out: bool = True) -> Any:
+        """
+        Cache a value (evicting least recently used) and return it.
+
+        copy_out=False returns the stored value itself, for callers that
+        copy it later and must not be charged for a second copy.
+        """
+        if self.ttl > 0:
+            with self._lock:
+                self._data[key] = (value, time.monotonic())
+                self._data.move_to_end(key)
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+            if self.copier and copy_out:
+                return self.copier(value)
+        return value
+
+    def pop(self, key: Any) -> None:
+        """Drop key if cached."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def discard(self, predicate: Callable[[Any], bool]) -> None:
+        """Drop every entry whose key matches predicate."""
+        with self._lock:
+            for key in [k for k in self._data if predicate(k)]:
+                del self._data[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+def _tree_from_dict(data: dict[str, Any]) -> TreeNode:
+    """
+    Build a TreeNode hierarchy from a /tree response body.
+
+    Uses an explicit stack rather than recursion so deep catalogs don't hit
+    the interpreter's recursion limit. Each node is created with an empty
+    children list that its children are appended to as they are popped.
+    Source types repeat across the whole tree and are interned.
+    """
+    root: list[TreeNode] = []
+    stack: list[tuple[dict[str, Any], list[TreeNode]]] = [(data, root)]
+    while stack:
+        node_data, siblings = stack.pop()
+        source_type = node_data.get("source_type")
+        node = TreeNode(
+            path=node_data["path"],
+            name=node_data["name"],
+            ownership=node_data.get("ownership"),
+            source_type=sys.intern(source_type) if source_type else source_type,
+            has_source_binding=node_data.get("has_source_binding", False),
+            description=node_data.get("description"),
+        )
+        siblings.append(node)
+        # Reversed so children are popped, and appended, in server order
+        stack.extend((c, node.children) for c in reversed(node_data.get("children", [])))
+    return root[0]
+
+
+def _resolved_from_dict(data: dict[str, Any]) -> ResolvedSource:
+    """
+    Build a ResolvedSource from a /resolve response body.
+
+    source_type and status come from a handful of values, so they are
+    interned to share one string across every cached resolution.
+    """
+    status = data.get("status")
+    return ResolvedSource(
+        moniker=data["moniker"],
+        path=data["path"],
+        source_type=sys.intern(data["source_type"]),
+        connection=data["connection"],
+        query=data.get("query"),
+        params=data.get("params", {}),
+        schema_info=data.get("schema_info"),
+        read_only=data.get("read_only", True),
+        ownership=data.get("ownership", {}),
+        binding_path=data.get("binding_path", ""),
+        sub_path=data.get("sub_path"),
+        status=sys.intern(status) if status else status,
+        deprecation_message=data.get("deprecation_message"),
+        successor=data.get("successor"),
+        sunset_deadline=data.get("sunset_deadline"),
+        migration_guide_url=data.get("migration_guide_url"),
+        redirected_from=data.get("redirected_from"),
+    )
+
+
+def _metadata_from_dict(data: dict[str, Any]) -> MetadataResult:
+    """
+    Build a MetadataResult from a /metadata response body.
+
+    Fields reference the decoded JSON values rather than copying them, so
+    construction is one dict lookup per field. Results are also memoized by
+    the metadata cache.
+    """
+    return MetadataResult(
+        moniker=data["moniker"],
+        path=data["path"],
+        display_name=data.get("display_name"),
+        description=data.get("description"),
+        data_profile=data.get("data_profile"),
+        temporal_coverage=data.get("temporal_coverage"),
+        relationships=data.get("relationships"),
+        sample_data=data.get("sample_data"),
+        schema=data.get("schema"),
+        semantic_tags=data.get("semantic_tags", []),
+        data_quality=data.get("data_quality"),
+        ownership=data.get("ownership"),
+        documentation=data.get("documentation"),
+        query_patterns=data.get("query_patterns"),
+        cost_indicators=data.get("cost_indicators"),
+        nl_description=data.get("nl_description"),
+        use_cases=data.get("use_cases", []),
+    )
+
+
+def _sample_from_dict(data: dict[str, Any]) -> SampleResult:
+    """Build a SampleResult from a /sample response body."""
+    return SampleResult(
+        moniker=data["moniker"],
+        path=data["path"],
+        source_type=sys.intern(data["source_type"]),
+        row_count=data["row_count"],
+        columns=[sys.intern(c) for c in data["columns"]],
+        data=data["data"],
+    )
+
+
 class Moniker:
     """
     Fluent API for working with a moniker path.
@@ -269,9 +508,8 @@ class Moniker:
             client: Optional MonikerClient (uses default if not provided)
         """
         # Normalize path - strip scheme if present
-        if path.startswith("moniker://"):
-            path = path[len("moniker://"):]
-        self._path = path.strip("/")
+        self._path = _strip_scheme(path).strip("/")
+        self._uri = f"moniker://{self._path}"
         self._client = client
 
     @property
@@ -282,7 +520,7 @@ class Moniker:
     @property
     def uri(self) -> str:
         """Full moniker URI with scheme."""
-        return f"moniker://{self._path}"
+        return self._uri
 
     @property
     def client(self) -> "MonikerClient":
@@ -315,7 +553,7 @@ class Moniker:
 
     def read(self, **kwargs) -> Any:
         """Read data (client-side execution via adapter)."""
-        return self.client.read(self._path, **kwargs)
+        return self.client.read(self._uri, **kwargs)
 
     def fetch(self, limit: int | None = None, **params) -> FetchResult:
         """Fetch data (server-side execution)."""
@@ -335,7 +573,7 @@ class Moniker:
 
     def resolve(self) -> ResolvedSource:
         """Resolve to source connection info."""
-        return self.client.resolve(self._path)
+        return self.client.resolve(self._uri)
 
     def lineage(self) -> dict[str, Any]:
         """Get ownership lineage."""
@@ -397,16 +635,101 @@ class MonikerClient:
             app_id="my-app",
             team="my-team",
         ))
+
+        # Or as a context manager, closing pooled connections on exit
+        with MonikerClient() as client:
+            data = client.read("market-data/prices/equity/AAPL")
     """
     config: ClientConfig = field(default_factory=ClientConfig)
 
-    # Local cache of resolutions
-    _cache: dict[str, tuple[ResolvedSource, float]] = field(default_factory=dict, init=False)
+    # Local cache of resolutions: moniker URI -> ResolvedSource
+    _cache: _TTLCache = field(init=False, repr=False, compare=False)
+
+    # Cache of read-only catalog results: (endpoint, path, *params) -> result
+    _meta_cache: _TTLCache = field(init=False, repr=False, compare=False)
+
+    # Requests currently in flight: moniker URI or cache key -> Future shared by waiting callers
+    _inflight: dict[Any, Future] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _inflight_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
 
     # Resilience
     _retry_config: RetryConfig = field(default_factory=RetryConfig, init=False)
     _circuit_breaker: ClientCircuitBreaker = field(default_factory=ClientCircuitBreaker, init=False)
 
+    # Pooled HTTP client for service calls - keeps connections alive between requests
+    _http: httpx.Client = field(init=False, repr=False, compare=False)
+
+    # Whether resolves report deprecated monikers (from config, see __post_init__)
+    _warn_deprecated: bool = field(default=False, init=False, repr=False, compare=False)
+
+    # Worker threads for batch_read() source fetches, started on first use
+    _executor: ThreadPoolExecutor = field(init=False, repr=False, compare=False)
+
+    # Telemetry records awaiting a bulk post; see flush_telemetry()
+    _telemetry: deque[dict[str, Any]] = field(
+        default_factory=deque, init=False, repr=False, compare=False
+    )
+    _telemetry_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+    _telemetry_timer: threading.Timer | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Cleared once the service answers the batch route with 404/405
+    _telemetry_batch_supported: bool = field(
+        default=True, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # Deprecation toggles are read once; the hot path checks one flag
+        self._warn_deprecated = bool(
+            getattr(self.config, 'deprecation_enabled', False)
+            and getattr(self.config, 'warn_on_deprecated', True)
+        )
+        self._cache = _TTLCache(self.config.cache_ttl, self.config.max_cache_entries)
+        # Metadata results hold dicts and lists, so each caller gets a copy
+        self._meta_cache = _TTLCache(
+            self.config.meta_cache_ttl, self.config.max_meta_cache_size, copy.deepcopy
+        )
+        from . import __version__
+
+        # Service calls use paths relative to base_url. Identity and auth
+        # headers ride on every request; see _refresh_auth(). Auth methods
+        # that can't reuse a header (Kerberos) sign each request instead.
+        # Accept-Encoding is left to httpx, which offers gzip and deflate,
+        # plus br when the "compression" extra is installed.
+        per_request_auth = self.config.auth_method in PER_REQUEST_AUTH_METHODS
+        self._http = httpx.Client(
+            timeout=self.config.timeout,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            headers={"User-Agent": f"moniker-client/{__version__}", **self._get_headers()},
+            auth=self._sign_request if per_request_auth else None,
+            base_url=self.config.service_url,
+            http2=self.config.http2,
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, self.config.batch_concurrency),
+            thread_name_prefix="moniker-batch",
+        )
+        if self.config.report_telemetry:
+            _telemetry_clients[id(self)] = self
+
+    def close(self) -> None:
+        """Post buffered telemetry, close pooled connections and stop batch workers."""
+        # A full-batch flush already handed to a worker may have drained the
+        # buffer and still be posting; let it finish before closing _http
+        self._executor.shutdown(wait=True)
+        self.flush_telemetry()
+        self._http.close()
+
+    def __enter__(self) -> MonikerClient:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
     def read(self, moniker: str, **kwargs) -> Any:
         """
         Read data for a moniker.
@@ -428,8 +751,7 @@ class MonikerClient:
 
         try:
             # Normalize moniker
-            if not moniker.startswith("moniker://"):
-                moniker = f"moniker://{moniker}"
+            moniker = _ensure_uri(moniker)
 
             # Resolve moniker to source info
             resolved = self._resolve(moniker)
@@ -473,52 +795,45 @@ class MonikerClient:
 
     def describe(self, moniker: str) -> dict[str, Any]:
         """Get metadata about a moniker path."""
-        if not moniker.startswith("moniker://"):
-            moniker = f"moniker://{moniker}"
+        path = _strip_scheme(moniker)
 
-        path = moniker.replace("moniker://", "")
+        key = ("describe", path)
+        cached = self._meta_cache.get(key)
+        if cached is not None:
+            return cached
 
-        with httpx.Client(timeout=self.config.timeout) as client:
-            response = client.get(
-                f"{self.config.service_url}/describe/{path}",
-                headers=self._get_headers(),
-            )
-            if response.status_code == 404:
-                raise NotFoundError(f"Path not found: {path}")
-            response.raise_for_status()
-            return response.json()
+        response = self._request(
+            "GET",
+            f"/describe/{path}",
+        )
+        if response.status_code == 404:
+            raise NotFoundError(f"Path not found: {path}")
+        response.raise_for_status()
+        return self._meta_cache.put(key, _json_body(response))
 
     def list_children(self, moniker: str = "") -> list[str]:
         """List children of a moniker path."""
-        if moniker and not moniker.startswith("moniker://"):
-            moniker = f"moniker://{moniker}"
+        path = _strip_scheme(moniker)
 
-        path = moniker.replace("moniker://", "") if moniker else ""
-
-        with httpx.Client(timeout=self.config.timeout) as client:
-            response = client.get(
-                f"{self.config.service_url}/list/{path}",
-                headers=self._get_headers(),
-            )
-            response.raise_for_status()
-            return response.json().get("children", [])
+        response = self._request(
+            "GET",
+            f"/list/{path}",
+        )
+        response.raise_for_status()
+        return _json_body(response).get("children", [])
 
     def lineage(self, moniker: str) -> dict[str, Any]:
         """Get ownership lineage for a moniker path."""
-        if not moniker.startswith("moniker://"):
-            moniker = f"moniker://{moniker}"
+        path = _strip_scheme(moniker)
 
-        path = moniker.replace("moniker://", "")
-
-        with httpx.Client(timeout=self.config.timeout) as client:
-            response = client.get(
-                f"{self.config.service_url}/lineage/{path}",
-                headers=self._get_headers(),
-            )
-            if response.status_code == 404:
-                raise NotFoundError(f"Path not found: {path}")
-            response.raise_for_status()
-            return response.json()
+        response = self._request(
+            "GET",
+            f"/lineage/{path}",
+        )
+        if response.status_code == 404:
+            raise NotFoundError(f"Path not found: {path}")
+        response.raise_for_status()
+        return _json_body(response)
 
     def resolve(self, moniker: str) -> ResolvedSource:
         """
@@ -527,10 +842,26 @@ class MonikerClient:
         Usually you don't need this - use read() instead.
         This is useful if you want to manage the connection yourself.
         """
-        if not moniker.startswith("moniker://"):
-            moniker = f"moniker://{moniker}"
+        moniker = _ensure_uri(moniker)
         return self._resolve(moniker)
 
+    def invalidate_cache(self, moniker: str | None = None) -> None:
+        """
+        Drop cached resolutions and catalog results so the next call refetches.
+
+        Args:
+            moniker: Moniker path to evict (with or without scheme).
+                     Clears both caches if omitted.
+        """
+        if moniker is None:
+            self._cache.clear()
+            self._meta_cache.clear()
+            return
+        moniker = _ensure_uri(moniker)
+        self._cache.pop(moniker)
+        path = _strip_scheme(moniker)
+        self._meta_cache.discard(lambda k: k[1] == path)
+
     def batch_resolve(self, monikers: list[str]) -> dict[str, ResolvedSource]:
         """
         Resolve multiple monikers in a single call.
@@ -548,76 +879,41 @@ class MonikerClient:
         # Normalize monikers
         normalized = []
         for m in monikers:
-            if not m.startswith("moniker://"):
-                m = f"moniker://{m}"
+            m = _ensure_uri(m)
             normalized.append(m)
 
         # Check cache first, collect uncached
         uncached = []
         for m in normalized:
-            if self.config.cache_ttl > 0 and m in self._cache:
-                resolved, cached_at = self._cache[m]
-                if time.time() - cached_at < self.config.cache_ttl:
-                    results[m.replace("moniker://", "")] = resolved
-                    continue
-            uncached.append(m)
+            resolved = self._cache.get(m)
+            if resolved is not None:
+                results[_strip_scheme(m)] = resolved
+            else:
+                uncached.append(m)
 
         # Resolve uncached via batch endpoint
         if uncached:
             self._circuit_breaker.before_request()
             try:
-                paths = [m.replace("moniker://", "") for m in uncached]
-                with httpx.Client(timeout=self.config.timeout) as client:
-                    response = client.post(
-                        f"{self.config.service_url}/resolve/batch",
-                        headers=self._get_headers(),
-                        json={"monikers": [f"moniker://{p}" for p in paths]},
-                    )
-                    response.raise_for_status()
-                    data = response.json()
+                paths = [_strip_scheme(m) for m in uncached]
+                response = self._post_json(
+                    "/resolve/batch",
+                    {"monikers": [f"moniker://{p}" for p in paths]},
+                )
+                response.raise_for_status()
+                data = _json_body(response)
 
                 for item in data.get("results", []):
-                    resolved = ResolvedSource(
-                        moniker=item["moniker"],
-                        path=item["path"],
-                        source_type=item["source_type"],
-                        connection=item["connection"],
-                        query=item.get("query"),
-                        params=item.get("params", {}),
-                        schema_info=item.get("schema_info"),
-                        read_only=item.get("read_only", True),
-                        ownership=item.get("ownership", {}),
-                        binding_path=item.get("binding_path", ""),
-                        sub_path=item.get("sub_path"),
-                        status=item.get("status"),
-                        deprecation_message=item.get("deprecation_message"),
-                        successor=item.get("successor"),
-                        sunset_deadline=item.get("sunset_deadline"),
-                        migration_guide_url=item.get("migration_guide_url"),
-                        redirected_from=item.get("redirected_from"),
-                    )
+                    resolved = _resolved_from_dict(item)
                     path = item["path"]
                     results[path] = resolved
 
                     # Emit deprecation warnings (gated by feature toggle)
-                    if (getattr(self.config, 'deprecation_enabled', False)
-                            and resolved.is_deprecated
-                            and getattr(self.config, 'warn_on_deprecated', True)):
-                        msg = (
-                            f"Moniker '{resolved.path}' is deprecated."
-                            f"{' ' + resolved.deprecation_message if resolved.deprecation_message else ''}"
-                            f"{' Successor: ' + resolved.successor if resolved.successor else ''}"
-                        )
-                        warnings.warn(msg, DeprecationWarning, stacklevel=3)
-                        logging.getLogger("moniker_client").warning(msg)
-
-                        callback = getattr(self.config, 'deprecation_callback', None)
-                        if callback:
-                            callback(resolved.path, resolved.deprecation_message, resolved.successor)
+                    if self._warn_deprecated and resolved.is_deprecated:
+                        self._report_deprecation(resolved, stacklevel=2)
 
                     # Cache
-                    if self.config.cache_ttl > 0:
-                        self._cache[f"moniker://{path}"] = (resolved, time.time())
+                    self._cache.put(f"moniker://{path}", resolved)
 
                 self._circuit_breaker.on_success()
             except Exception as e:
@@ -630,7 +926,10 @@ class MonikerClient:
         """
         Read data for multiple monikers.
 
-        Resolves all monikers first (batched), then fetches data for each.
+        Resolves all monikers first (batched), then fetches data for each
+        on up to config.batch_concurrency worker threads, so blocking source
+        I/O overlaps instead of running back to back. Fetches through an
+        adapter that is not thread_safe run one at a time.
 
         Args:
             monikers: List of moniker paths
@@ -642,17 +941,167 @@ class MonikerClient:
         # Batch resolve
         resolved_map = self.batch_resolve(monikers)
 
-        results = {}
+        def fetch_one(resolved: ResolvedSource) -> Any:
+            adapter = get_adapter(resolved.source_type)
+            return adapter.fetch(resolved, self.config, **kwargs)
+
+        def fetch_serially(items: list[tuple[ResolvedSource, Future]]) -> None:
+            for resolved, future in items:
+                try:
+                    future.set_result(fetch_one(resolved))
+                except Exception as e:
+                    future.set_exception(e)
+
+        # Adapters that are not thread-safe get a single task running their
+        # fetches in order; the rest fan out across the pool
+        futures: dict[str, Future] = {}
+        serial: dict[int, list[tuple[ResolvedSource, Future]]] = {}
         for path, resolved in resolved_map.items():
             try:
                 adapter = get_adapter(resolved.source_type)
-                data = adapter.fetch(resolved, self.config, **kwargs)
-                results[path] = data
+            except ValueError:
+                adapter = None  # fetch_one raises it into this path's result
+            if adapter is None or adapter.thread_safe:
+                futures[path] = self._executor.submit(fetch_one, resolved)
+            else:
+                futures[path] = Future()
+                serial.setdefault(id(adapter), []).append((resolved, futures[path]))
+        for items in serial.values():
+            self._executor.submit(fetch_serially, items)
+
+        results = {}
+        for path, future in futures.items():
+            try:
+                results[path] = future.result()
             except Exception as e:
                 results[path] = e
 
         return results
 
+    async def abatch_read(self, monikers: list[str], **kwargs) -> dict[str, Any]:
+        """
+        Async variant of batch_read() that fetches all monikers concurrently.
+
+        Resolves all monikers first (batched), then runs every adapter's
+        afetch() at once with asyncio.gather(), so wall time is roughly the
+        slowest fetch rather than the sum. Adapters without a native async
+        path run their blocking fetch() in the default thread pool.
+
+        Args:
+            monikers: List of moniker paths
+            **kwargs: Additional parameters for adapters
+
+        Returns:
+            Dict mapping moniker path to data (or exception)
+        """
+        # Batch resolve
+        resolved_map = await asyncio.to_thread(self.batch_resolve, monikers)
+
+        async def fetch_one(resolved: ResolvedSource) -> Any:
+            adapter = get_adapter(resolved.source_type)
+            return await adapter.afetch(resolved, self.config, **kwargs)
+
+        outcomes = await asyncio.gather(
+            *(fetch_one(resolved) for resolved in resolved_map.values()),
+            return_exceptions=True,
+        )
+        return dict(zip(resolved_map, outcomes))
+
+    def batch_describe(self, monikers: list[str]) -> dict[str, dict[str, Any]]:
+        """
+        Describe multiple monikers in a single call.
+
+        Args:
+            monikers: List of moniker paths
+
+        Returns:
+            Dict mapping moniker path to its description (unknown paths omitted)
+        """
+        return self._batch_get("describe", monikers, self.describe, lambda item: item)
+
+    def batch_metadata(self, monikers: list[str]) -> dict[str, MetadataResult]:
+        """
+        Get rich metadata for multiple monikers in a single call.
+
+        Args:
+            monikers: List of moniker paths
+
+        Returns:
+            Dict mapping moniker path to MetadataResult (unknown paths omitted)
+        """
+        return self._batch_get("metadata", monikers, self.metadata, _metadata_from_dict)
+
+    def batch_sample(self, monikers: list[str], limit: int = 5) -> dict[str, SampleResult]:
+        """
+        Get sample data for multiple monikers in a single call.
+
+        Args:
+            monikers: List of moniker paths
+            limit: Number of sample rows per moniker (default: 5)
+
+        Returns:
+            Dict mapping moniker path to SampleResult (unknown paths omitted)
+        """
+        return self._batch_get(
+            "sample",
+            monikers,
+            lambda path: self.sample(path, limit=limit),
+            _sample_from_dict,
+            cache=False,
+            limit=limit,
+        )
+
+    def _batch_get(
+        self,
+        endpoint: str,
+        monikers: list[str],
+        get_one: Callable[[str], Any],
+        build: Callable[[dict[str, Any]], Any],
+        cache: bool = True,
+        **params: Any,
+    ) -> dict[str, Any]:
+        """
+        POST the uncached paths to /{endpoint}/batch and build typed results.
+
+        Paths already in the metadata cache are served from it, as
+        batch_resolve does for resolutions. Falls back to one GET per path if
+        the service has no batch route for this endpoint.
+        """
+        results: dict[str, Any] = {}
+        uncached = []
+        for m in monikers:
+            path = _strip_scheme(m)
+            cached = self._meta_cache.get((endpoint, path)) if cache else None
+            if cached is not None:
+                results[path] = cached
+            else:
+                uncached.append(path)
+
+        if not uncached:
+            return results
+
+        response = self._post_json(
+            f"/{endpoint}/batch",
+            {"paths": uncached, **params},
+        )
+
+        # Older services without the batch route
+        if response.status_code in (404, 405):
+            for path in uncached:
+                try:
+                    results[path] = get_one(path)
+                except NotFoundError:
+                    pass
+            return results
+
+        response.raise_for_status()
+        for item in _json_body(response).get("results", []):
+            value = build(item)
+            path = item["path"]
+            results[path] = self._meta_cache.put((endpoint, path), value) if cache else value
+
+        return results
+
     def fetch(
         self,
         moniker: str,
@@ -675,10 +1124,7 @@ class MonikerClient:
         Returns:
             pandas DataFrame with the fetched data
         """
-        if not moniker.startswith("moniker://"):
-            moniker = f"moniker://{moniker}"
-
-        path = moniker.replace("moniker://", "")
+        path = _strip_scheme(moniker)
 
         # Build query params
         query_params = {}
@@ -686,21 +1132,20 @@ class MonikerClient:
             query_params["limit"] = limit
         query_params.update(params)
 
-        with httpx.Client(timeout=self.config.timeout) as client:
-            response = client.get(
-                f"{self.config.service_url}/fetch/{path}",
-                headers=self._get_headers(),
-                params=query_params if query_params else None,
-            )
+        response = self._request(
+            "GET",
+            f"/fetch/{path}",
+            params=query_params if query_params else None,
+        )
 
-            if response.status_code == 404:
-                raise NotFoundError(f"Path not found: {path}")
-            if response.status_code == 403:
-                data = response.json()
-                raise AccessDeniedError(data.get("detail", "Access denied"))
-            response.raise_for_status()
+        if response.status_code == 404:
+            raise NotFoundError(f"Path not found: {path}")
+        if response.status_code == 403:
+            data = _json_body(response)
+            raise AccessDeniedError(data.get("detail", "Access denied"))
+        response.raise_for_status()
 
-            data = response.json()
+        data = _json_body(response)
 
         # Return DataFrame directly for simplicity
         try:
@@ -709,6 +1154,62 @@ class MonikerClient:
         except ImportError:
             raise ImportError("pandas is required for fetch(). Install with: pip install pandas")
 
+    def fetch_iter(
+        self,
+        moniker: str,
+        limit: int | None = None,
+        **params,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Stream rows from a server-side fetch without loading the whole response.
+
+        Rows are parsed incrementally from the response body as it arrives,
+        so memory stays flat regardless of result size and the first rows
+        can be processed before the server finishes sending. Requires ijson.
+
+        Args:
+            moniker: Moniker path (with or without scheme)
+            limit: Maximum rows to return (default: server-side limit)
+            **params: Additional query parameters
+
+        Yields:
+            One dict per row
+        """
+        try:
+            import ijson
+        except ImportError:
+            raise ImportError("ijson is required for fetch_iter(). Install with: pip install ijson")
+
+        path = _strip_scheme(moniker)
+
+        query_params = {}
+        if limit is not None:
+            query_params["limit"] = limit
+        query_params.update(params)
+
+        with self._http.stream(
+            "GET",
+            f"/fetch/{path}",
+            params=query_params if query_params else None,
+        ) as response:
+            if response.status_code == 404:
+                raise NotFoundError(f"Path not found: {path}")
+            if response.status_code == 403:
+                response.read()
+                raise AccessDeniedError(_json_body(response).get("detail", "Access denied"))
+            if response.status_code >= 400:
+                response.read()
+                response.raise_for_status()
+
+            rows = ijson.sendable_list()
+            parser = ijson.items_coro(rows, "data.item", use_float=True)
+            for chunk in response.iter_bytes(chunk_size=65536):
+                parser.send(chunk)
+                yield from rows
+                del rows[:]
+            parser.close()
+            yield from rows
+
     def metadata(self, moniker: str) -> MetadataResult:
         """
         Get rich metadata for AI/agent discoverability.
@@ -731,42 +1232,32 @@ class MonikerClient:
         Returns:
             MetadataResult with rich discovery metadata
         """
-        if not moniker.startswith("moniker://"):
-            moniker = f"moniker://{moniker}"
+        path = _strip_scheme(moniker)
+
+        key = ("metadata", path)
+        cached = self._meta_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # Concurrent callers all receive the one single-flight result, the
+        # cached object itself, so each takes its own copy of it
+        return copy.deepcopy(self._single_flight(key, self._fetch_metadata, key, path))
+
+    def _fetch_metadata(self, key: tuple, path: str) -> MetadataResult:
+        """Fetch metadata for a path from the service and cache it."""
+        response = self._request(
+            "GET",
+            f"/metadata/{path}",
+        )
 
-        path = moniker.replace("moniker://", "")
+        if response.status_code == 404:
+            raise NotFoundError(f"Path not found: {path}")
+        response.raise_for_status()
 
-        with httpx.Client(timeout=self.config.timeout) as client:
-            response = client.get(
-                f"{self.config.service_url}/metadata/{path}",
-                headers=self._get_headers(),
-            )
+        data = _json_body(response)
 
-            if response.status_code == 404:
-                raise NotFoundError(f"Path not found: {path}")
-            response.raise_for_status()
-
-            data = response.json()
-
-        return MetadataResult(
-            moniker=data["moniker"],
-            path=data["path"],
-            display_name=data.get("display_name"),
-            description=data.get("description"),
-            data_profile=data.get("data_profile"),
-            temporal_coverage=data.get("temporal_coverage"),
-            relationships=data.get("relationships"),
-            sample_data=data.get("sample_data"),
-            schema=data.get("schema"),
-            semantic_tags=data.get("semantic_tags", []),
-            data_quality=data.get("data_quality"),
-            ownership=data.get("ownership"),
-            documentation=data.get("documentation"),
-            query_patterns=data.get("query_patterns"),
-            cost_indicators=data.get("cost_indicators"),
-            nl_description=data.get("nl_description"),
-            use_cases=data.get("use_cases", []),
-        )
+        # Uncopied; metadata() copies it once per caller
+        return self._meta_cache.put(key, _metadata_from_dict(data), copy_out=False)
 
     def sample(self, moniker: str, limit: int = 5) -> SampleResult:
         """
@@ -785,32 +1276,21 @@ class MonikerClient:
         Returns:
             SampleResult with preview data
         """
-        if not moniker.startswith("moniker://"):
-            moniker = f"moniker://{moniker}"
+        path = _strip_scheme(moniker)
 
-        path = moniker.replace("moniker://", "")
+        response = self._request(
+            "GET",
+            f"/sample/{path}",
+            params={"limit": limit},
+        )
 
-        with httpx.Client(timeout=self.config.timeout) as client:
-            response = client.get(
-                f"{self.config.service_url}/sample/{path}",
-                headers=self._get_headers(),
-                params={"limit": limit},
-            )
+        if response.status_code == 404:
+            raise NotFoundError(f"Path not found: {path}")
+        response.raise_for_status()
 
-            if response.status_code == 404:
-                raise NotFoundError(f"Path not found: {path}")
-            response.raise_for_status()
-
-            data = response.json()
+        data = _json_body(response)
 
-        return SampleResult(
-            moniker=data["moniker"],
-            path=data["path"],
-            source_type=data["source_type"],
-            row_count=data["row_count"],
-            columns=data["columns"],
-            data=data["data"],
-        )
+        return _sample_from_dict(data)
 
     def tree(self, moniker: str = "", depth: int | None = None) -> TreeNode:
         """
@@ -823,36 +1303,26 @@ class MonikerClient:
         Returns:
             TreeNode representing the hierarchy with metadata
         """
-        if moniker and not moniker.startswith("moniker://"):
-            moniker = f"moniker://{moniker}"
+        path = _strip_scheme(moniker)
 
-        path = moniker.replace("moniker://", "") if moniker else ""
+        key = ("tree", path, depth)
+        cached = self._meta_cache.get(key)
+        if cached is not None:
+            return cached
 
         params = {}
         if depth is not None:
             params["depth"] = depth
 
-        with httpx.Client(timeout=self.config.timeout) as client:
-            response = client.get(
-                f"{self.config.service_url}/tree/{path}" if path else f"{self.config.service_url}/tree",
-                headers=self._get_headers(),
-                params=params if params else None,
-            )
-            response.raise_for_status()
-            data = response.json()
-
-        def build_tree(node_data: dict) -> TreeNode:
-            return TreeNode(
-                path=node_data["path"],
-                name=node_data["name"],
-                children=[build_tree(c) for c in node_data.get("children", [])],
-                ownership=node_data.get("ownership"),
-                source_type=node_data.get("source_type"),
-                has_source_binding=node_data.get("has_source_binding", False),
-                description=node_data.get("description"),
-            )
-
-        return build_tree(data)
+        response = self._request(
+            "GET",
+            f"/tree/{path}" if path else "/tree",
+            params=params if params else None,
+        )
+        response.raise_for_status()
+        data = _json_body(response)
+
+        return self._meta_cache.put(key, _tree_from_dict(data))
 
     def search(
         self,
@@ -871,24 +1341,28 @@ class MonikerClient:
         Returns:
             SearchResult with matching catalog entries
         """
+        key = ("search", None, query, status, limit)
+        cached = self._meta_cache.get(key)
+        if cached is not None:
+            return cached
+
         params: dict[str, Any] = {"q": query, "limit": limit}
         if status is not None:
             params["status"] = status
 
-        with httpx.Client(timeout=self.config.timeout) as client:
-            response = client.get(
-                f"{self.config.service_url}/catalog/search",
-                headers=self._get_headers(),
-                params=params,
-            )
-            response.raise_for_status()
-            data = response.json()
+        response = self._request(
+            "GET",
+            "/catalog/search",
+            params=params,
+        )
+        response.raise_for_status()
+        data = _json_body(response)
 
-        return SearchResult(
+        return self._meta_cache.put(key, SearchResult(
             query=query,
             total_results=data.get("total_results", len(data.get("results", []))),
             results=data.get("results", []),
-        )
+        ))
 
     def catalog_stats(self) -> CatalogStats:
         """
@@ -897,21 +1371,25 @@ class MonikerClient:
         Returns:
             CatalogStats with aggregate counts and coverage metrics
         """
-        with httpx.Client(timeout=self.config.timeout) as client:
-            response = client.get(
-                f"{self.config.service_url}/catalog/stats",
-                headers=self._get_headers(),
-            )
-            response.raise_for_status()
-            data = response.json()
-
-        return CatalogStats(
+        key = ("catalog_stats", None)
+        cached = self._meta_cache.get(key)
+        if cached is not None:
+            return cached
+
+        response = self._request(
+            "GET",
+            "/catalog/stats",
+        )
+        response.raise_for_status()
+        data = _json_body(response)
+
+        return self._meta_cache.put(key, CatalogStats(
             total_monikers=data.get("total_monikers", 0),
             by_status=data.get("by_status", {}),
             by_source_type=data.get("by_source_type", {}),
             by_classification=data.get("by_classification", {}),
             ownership_coverage=data.get("ownership_coverage", 0.0),
-        )
+        ))
 
     def schema(self, moniker: str) -> SchemaInfo:
         """
@@ -943,72 +1421,68 @@ class MonikerClient:
     def _resolve(self, moniker: str) -> ResolvedSource:
         """Internal resolve with caching, retry, and circuit breaker."""
         # Check cache
-        if self.config.cache_ttl > 0 and moniker in self._cache:
-            resolved, cached_at = self._cache[moniker]
-            if time.time() - cached_at < self.config.cache_ttl:
-                return resolved
+        resolved = self._cache.get(moniker)
+        if resolved is not None:
+            return resolved
 
-        path = moniker.replace("moniker://", "")
+        return self._single_flight(moniker, self._fetch_resolution, moniker)
+
+    def _single_flight(self, key: Any, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Call fn(*args) once for concurrent callers sharing key.
+
+        The first caller runs fn; the rest wait on its future and receive the
+        same result or exception instead of sending duplicate requests.
+        """
+        with self._inflight_lock:
+            pending = self._inflight.get(key)
+            if pending is None:
+                self._inflight[key] = future = Future()
+        if pending is not None:
+            return pending.result()
+
+        try:
+            result = fn(*args)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+
+    def _fetch_resolution(self, moniker: str) -> ResolvedSource:
+        """Resolve a moniker through the service and cache the result."""
+        path = _strip_scheme(moniker)
 
         self._circuit_breaker.before_request()
         try:
             def _do_resolve():
-                with httpx.Client(timeout=self.config.timeout) as client:
-                    response = client.get(
-                        f"{self.config.service_url}/resolve/{path}",
-                        headers=self._get_headers(),
-                    )
+                response = self._request(
+                    "GET",
+                    f"/resolve/{path}",
+                )
 
-                    if response.status_code == 404:
-                        raise NotFoundError(f"No source binding for: {path}")
+                if response.status_code == 404:
+                    raise NotFoundError(f"No source binding for: {path}")
 
-                    if response.status_code != 200:
-                        raise ResolutionError(f"Resolution failed: {response.text}")
+                if response.status_code != 200:
+                    raise ResolutionError(f"Resolution failed: {response.text}")
 
-                    return response.json()
+                return _json_body(response)
 
             data = retry_with_backoff(_do_resolve, self._retry_config)
 
-            resolved = ResolvedSource(
-                moniker=data["moniker"],
-                path=data["path"],
-                source_type=data["source_type"],
-                connection=data["connection"],
-                query=data.get("query"),
-                params=data.get("params", {}),
-                schema_info=data.get("schema_info"),
-                read_only=data.get("read_only", True),
-                ownership=data.get("ownership", {}),
-                binding_path=data.get("binding_path", ""),
-                sub_path=data.get("sub_path"),
-                status=data.get("status"),
-                deprecation_message=data.get("deprecation_message"),
-                successor=data.get("successor"),
-                sunset_deadline=data.get("sunset_deadline"),
-                migration_guide_url=data.get("migration_guide_url"),
-                redirected_from=data.get("redirected_from"),
-            )
+            resolved = _resolved_from_dict(data)
 
             # Emit deprecation warnings if applicable (gated by feature toggle)
-            if (getattr(self.config, 'deprecation_enabled', False)
-                    and resolved.is_deprecated
-                    and getattr(self.config, 'warn_on_deprecated', True)):
-                msg = (
-                    f"Moniker '{resolved.path}' is deprecated."
-                    f"{' ' + resolved.deprecation_message if resolved.deprecation_message else ''}"
-                    f"{' Successor: ' + resolved.successor if resolved.successor else ''}"
-                )
-                warnings.warn(msg, DeprecationWarning, stacklevel=3)
-                logging.getLogger("moniker_client").warning(msg)
-
-                # Invoke callback if configured
-                callback = getattr(self.config, 'deprecation_callback', None)
-                if callback:
-                    callback(resolved.path, resolved.deprecation_message, resolved.successor)
+            if self._warn_deprecated and resolved.is_deprecated:
+                self._report_deprecation(resolved, stacklevel=5)
 
             # Cache
-            if self.config.cache_ttl > 0:
-                self._cache[moniker] = (resolved, time.time())
+            self._cache.put(moniker, resolved)
 
             self._circuit_breaker.on_success()
             return resolved
@@ -1018,20 +1492,70 @@ class MonikerClient:
             self._circuit_breaker.on_failure()
             raise
 
+    def _report_deprecation(self, resolved: ResolvedSource, stacklevel: int) -> None:
+        """Warn, log and invoke the configured callback for a deprecated moniker."""
+        msg = (
+            f"Moniker '{resolved.path}' is deprecated."
+            f"{' ' + resolved.deprecation_message if resolved.deprecation_message else ''}"
+            f"{' Successor: ' + resolved.successor if resolved.successor else ''}"
+        )
+        warnings.warn(msg, DeprecationWarning, stacklevel=stacklevel + 1)
+        logger.warning(msg)
+
+        # Invoke callback if configured
+        callback = getattr(self.config, 'deprecation_callback', None)
+        if callback:
+            callback(resolved.path, resolved.deprecation_message, resolved.successor)
+
     def _get_headers(self) -> dict[str, str]:
-        """Build request headers including authentication."""
+        """
+        Build request headers including authentication.
+
+        Only called when the pooled client is created and from _refresh_auth(),
+        never per request.
+        """
         headers = {}
         if self.config.app_id:
             headers["X-App-ID"] = self.config.app_id
         if self.config.team:
             headers["X-Team"] = self.config.team
 
-        # Add authentication headers
-        auth_headers = get_auth_headers(self.config)
-        headers.update(auth_headers)
+        # Add authentication headers, unless _sign_request() adds them per request
+        if self.config.auth_method not in PER_REQUEST_AUTH_METHODS:
+            headers.update(get_auth_headers(self.config))
 
         return headers
 
+    def _sign_request(self, request: httpx.Request) -> httpx.Request:
+        """Add a freshly built auth header to a single request."""
+        request.headers.update(get_auth_headers(self.config))
+        return request
+
+    def _refresh_auth(self) -> None:
+        """Rebuild the pooled client's headers with freshly issued credentials."""
+        clear_auth_cache()
+        self._http.headers.update(self._get_headers())
+
+    def _request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a service request, refreshing auth and retrying once on 401."""
+        response = self._http.request(method, url, **kwargs)
+        if response.status_code == 401 and self.config.auth_method:
+            self._refresh_auth()
+            response = self._http.request(method, url, **kwargs)
+        return response
+
+    def _post_json(self, url: str, body: Any, **kwargs: Any) -> httpx.Response:
+        """POST body as JSON, encoded by orjson when it is installed."""
+        if orjson is None:
+            return self._request("POST", url, json=body, **kwargs)
+        return self._request(
+            "POST",
+            url,
+            content=orjson.dumps(body),
+            headers={"Content-Type": "application/json"},
+            **kwargs,
+        )
+
     def _report_telemetry(
         self,
         moniker: str,
@@ -1043,27 +1567,74 @@ class MonikerClient:
         deprecated: bool = False,
         successor: str | None = None,
     ) -> None:
-        """Report access telemetry back to the service."""
+        """
+        Queue access telemetry for the service.
+
+        Records are posted in bulk once telemetry_batch_size are buffered
+        (on a worker thread, off the read path) or after
+        telemetry_flush_interval seconds, whichever comes first.
+        """
+        record = {
+            "moniker": moniker,
+            "outcome": outcome,
+            "latency_ms": latency_ms,
+            "source_type": source_type,
+            "row_count": row_count,
+            "error_message": error_message,
+            "deprecated": deprecated,
+            "successor": successor,
+        }
         try:
-            with httpx.Client(timeout=5) as client:
-                client.post(
-                    f"{self.config.service_url}/telemetry/access",
-                    headers=self._get_headers(),
-                    json={
-                        "moniker": moniker,
-                        "outcome": outcome,
-                        "latency_ms": latency_ms,
-                        "source_type": source_type,
-                        "row_count": row_count,
-                        "error_message": error_message,
-                        "deprecated": deprecated,
-                        "successor": successor,
-                    },
-                )
+            with self._telemetry_lock:
+                self._telemetry.append(record)
+                full = len(self._telemetry) >= self.config.telemetry_batch_size
+                if not full and self._telemetry_timer is None:
+                    timer = threading.Timer(self.config.telemetry_flush_interval, self.flush_telemetry)
+                    timer.daemon = True
+                    timer.start()
+                    self._telemetry_timer = timer
+            if full:
+                self._executor.submit(self.flush_telemetry)
         except Exception:
             # Don't fail the read because telemetry failed
             pass
 
+    def flush_telemetry(self) -> None:
+        """Post all buffered telemetry records to the service now."""
+        with self._telemetry_lock:
+            if self._telemetry_timer is not None:
+                self._telemetry_timer.cancel()
+                self._telemetry_timer = None
+            records = list(self._telemetry)
+            self._telemetry.clear()
+        if not records:
+            return
+
+        try:
+            if self._telemetry_batch_supported:
+                response = self._post_json(
+                    "/telemetry/access/batch", {"events": records}, timeout=5
+                )
+                if response.status_code not in (404, 405):
+                    return
+                # Older service without the batch route; stop asking for it
+                self._telemetry_batch_supported = False
+            for record in records:
+                self._post_json("/telemetry/access", record, timeout=5)
+        except Exception:
+            # Telemetry is best effort
+            pass
+
+
+# Clients that may hold unsent telemetry, flushed at interpreter exit
+_telemetry_clients: weakref.WeakValueDictionary[int, MonikerClient] = weakref.WeakValueDictionary()
+
+
+@atexit.register
+def _flush_all_telemetry() -> None:
+    for client in list(_telemetry_clients.values()):
+        client.flush_telemetry()
+
 
 # Module-level default client
 _default_client: MonikerClient | None = None
@@ -1074,6 +1645,7 @@ def _get_client() -> MonikerClient:
     global _default_client
     if _default_client is None:
         _default_client = MonikerClient(config=ClientConfig.load())
+        atexit.register(_default_client.close)
     return _default_client
 
 
@@ -7,6 +7,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+import yaml
+
 # Config file search paths (in order of precedence, last wins)
 CONFIG_SEARCH_PATHS = [
     Path.home() / ".moniker" / "client.yaml",  # User-level defaults
@@ -44,15 +46,46 @@ class ClientConfig:
         default_factory=lambda: float(os.environ.get("MONIKER_TIMEOUT", "30"))
     )
 
+    # Multiplex service calls over one HTTP/2 connection (needs the "http2" extra)
+    http2: bool = field(
+        default_factory=lambda: os.environ.get("MONIKER_HTTP2", "false").lower() == "true"
+    )
+
     # Report telemetry back to service
     report_telemetry: bool = field(
         default_factory=lambda: os.environ.get("MONIKER_REPORT_TELEMETRY", "true").lower() == "true"
     )
+    # Telemetry records buffered per bulk post (1 = post after every read)
+    telemetry_batch_size: int = field(
+        default_factory=lambda: int(os.environ.get("MONIKER_TELEMETRY_BATCH_SIZE", "50"))
+    )
+    # Seconds a buffered telemetry record may wait before it is posted
+    telemetry_flush_interval: float = field(
+        default_factory=lambda: float(os.environ.get("MONIKER_TELEMETRY_FLUSH_INTERVAL", "2.0"))
+    )
 
     # Cache resolved connections locally (seconds, 0 = disabled)
     cache_ttl: float = field(
         default_factory=lambda: float(os.environ.get("MONIKER_CACHE_TTL", "60"))
     )
+    # Maximum cached resolutions before least-recently-used are evicted
+    max_cache_entries: int = field(
+        default_factory=lambda: int(os.environ.get("MONIKER_CACHE_SIZE", "1024"))
+    )
+
+    # Cache describe/metadata/tree/search/stats results locally (seconds, 0 = disabled)
+    meta_cache_ttl: float = field(
+        default_factory=lambda: float(os.environ.get("MONIKER_META_CACHE_TTL", "60"))
+    )
+    # Maximum cached metadata results before least-recently-used are evicted
+    max_meta_cache_size: int = field(
+        default_factory=lambda: int(os.environ.get("MONIKER_META_CACHE_SIZE", "1024"))
+    )
+
+    # Worker threads used by batch_read() to fetch from sources concurrently
+    batch_concurrency: int = field(
+        default_factory=lambda: int(os.environ.get("MONIKER_BATCH_CONCURRENCY", "16"))
+    )
 
     # Authentication method: "kerberos", "jwt", or None
     auth_method: str | None = field(
@@ -118,10 +151,19 @@ class ClientConfig:
     retry_backoff_factor: float = field(
         default_factory=lambda: float(os.environ.get("MONIKER_RETRY_BACKOFF_FACTOR", "0.5"))
     )
-    retry_status_codes: tuple[int, ...] = field(
-        default_factory=lambda: (502, 503, 504)
+    # Upper bound (seconds) for a single jittered backoff sleep
+    retry_max_delay: float = field(
+        default_factory=lambda: float(os.environ.get("MONIKER_RETRY_MAX_DELAY", "15"))
+    )
+    # Checked on every attempt; any iterable passed in is frozen to a frozenset
+    retry_status_codes: frozenset[int] = field(
+        default_factory=lambda: frozenset({502, 503, 504})
     )
 
+    def __post_init__(self) -> None:
+        if not isinstance(self.retry_status_codes, frozenset):
+            self.retry_status_codes = frozenset(self.retry_status_codes)
+
     def get_credential(self, source_type: str, key: str) -> str | None:
         """Get a credential for a source type."""
         # Check specific attributes first
@@ -154,8 +196,15 @@ class ClientConfig:
             app_id=data.get("app_id", os.environ.get("MONIKER_APP_ID")),
             team=data.get("team", os.environ.get("MONIKER_TEAM")),
             timeout=float(data.get("timeout", os.environ.get("MONIKER_TIMEOUT", "30"))),
+            http2=data.get("http2", os.environ.get("MONIKER_HTTP2", "false").lower() == "true"),
             report_telemetry=data.get("report_telemetry", os.environ.get("MONIKER_REPORT_TELEMETRY", "true").lower() == "true"),
+            telemetry_batch_size=int(data.get("telemetry_batch_size", os.environ.get("MONIKER_TELEMETRY_BATCH_SIZE", "50"))),
+            telemetry_flush_interval=float(data.get("telemetry_flush_interval", os.environ.get("MONIKER_TELEMETRY_FLUSH_INTERVAL", "2.0"))),
             cache_ttl=float(data.get("cache_ttl", os.environ.get("MONIKER_CACHE_TTL", "60"))),
+            max_cache_entries=int(data.get("max_cache_entries", os.environ.get("MONIKER_CACHE_SIZE", "1024"))),
+            meta_cache_ttl=float(data.get("meta_cache_ttl", os.environ.get("MONIKER_META_CACHE_TTL", "60"))),
+            max_meta_cache_size=int(data.get("max_meta_cache_size", os.environ.get("MONIKER_META_CACHE_SIZE", "1024"))),
+            batch_concurrency=int(data.get("batch_concurrency", os.environ.get("MONIKER_BATCH_CONCURRENCY", "16"))),
             auth_method=data.get("auth_method", os.environ.get("MONIKER_AUTH_METHOD")),
             kerberos_service_principal=data.get("kerberos_service_principal", os.environ.get("MONIKER_SERVICE_PRINCIPAL")),
             jwt_token=data.get("jwt_token"),
@@ -169,15 +218,14 @@ class ClientConfig:
             credentials=data.get("credentials", {}),
             retry_max_attempts=int(data.get("retry_max_attempts", os.environ.get("MONIKER_RETRY_MAX_ATTEMPTS", "3"))),
             retry_backoff_factor=float(data.get("retry_backoff_factor", os.environ.get("MONIKER_RETRY_BACKOFF_FACTOR", "0.5"))),
+            retry_max_delay=float(data.get("retry_max_delay", os.environ.get("MONIKER_RETRY_MAX_DELAY", "15"))),
+            retry_status_codes=frozenset(data.get("retry_status_codes", (502, 503, 504))),
         )
 
     @classmethod
     def from_yaml(cls, path: str | Path) -> ClientConfig:
         """Load config from YAML file."""
-        import yaml
-        with open(path, "r") as f:
-            data = yaml.safe_load(f)
-        return cls.from_dict(data or {})
+        return cls.from_dict(_read_yaml(path))
 
     @classmethod
     def load(cls, config_file: str | Path | None = None) -> ClientConfig:
@@ -195,16 +243,16 @@ class ClientConfig:
         # Load from default paths
         for path in CONFIG_SEARCH_PATHS:
             if path.exists():
-                import yaml
-                with open(path, "r") as f:
-                    data = yaml.safe_load(f) or {}
-                merged.update(data)
+                merged.update(_read_yaml(path))
 
         # Load explicit config file
         if config_file:
-            import yaml
-            with open(config_file, "r") as f:
-                data = yaml.safe_load(f) or {}
-            merged.update(data)
+            merged.update(_read_yaml(config_file))
 
         return cls.from_dict(merged)
+
+
+def _read_yaml(path: str | Path) -> dict[str, Any]:
+    """Parse a YAML config file; an empty file gives an empty dict."""
+    with open(path, "r") as f:
+        return yaml.safe_load(f) or {}
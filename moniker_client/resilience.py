@@ -3,15 +3,27 @@
 from __future__ import annotations
 
 import logging
+import random
 import time
 import threading
 from dataclasses import dataclass, field
-from typing import TypeVar, Callable, Any
+from typing import TypeVar, Callable, Any, Literal
+
+import httpx
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Transport failures worth retrying; httpx.ConnectError is a NetworkError
+RETRYABLE_EXC_TYPES: tuple[type[BaseException], ...] = (
+    httpx.TimeoutException,
+    httpx.NetworkError,
+    httpx.RemoteProtocolError,
+    ConnectionError,
+    TimeoutError,
+)
+
 
 class RetryExhausted(Exception):
     """All retry attempts failed."""
@@ -28,6 +40,25 @@ class RetryConfig:
     max_delay_seconds: float = 30.0
     exponential_base: float = 2.0
     retryable_status_codes: frozenset[int] = frozenset({429, 502, 503, 504})
+    # "equal": exponential delay +/-25%; "full": uniform(0, exponential delay);
+    # "decorrelated": uniform(base, 3 * previous delay), so clients drift apart
+    jitter_mode: Literal["equal", "full", "decorrelated"] = "decorrelated"
+
+
+def _next_delay(config: RetryConfig, attempt: int, previous: float) -> float:
+    """Seconds to sleep before retry number attempt + 1."""
+    if config.jitter_mode == "decorrelated":
+        return min(
+            config.max_delay_seconds,
+            random.uniform(config.base_delay_seconds, previous * 3),
+        )
+    delay = min(
+        config.base_delay_seconds * (config.exponential_base ** attempt),
+        config.max_delay_seconds,
+    )
+    if config.jitter_mode == "full":
+        return random.uniform(0, delay)
+    return min(delay * (0.75 + random.random() * 0.5), config.max_delay_seconds)
 
 
 def retry_with_backoff(
@@ -54,6 +85,7 @@ def retry_with_backoff(
         config = RetryConfig()
 
     last_exception: Exception | None = None
+    delay = config.base_delay_seconds
 
     for attempt in range(config.max_retries + 1):
         try:
@@ -61,30 +93,18 @@ def retry_with_backoff(
         except Exception as e:
             last_exception = e
 
-            # Check if this is a retryable error
-            is_retryable = False
-
-            # httpx status code errors
-            if hasattr(e, 'response') and hasattr(e.response, 'status_code'):
-                if e.response.status_code in config.retryable_status_codes:
-                    is_retryable = True
-
-            # Connection errors are always retryable
-            error_type = type(e).__name__
-            if any(t in error_type for t in ('Connection', 'Timeout', 'Network')):
-                is_retryable = True
+            # Connection errors are always retryable, httpx status errors
+            # only for the configured status codes
+            is_retryable = isinstance(e, RETRYABLE_EXC_TYPES) or (
+                getattr(getattr(e, "response", None), "status_code", None)
+                in config.retryable_status_codes
+            )
 
             if not is_retryable or attempt == config.max_retries:
                 raise
 
             # Calculate delay with exponential backoff + jitter
-            delay = min(
-                config.base_delay_seconds * (config.exponential_base ** attempt),
-                config.max_delay_seconds,
-            )
-            # Add jitter (up to 25% of delay)
-            import random
-            delay *= (0.75 + random.random() * 0.5)
+            delay = _next_delay(config, attempt, delay)
 
             logger.warning(
                 f"Retry {attempt + 1}/{config.max_retries} after {delay:.1f}s: {e}"
@@ -122,6 +142,11 @@ class ClientCircuitBreaker:
 
     def before_request(self) -> None:
         """Check circuit state before making a request."""
+        # Unlocked read: attribute loads are atomic, and at worst one request
+        # slips through while another thread is opening the circuit
+        if self._state == ClientCircuitState.CLOSED:
+            return
+
         with self._lock:
             if self._state == ClientCircuitState.CLOSED:
                 return
@@ -138,6 +163,10 @@ class ClientCircuitBreaker:
 
     def on_success(self) -> None:
         """Record successful request."""
+        # Nothing to reset in the common closed, no-recent-failures case
+        if self._state == ClientCircuitState.CLOSED and not self._failure_count:
+            return
+
         with self._lock:
             if self._state == ClientCircuitState.HALF_OPEN:
                 self._success_count += 1
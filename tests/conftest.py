@@ -50,11 +50,16 @@ class MockClientConfig:
     # Retry configuration
     retry_max_attempts: int = 3
     retry_backoff_factor: float = 0.5
-    retry_status_codes: tuple[int, ...] = (502, 503, 504)
+    retry_max_delay: float = 15.0
+    retry_status_codes: frozenset[int] = frozenset({502, 503, 504})
 
     # Other settings
     cache_ttl: float = 60.0
+    max_cache_entries: int = 1024
+    batch_concurrency: int = 16
     report_telemetry: bool = False
+    telemetry_batch_size: int = 50
+    telemetry_flush_interval: float = 2.0
 
     def get_credential(self, source_type: str, key: str) -> str | None:
         """Get a credential for a source type."""
@@ -174,7 +179,11 @@ def mock_oracle_cursor():
     ):
         cursor = MagicMock()
         cursor.description = [(col, None, None, None, None, None, None) for col in (columns or [])]
-        cursor.fetchall.return_value = rows or []
+        # Like oracledb, fetchall() applies cursor.rowfactory when one is set
+        cursor.rowfactory = None
+        cursor.fetchall.side_effect = lambda: [
+            cursor.rowfactory(*row) if cursor.rowfactory else row for row in rows or []
+        ]
         return cursor
     return _factory
 
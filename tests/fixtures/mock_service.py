@@ -108,6 +108,15 @@ class MockMonikerService:
             if re.match(pattern, path):
                 return handler(request)
 
+        # /resolve/batch - unknown monikers are omitted from results
+        if path == "/resolve/batch" and method == "POST":
+            monikers = json.loads(request.content)["monikers"]
+            paths = [m.replace("moniker://", "") for m in monikers]
+            return httpx.Response(
+                200,
+                json={"results": [self.resolutions[p] for p in paths if p in self.resolutions]},
+            )
+
         # /resolve/{path}
         if match := re.match(r"/resolve/(.+)", path):
             moniker_path = match.group(1)
@@ -172,8 +181,8 @@ class MockMonikerService:
                 },
             )
 
-        # /telemetry/access - always accept
-        if path == "/telemetry/access":
+        # /telemetry/access and /telemetry/access/batch - always accept
+        if path in ("/telemetry/access", "/telemetry/access/batch"):
             return httpx.Response(200, json={"status": "ok"})
 
         # Default 404
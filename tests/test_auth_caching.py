@@ -0,0 +1,152 @@
+"""Unit tests for the Kerberos and JWT caches in moniker_client.auth."""
+
+from __future__ import annotations
+
+import os
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from moniker_client import MonikerClient
+from moniker_client import auth
+from moniker_client.auth import ClientAuth
+from moniker_client.config import ClientConfig
+
+from tests.fixtures.mock_service import create_mock_service_for_integration
+
+
+@pytest.fixture
+def mock_gssapi():
+    """gssapi stand-in whose security contexts each step a distinct token."""
+    gssapi = MagicMock()
+    gssapi.Credentials.return_value.lifetime = 3600
+    tokens = iter(b"token-%d" % i for i in range(100))
+    gssapi.SecurityContext.side_effect = lambda **kwargs: MagicMock(
+        step=MagicMock(return_value=next(tokens))
+    )
+    with patch.object(auth, "gssapi", gssapi), patch.object(auth, "GSSAPI_AVAILABLE", True):
+        yield gssapi
+
+
+def kerberos_config(principal: str = "HTTP/moniker@EXAMPLE.COM") -> ClientConfig:
+    return ClientConfig(
+        service_url="http://mock",
+        auth_method="kerberos",
+        kerberos_service_principal=principal,
+        report_telemetry=False,
+    )
+
+
+class TestKerberosCache:
+    """Tests for Kerberos credential caching."""
+
+    def test_token_stepped_per_call_credentials_reused(self, mock_gssapi):
+        """Test each call gets a fresh token while credentials are acquired once."""
+        client_auth = ClientAuth()
+        config = kerberos_config()
+
+        first = client_auth.get_auth_headers(config)
+        second = client_auth.get_auth_headers(config)
+
+        assert first["Authorization"].startswith("Negotiate ")
+        assert first != second
+        assert mock_gssapi.SecurityContext.call_count == 2
+        mock_gssapi.Credentials.assert_called_once_with(usage="initiate")
+
+    def test_credentials_reacquired_after_ttl(self, mock_gssapi):
+        """Test credentials are acquired again once the cache TTL has passed."""
+        client_auth = ClientAuth()
+        config = kerberos_config()
+
+        with patch.object(auth.time, "monotonic", side_effect=[0.0, 100.0, 301.0]):
+            client_auth.get_auth_headers(config)
+            client_auth.get_auth_headers(config)
+            assert mock_gssapi.Credentials.call_count == 1
+            client_auth.get_auth_headers(config)
+
+        assert mock_gssapi.Credentials.call_count == 2
+
+    def test_short_credential_lifetime_caps_ttl(self, mock_gssapi):
+        """Test credentials expiring sooner than the TTL are not reused past expiry."""
+        mock_gssapi.Credentials.return_value.lifetime = 60
+        client_auth = ClientAuth()
+        config = kerberos_config()
+
+        with patch.object(auth.time, "monotonic", side_effect=[0.0, 61.0]):
+            client_auth.get_auth_headers(config)
+            client_auth.get_auth_headers(config)
+
+        assert mock_gssapi.Credentials.call_count == 2
+
+    def test_principal_change_rebuilds_name(self, mock_gssapi):
+        """Test a different service principal is not served the cached target name."""
+        client_auth = ClientAuth()
+
+        client_auth.get_auth_headers(kerberos_config("HTTP/a@EXAMPLE.COM"))
+        client_auth.get_auth_headers(kerberos_config("HTTP/b@EXAMPLE.COM"))
+
+        names = [c.args[0] for c in mock_gssapi.Name.call_args_list]
+        assert names == ["HTTP/a@EXAMPLE.COM", "HTTP/b@EXAMPLE.COM"]
+
+    def test_clear_cache_forces_reacquire(self, mock_gssapi):
+        """Test clear_cache drops the cached credentials."""
+        client_auth = ClientAuth()
+        config = kerberos_config()
+
+        client_auth.get_auth_headers(config)
+        client_auth.clear_cache()
+        client_auth.get_auth_headers(config)
+
+        assert mock_gssapi.Credentials.call_count == 2
+
+    def test_client_signs_each_request(self, mock_gssapi):
+        """Test MonikerClient sends a different Negotiate token on every request."""
+        mock_svc = create_mock_service_for_integration()
+        seen = []
+
+        def describe(request):
+            seen.append(request.headers.get("Authorization"))
+            return httpx.Response(200, json=mock_svc.descriptions["test/data"])
+
+        mock_svc.add_custom_handler(r"/describe/", describe)
+
+        with mock_svc.patch_httpx():
+            with MonikerClient(config=kerberos_config()) as client:
+                assert "Authorization" not in client._http.headers
+                client._request("GET", "/describe/test/data")
+                client._request("GET", "/describe/test/data")
+
+        assert len(seen) == 2
+        assert all(h.startswith("Negotiate ") for h in seen)
+        assert seen[0] != seen[1]
+
+
+class TestJWTFileCache:
+    """Tests for JWT token file caching."""
+
+    def test_file_read_once_while_unchanged(self, tmp_path):
+        """Test the token file is not re-read while its mtime is unchanged."""
+        token_file = tmp_path / "token"
+        token_file.write_text("first\n")
+        config = ClientConfig(auth_method="jwt", jwt_token_env="", jwt_token_file=str(token_file))
+        client_auth = ClientAuth()
+
+        assert client_auth.get_auth_headers(config)["Authorization"] == "Bearer first"
+        with patch("builtins.open", side_effect=AssertionError("re-read")):
+            assert client_auth.get_auth_headers(config)["Authorization"] == "Bearer first"
+
+    def test_file_rewrite_picked_up(self, tmp_path):
+        """Test a rewritten token file is read again on the next call."""
+        token_file = tmp_path / "token"
+        token_file.write_text("first\n")
+        config = ClientConfig(auth_method="jwt", jwt_token_env="", jwt_token_file=str(token_file))
+        client_auth = ClientAuth()
+
+        assert client_auth.get_auth_headers(config)["Authorization"] == "Bearer first"
+
+        mtime_ns = os.stat(token_file).st_mtime_ns
+        token_file.write_text("second\n")
+        os.utime(token_file, ns=(mtime_ns + 1_000_000_000, mtime_ns + 1_000_000_000))
+
+        assert client_auth.get_auth_headers(config)["Authorization"] == "Bearer second"
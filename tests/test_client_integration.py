@@ -7,6 +7,7 @@ Tests the full client flow: resolution -> adapter -> data
 from __future__ import annotations
 
 import time
+import warnings
 from unittest.mock import MagicMock, patch
 
 import httpx
@@ -82,6 +83,19 @@ class TestMonikerClientFetch:
             with pytest.raises(NotFoundError):
                 client.fetch("nonexistent/path")
 
+    def test_fetch_iter_streams_rows(self):
+        """Test fetch_iter yields the fetched rows one dict at a time."""
+        pytest.importorskip("ijson")
+        mock_svc = create_mock_service_for_integration()
+
+        with mock_svc.patch_httpx():
+            client = MonikerClient(config=ClientConfig(service_url="http://mock"))
+            rows = list(client.fetch_iter("test/data"))
+            with pytest.raises(NotFoundError):
+                list(client.fetch_iter("nonexistent/path"))
+
+        assert rows == mock_svc.fetches["test/data"]["data"]
+
 
 class TestMonikerClientMetadata:
     """Test client metadata() endpoint."""
@@ -133,6 +147,24 @@ class TestMonikerClientSample:
             with pytest.raises(NotFoundError):
                 client.sample("nonexistent/path")
 
+    def test_sample_to_arrow_is_columnar(self):
+        """Test to_arrow builds a table with the result's column order."""
+        pa = pytest.importorskip("pyarrow")
+        result = SampleResult(
+            moniker="moniker://test/data",
+            path="test/data",
+            source_type="static",
+            row_count=2,
+            columns=["value", "id"],
+            data=[{"id": 1, "value": 1.5}, {"id": 2, "value": None}],
+        )
+
+        table = result.to_arrow()
+
+        assert isinstance(table, pa.Table)
+        assert table.column_names == ["value", "id"]
+        assert table.to_pydict() == {"value": [1.5, None], "id": [1, 2]}
+
 
 class TestMonikerClientTree:
     """Test client tree() endpoint."""
@@ -161,6 +193,28 @@ class TestMonikerClientTree:
         assert isinstance(result, TreeNode)
         assert result.children == []
 
+    def test_tree_from_dict_deep_and_ordered(self):
+        """Test deep trees build without recursion and keep child order."""
+        from moniker_client.client import _tree_from_dict
+
+        data = {"path": "root", "name": "root", "children": [
+            {"path": "root/a", "name": "a"},
+            {"path": "root/b", "name": "b"},
+        ]}
+        leaf = data["children"][0]
+        for i in range(5000):
+            child = {"path": f"deep/{i}", "name": str(i)}
+            leaf["children"] = [child]
+            leaf = child
+
+        result = _tree_from_dict(data)
+
+        assert [c.name for c in result.children] == ["a", "b"]
+        node, depth = result.children[0], 0
+        while node.children:
+            node, depth = node.children[0], depth + 1
+        assert depth == 5000
+
 
 class TestMonikerClientListChildren:
     """Test client list_children() endpoint."""
@@ -210,6 +264,36 @@ class TestMonikerClientResolve:
             with pytest.raises(NotFoundError):
                 client.resolve("nonexistent/path")
 
+    @pytest.mark.parametrize("enabled", [True, False])
+    def test_resolve_deprecated_warns_when_enabled(self, enabled):
+        """Test deprecated monikers warn at the caller and run the callback."""
+        mock_svc = create_mock_service_for_integration()
+        mock_svc.add_resolution(
+            "test/old",
+            {**mock_svc.resolutions["test/data"], "moniker": "moniker://test/old",
+             "path": "test/old", "status": "deprecated", "successor": "test/data"},
+        )
+        callback = MagicMock()
+
+        with mock_svc.patch_httpx():
+            client = MonikerClient(config=ClientConfig(
+                service_url="http://mock",
+                deprecation_enabled=enabled,
+                deprecation_callback=callback,
+            ))
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always")
+                client.resolve("test/old")
+
+        deprecations = [w for w in caught if w.category is DeprecationWarning]
+        if enabled:
+            assert len(deprecations) == 1
+            assert deprecations[0].filename == __file__
+            callback.assert_called_once_with("test/old", None, "test/data")
+        else:
+            assert deprecations == []
+            callback.assert_not_called()
+
 
 class TestResolutionCaching:
     """Test resolution caching behavior."""
@@ -231,6 +315,42 @@ class TestResolutionCaching:
         resolve_calls = mock_svc.get_calls("/resolve")
         assert len(resolve_calls) == 1
 
+    def test_invalidate_cache_forces_re_resolve(self):
+        """Test invalidate_cache evicts a cached resolution."""
+        mock_svc = create_mock_service_for_integration()
+
+        with mock_svc.patch_httpx():
+            client = MonikerClient(
+                config=ClientConfig(service_url="http://mock", cache_ttl=60)
+            )
+            client.resolve("test/data")
+            client.invalidate_cache("test/data")
+            client.resolve("test/data")
+            client.invalidate_cache()
+            client.resolve("test/data")
+
+        resolve_calls = mock_svc.get_calls("/resolve")
+        assert len(resolve_calls) == 3
+
+    def test_resolution_cache_is_bounded(self):
+        """Test the resolution cache evicts past max_cache_entries."""
+        mock_svc = create_mock_service_for_integration()
+        mock_svc.add_resolution(
+            "test/other",
+            {**mock_svc.resolutions["test/data"], "moniker": "moniker://test/other", "path": "test/other"},
+        )
+
+        with mock_svc.patch_httpx():
+            client = MonikerClient(
+                config=ClientConfig(service_url="http://mock", cache_ttl=60, max_cache_entries=1)
+            )
+            client.resolve("test/data")
+            client.resolve("test/other")
+            client.resolve("test/data")
+
+        assert len(client._cache) == 1
+        assert len(mock_svc.get_calls("/resolve")) == 3
+
     def test_cache_disabled_when_ttl_zero(self):
         """Test cache is disabled when cache_ttl=0."""
         mock_svc = create_mock_service_for_integration()
@@ -248,6 +368,212 @@ class TestResolutionCaching:
         resolve_calls = mock_svc.get_calls("/resolve")
         assert len(resolve_calls) == 2
 
+    def test_concurrent_resolves_share_one_request(self):
+        """Test simultaneous misses for one moniker send a single request."""
+        import threading
+
+        mock_svc = create_mock_service_for_integration()
+        release = threading.Event()
+
+        def slow_resolve(request):
+            release.wait(5)
+            return httpx.Response(200, json=mock_svc.resolutions["test/data"])
+
+        mock_svc.add_custom_handler(r"/resolve/", slow_resolve)
+
+        with mock_svc.patch_httpx():
+            # TTL 0 so only coalescing, not the cache, can dedupe requests
+            client = MonikerClient(config=ClientConfig(service_url="http://mock", cache_ttl=0))
+            results = []
+            threads = [
+                threading.Thread(target=lambda: results.append(client.resolve("test/data")))
+                for _ in range(4)
+            ]
+            for t in threads:
+                t.start()
+            time.sleep(0.1)
+            release.set()
+            for t in threads:
+                t.join()
+
+        assert len(results) == 4
+        assert all(r is results[0] for r in results)
+        assert len(mock_svc.get_calls("/resolve")) == 1
+
+
+class TestMetadataCaching:
+    """Test caching of read-only catalog results."""
+
+    def test_metadata_calls_are_cached(self):
+        """Test describe/metadata/schema hit the service once per path."""
+        mock_svc = create_mock_service_for_integration()
+
+        with mock_svc.patch_httpx():
+            client = MonikerClient(
+                config=ClientConfig(service_url="http://mock", meta_cache_ttl=60)
+            )
+            first = client.describe("test/data")
+            assert client.describe("moniker://test/data") == first
+            client.metadata("test/data")
+            client.schema("test/data")
+
+        assert len(mock_svc.get_calls("/describe")) == 1
+        assert len(mock_svc.get_calls("/metadata")) == 1
+
+    def test_cached_results_are_copies(self):
+        """Test mutating a returned result does not change what the next call gets."""
+        mock_svc = create_mock_service_for_integration()
+
+        with mock_svc.patch_httpx():
+            client = MonikerClient(
+                config=ClientConfig(service_url="http://mock", meta_cache_ttl=60)
+            )
+            client.describe("test/data")["display_name"] = "changed"
+            client.metadata("test/data").semantic_tags.append("changed")
+            client.tree("test").children.clear()
+
+            assert client.describe("test/data")["display_name"] == "Test Data"
+            assert client.metadata("test/data").semantic_tags == ["test", "sample"]
+            assert client.tree("test").children
+
+        assert len(mock_svc.get_calls("/describe")) == 1
+        assert len(mock_svc.get_calls("/metadata")) == 1
+
+    def test_metadata_miss_copies_once(self):
+        """Test a metadata cache miss deep-copies the result only once."""
+        import copy
+
+        mock_svc = create_mock_service_for_integration()
+
+        with mock_svc.patch_httpx():
+            with patch("moniker_client.client.copy.deepcopy", wraps=copy.deepcopy) as deepcopy:
+                client = MonikerClient(
+                    config=ClientConfig(service_url="http://mock", meta_cache_ttl=60)
+                )
+                result = client.metadata("test/data")
+
+        copies = [c for c in deepcopy.call_args_list if isinstance(c.args[0], MetadataResult)]
+        assert len(copies) == 1
+        assert result == client.metadata("test/data")
+
+    def test_concurrent_schema_calls_share_one_request(self):
+        """Test simultaneous metadata misses for one path send a single request."""
+        import threading
+
+        mock_svc = create_mock_service_for_integration()
+        release = threading.Event()
+
+        def slow_metadata(request):
+            release.wait(5)
+            return httpx.Response(200, json=mock_svc.metadata_store["test/data"])
+
+        mock_svc.add_custom_handler(r"/metadata/", slow_metadata)
+
+        with mock_svc.patch_httpx():
+            client = MonikerClient(config=ClientConfig(service_url="http://mock", meta_cache_ttl=0))
+            threads = [
+                threading.Thread(target=client.schema, args=("test/data",)) for _ in range(3)
+            ]
+            for t in threads:
+                t.start()
+            time.sleep(0.1)
+            release.set()
+            for t in threads:
+                t.join()
+
+        assert len(mock_svc.get_calls("/metadata")) == 1
+
+    def test_invalidate_cache_evicts_metadata(self):
+        """Test invalidate_cache drops cached results for a path."""
+        mock_svc = create_mock_service_for_integration()
+
+        with mock_svc.patch_httpx():
+            client = MonikerClient(
+                config=ClientConfig(service_url="http://mock", meta_cache_ttl=60)
+            )
+            client.describe("test/data")
+            client.invalidate_cache("test/data")
+            client.describe("test/data")
+
+        assert len(mock_svc.get_calls("/describe")) == 2
+
+    def test_metadata_cache_evicts_least_recently_used(self):
+        """Test the cache stays within max_meta_cache_size."""
+        mock_svc = create_mock_service_for_integration()
+
+        with mock_svc.patch_httpx():
+            client = MonikerClient(
+                config=ClientConfig(
+                    service_url="http://mock", meta_cache_ttl=60, max_meta_cache_size=1
+                )
+            )
+            client.describe("test/data")
+            client.metadata("test/data")
+            client.describe("test/data")
+
+        assert len(client._meta_cache) == 1
+        assert len(mock_svc.get_calls("/describe")) == 2
+
+    def test_metadata_cache_disabled_when_ttl_zero(self):
+        """Test metadata caching is disabled when meta_cache_ttl=0."""
+        mock_svc = create_mock_service_for_integration()
+
+        with mock_svc.patch_httpx():
+            client = MonikerClient(
+                config=ClientConfig(service_url="http://mock", meta_cache_ttl=0)
+            )
+            client.describe("test/data")
+            client.describe("test/data")
+
+        assert len(mock_svc.get_calls("/describe")) == 2
+
+
+class TestBatchMetadata:
+    """Test batched catalog lookups."""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_batch_metadata_single_post(self, use_orjson, monkeypatch):
+        """Test batch_metadata posts uncached paths once and caches results."""
+        import json
+
+        from moniker_client import client as client_module
+
+        if not use_orjson:
+            monkeypatch.setattr(client_module, "orjson", None)
+        elif client_module.orjson is None:
+            pytest.skip("orjson not installed")
+
+        mock_svc = create_mock_service_for_integration()
+
+        def batch_handler(request):
+            paths = json.loads(request.content)["paths"]
+            return httpx.Response(
+                200,
+                json={"results": [mock_svc.metadata_store[p] for p in paths if p in mock_svc.metadata_store]},
+            )
+
+        mock_svc.add_custom_handler(r"/metadata/batch", batch_handler)
+
+        with mock_svc.patch_httpx():
+            client = MonikerClient(config=ClientConfig(service_url="http://mock"))
+            results = client.batch_metadata(["test/data", "unknown/path"])
+            client.metadata("test/data")
+
+        assert set(results) == {"test/data"}
+        assert isinstance(results["test/data"], MetadataResult)
+        assert len(mock_svc.get_calls("/metadata")) == 1
+
+    def test_batch_describe_falls_back_without_batch_route(self):
+        """Test batch_describe issues single GETs when the service lacks the route."""
+        mock_svc = create_mock_service_for_integration()
+
+        with mock_svc.patch_httpx():
+            client = MonikerClient(config=ClientConfig(service_url="http://mock"))
+            results = client.batch_describe(["test/data", "unknown/path"])
+
+        assert results["test/data"]["display_name"] == "Test Data"
+        assert "unknown/path" not in results
+
 
 class TestTelemetryReporting:
     """Test telemetry reporting."""
@@ -262,18 +588,121 @@ class TestTelemetryReporting:
 
         with mock_svc.patch_httpx():
             # Patch at the point where it's used in client.py
+            with patch("moniker_client.client.get_adapter", return_value=mock_adapter):
+                with MonikerClient(
+                    config=ClientConfig(
+                        service_url="http://mock",
+                        report_telemetry=True,
+                    )
+                ) as client:
+                    client.read("test/data")
+
+        # Should have telemetry call, posted when the client closes
+        telemetry_calls = mock_svc.get_calls("/telemetry")
+        assert len(telemetry_calls) == 1
+
+    def test_telemetry_posted_in_batches(self):
+        """Test telemetry records are buffered and posted in bulk."""
+        import json
+
+        mock_svc = create_mock_service_for_integration()
+        batches = []
+
+        def batch_handler(request):
+            batches.append(json.loads(request.content)["events"])
+            return httpx.Response(200, json={"status": "ok"})
+
+        mock_svc.add_custom_handler(r"/telemetry/access/batch", batch_handler)
+
+        mock_adapter = MagicMock()
+        mock_adapter.fetch.return_value = [{"id": 1}]
+
+        with mock_svc.patch_httpx():
+            with patch("moniker_client.client.get_adapter", return_value=mock_adapter):
+                client = MonikerClient(
+                    config=ClientConfig(
+                        service_url="http://mock",
+                        report_telemetry=True,
+                        telemetry_batch_size=10,
+                        telemetry_flush_interval=60,
+                    )
+                )
+                for _ in range(3):
+                    client.read("test/data")
+                assert batches == []
+                client.close()
+
+        assert len(batches) == 1
+        assert [e["outcome"] for e in batches[0]] == ["success"] * 3
+
+    def test_close_waits_for_in_flight_telemetry_flush(self):
+        """Test close() lets a worker's full-batch flush finish before closing."""
+        import json
+        import threading
+
+        mock_svc = create_mock_service_for_integration()
+        posting = threading.Event()
+        batches = []
+
+        def batch_handler(request):
+            posting.set()
+            time.sleep(0.1)
+            batches.append(json.loads(request.content)["events"])
+            return httpx.Response(200, json={"status": "ok"})
+
+        mock_svc.add_custom_handler(r"/telemetry/access/batch", batch_handler)
+
+        mock_adapter = MagicMock()
+        mock_adapter.fetch.return_value = [{"id": 1}]
+
+        with mock_svc.patch_httpx():
             with patch("moniker_client.client.get_adapter", return_value=mock_adapter):
                 client = MonikerClient(
                     config=ClientConfig(
                         service_url="http://mock",
                         report_telemetry=True,
+                        telemetry_batch_size=2,
+                        telemetry_flush_interval=60,
                     )
                 )
                 client.read("test/data")
+                client.read("test/data")
+                assert posting.wait(5)
+                client.close()
+                assert [len(b) for b in batches] == [2]
 
-        # Should have telemetry call
-        telemetry_calls = mock_svc.get_calls("/telemetry")
-        assert len(telemetry_calls) == 1
+    def test_telemetry_remembers_missing_batch_route(self):
+        """Test a 404 from the batch route switches later flushes to per-record posts."""
+        mock_svc = create_mock_service_for_integration()
+        mock_svc.add_custom_handler(
+            r"/telemetry/access/batch", lambda request: httpx.Response(404)
+        )
+        mock_svc.add_custom_handler(
+            r"/telemetry/access$", lambda request: httpx.Response(200, json={"status": "ok"})
+        )
+
+        mock_adapter = MagicMock()
+        mock_adapter.fetch.return_value = [{"id": 1}]
+
+        with mock_svc.patch_httpx():
+            with patch("moniker_client.client.get_adapter", return_value=mock_adapter):
+                client = MonikerClient(
+                    config=ClientConfig(
+                        service_url="http://mock",
+                        report_telemetry=True,
+                        telemetry_batch_size=10,
+                        telemetry_flush_interval=60,
+                    )
+                )
+                client.read("test/data")
+                client.flush_telemetry()
+                client.read("test/data")
+                client.read("test/data")
+                client.close()
+
+        assert len(mock_svc.get_calls("/telemetry/access/batch")) == 1
+        single = [c for c in mock_svc.get_calls("/telemetry/access") if "batch" not in c[1]]
+        assert len(single) == 3
 
     def test_telemetry_not_reported_when_disabled(self):
         """Test telemetry is NOT reported when disabled."""
@@ -397,3 +826,228 @@ class TestClientHeaders:
         headers = headers_received[0]
         assert headers.get("x-app-id") == "test-app"
         assert headers.get("x-team") == "test-team"
+        assert headers.get("user-agent", "").startswith("moniker-client/")
+
+    def test_client_refreshes_auth_on_401(self):
+        """Test a 401 rebuilds auth headers and retries the request once."""
+        mock_svc = create_mock_service_for_integration()
+        config = ClientConfig(service_url="http://mock", auth_method="jwt", jwt_token="old")
+        auth_received = []
+
+        def handler(request):
+            auth_received.append(request.headers.get("authorization"))
+            if request.headers.get("authorization") != "Bearer new":
+                return httpx.Response(401, json={"detail": "expired"})
+            return httpx.Response(200, json={"path": "test/data"})
+
+        mock_svc.add_custom_handler(r"/describe/.*", handler)
+
+        with mock_svc.patch_httpx():
+            client = MonikerClient(config=config)
+            config.jwt_token = "new"
+            result = client.describe("test/data")
+
+        assert result == {"path": "test/data"}
+        assert auth_received == ["Bearer old", "Bearer new"]
+
+
+class TestClientConnectionPool:
+    """Test client reuses one pooled HTTP client."""
+
+    def test_requests_share_pooled_client(self):
+        """Test repeated calls go through the same httpx.Client."""
+        mock_svc = create_mock_service_for_integration()
+
+        with mock_svc.patch_httpx():
+            with MonikerClient(config=ClientConfig(service_url="http://mock")) as client:
+                http = client._http
+                client.describe("test/data")
+                client.list_children("test")
+                assert client._http is http
+                assert not http.is_closed
+
+        assert http.is_closed
+        assert len(mock_svc.get_calls()) == 2
+
+    @pytest.mark.parametrize("service_url", ["http://svc/api", "http://svc/api/"])
+    def test_paths_join_onto_service_url(self, service_url):
+        """Test relative service paths keep any base path on service_url."""
+        with MonikerClient(config=ClientConfig(service_url=service_url)) as client:
+            request = client._http.build_request("GET", "/list/a/b")
+
+        assert str(request.url) == "http://svc/api/list/a/b"
+
+
+class TestBatchRead:
+    """Test batch reads."""
+
+    def test_abatch_read_fetches_concurrently(self):
+        """Test abatch_read overlaps adapter fetches and keys results by path."""
+        import asyncio
+
+        mock_svc = create_mock_service_for_integration()
+        mock_svc.add_resolution(
+            "test/other",
+            {**mock_svc.resolutions["test/data"], "moniker": "moniker://test/other", "path": "test/other"},
+        )
+
+        in_flight = 0
+        max_in_flight = 0
+
+        async def afetch(resolved, config, **kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if resolved.path == "test/other":
+                raise RuntimeError("boom")
+            return [{"path": resolved.path}]
+
+        mock_adapter = MagicMock()
+        mock_adapter.afetch = afetch
+
+        with mock_svc.patch_httpx():
+            with patch("moniker_client.client.get_adapter", return_value=mock_adapter):
+                client = MonikerClient(
+                    config=ClientConfig(service_url="http://mock", report_telemetry=False)
+                )
+                results = asyncio.run(client.abatch_read(["test/data", "test/other"]))
+
+        assert results["test/data"] == [{"path": "test/data"}]
+        assert isinstance(results["test/other"], RuntimeError)
+        assert max_in_flight == 2
+
+    def test_batch_read_fetches_on_worker_threads(self):
+        """Test batch_read runs adapter fetches concurrently on the pool."""
+        import threading
+
+        mock_svc = create_mock_service_for_integration()
+        mock_svc.add_resolution(
+            "test/other",
+            {**mock_svc.resolutions["test/data"], "moniker": "moniker://test/other", "path": "test/other"},
+        )
+
+        # Both fetches must be in flight together to pass the barrier
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fetch(resolved, config, **kwargs):
+            barrier.wait()
+            if resolved.path == "test/other":
+                raise RuntimeError("boom")
+            return [{"path": resolved.path}]
+
+        mock_adapter = MagicMock()
+        mock_adapter.fetch = fetch
+
+        with mock_svc.patch_httpx():
+            with patch("moniker_client.client.get_adapter", return_value=mock_adapter):
+                with MonikerClient(
+                    config=ClientConfig(service_url="http://mock", report_telemetry=False)
+                ) as client:
+                    results = client.batch_read(["test/data", "test/other"])
+
+        assert list(results) == ["test/data", "test/other"]
+        assert results["test/data"] == [{"path": "test/data"}]
+        assert isinstance(results["test/other"], RuntimeError)
+
+    def test_batch_read_serializes_non_thread_safe_adapter(self):
+        """Test batch_read never overlaps fetches through a non-thread-safe adapter."""
+        import threading
+
+        mock_svc = create_mock_service_for_integration()
+        for path in ("test/other", "test/third"):
+            mock_svc.add_resolution(
+                path,
+                {**mock_svc.resolutions["test/data"], "moniker": f"moniker://{path}", "path": path},
+            )
+
+        lock = threading.Lock()
+        in_flight = 0
+        max_in_flight = 0
+
+        def fetch(resolved, config, **kwargs):
+            nonlocal in_flight, max_in_flight
+            with lock:
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+            if resolved.path == "test/other":
+                raise RuntimeError("boom")
+            return [{"path": resolved.path}]
+
+        mock_adapter = MagicMock(thread_safe=False)
+        mock_adapter.fetch = fetch
+
+        with mock_svc.patch_httpx():
+            with patch("moniker_client.client.get_adapter", return_value=mock_adapter):
+                with MonikerClient(
+                    config=ClientConfig(service_url="http://mock", report_telemetry=False)
+                ) as client:
+                    results = client.batch_read(["test/data", "test/other", "test/third"])
+
+        assert list(results) == ["test/data", "test/other", "test/third"]
+        assert results["test/third"] == [{"path": "test/third"}]
+        assert isinstance(results["test/other"], RuntimeError)
+        assert max_in_flight == 1
+
+    def test_batch_read_mssql_connections_stay_on_their_thread(self):
+        """Test concurrent batch_read fetches through MSSQLAdapter never share a connection."""
+        import threading
+
+        from moniker_client.adapters.mssql import MSSQLAdapter
+
+        mock_svc = create_mock_service_for_integration()
+        for path in ("sql/a", "sql/b"):
+            mock_svc.add_resolution(
+                path,
+                {
+                    **mock_svc.resolutions["test/data"],
+                    "moniker": f"moniker://{path}",
+                    "path": path,
+                    "source_type": "mssql",
+                    "connection": {"server": "sql.example.com", "database": "DB"},
+                    "query": "SELECT id FROM t",
+                },
+            )
+
+        # Both fetches must be executing together to pass the barrier
+        barrier = threading.Barrier(2, timeout=5)
+        wrong_thread = []
+
+        def connect(conn_str, **kwargs):
+            owner = threading.get_ident()
+            conn = MagicMock()
+            cursor = conn.cursor.return_value
+            cursor.description = [("ID", None, None, None, None, None, None)]
+
+            def execute(query, *binds):
+                if threading.get_ident() != owner:
+                    wrong_thread.append(query)
+                barrier.wait()
+
+            cursor.execute.side_effect = execute
+            cursor.fetchall.return_value = [(1,)]
+            return conn
+
+        pyodbc = MagicMock()
+        pyodbc.connect.side_effect = connect
+        adapter = MSSQLAdapter()
+
+        with mock_svc.patch_httpx(), patch.dict("sys.modules", {"pyodbc": pyodbc}):
+            with patch("moniker_client.client.get_adapter", return_value=adapter):
+                with MonikerClient(
+                    config=ClientConfig(
+                        service_url="http://mock",
+                        report_telemetry=False,
+                        mssql_user="user",
+                        mssql_password="pass",
+                    )
+                ) as client:
+                    results = client.batch_read(["sql/a", "sql/b"])
+
+        assert results == {"sql/a": [{"ID": 1}], "sql/b": [{"ID": 1}]}
+        assert pyodbc.connect.call_count == 2
+        assert wrong_thread == []
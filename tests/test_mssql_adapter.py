@@ -0,0 +1,150 @@
+"""Unit tests for the MS-SQL adapter."""
+
+from __future__ import annotations
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from moniker_client.adapters.mssql import MSSQLAdapter
+
+
+@pytest.fixture
+def mssql_resolved_source(mock_resolved_source):
+    """Pre-configured ResolvedSource for MS-SQL tests."""
+    return mock_resolved_source(
+        moniker="test/mssql/data",
+        path="test/mssql/data",
+        source_type="mssql",
+        connection={"server": "sql.example.com", "database": "TESTDB"},
+        query="SELECT id, name FROM employees",
+    )
+
+
+@pytest.fixture
+def mssql_config(mock_config):
+    """Pre-configured ClientConfig for MS-SQL tests."""
+    return mock_config(credentials={"mssql_user": "user", "mssql_password": "pass"})
+
+
+def _mock_pyodbc(rows=None, columns=("ID", "NAME")):
+    """
+    pyodbc module whose connect() hands out a fresh mock connection each call.
+
+    Opened connections are kept on pyodbc.connections in call order.
+    """
+    pyodbc = MagicMock()
+    pyodbc.connections = []
+
+    def connect(conn_str, **kwargs):
+        conn = MagicMock()
+        conn.connect_kwargs = kwargs
+        cursor = conn.cursor.return_value
+        cursor.description = [(col, None, None, None, None, None, None) for col in columns]
+        cursor.fetchall.return_value = list(rows or [])
+        cursor.fetchmany.side_effect = [list(rows or []), []]
+        pyodbc.connections.append(conn)
+        return conn
+
+    pyodbc.connect.side_effect = connect
+    return pyodbc
+
+
+class TestMSSQLAdapterConnections:
+    """Tests for MS-SQL connection handling."""
+
+    def test_cached_connection_is_transactional_and_rolled_back(
+        self, mssql_resolved_source, mssql_config
+    ):
+        """Test the cached connection keeps autocommit off and rolls back each fetch."""
+        adapter = MSSQLAdapter()
+        pyodbc = _mock_pyodbc(rows=[(1, "Alice")])
+
+        with patch.dict("sys.modules", {"pyodbc": pyodbc}):
+            adapter.fetch(mssql_resolved_source, mssql_config)
+            adapter.fetch(mssql_resolved_source, mssql_config)
+
+        assert pyodbc.connect.call_count == 1
+        (conn,) = adapter._thread_connections().connections.values()
+        assert "autocommit" not in conn.connect_kwargs
+        assert conn.rollback.call_count == 2
+        conn.commit.assert_not_called()
+
+    def test_query_error_not_masked_by_failed_rollback(
+        self, mssql_resolved_source, mssql_config
+    ):
+        """Test the query error propagates when rollback fails on a dead connection."""
+        adapter = MSSQLAdapter()
+        pyodbc = _mock_pyodbc()
+
+        with patch.dict("sys.modules", {"pyodbc": pyodbc}):
+            adapter.fetch(mssql_resolved_source, mssql_config)
+            (conn,) = pyodbc.connections
+            conn.cursor.return_value.execute.side_effect = RuntimeError(
+                "08S01 communication link failure"
+            )
+            conn.rollback.side_effect = RuntimeError("rollback failed: connection closed")
+            with pytest.raises(RuntimeError, match="08S01"):
+                adapter.fetch(mssql_resolved_source, mssql_config)
+
+    def test_stream_uses_dedicated_connection(self, mssql_resolved_source, mssql_config):
+        """Test stream=True opens its own connection and the generator closes it."""
+        adapter = MSSQLAdapter()
+        pyodbc = _mock_pyodbc(rows=[(1, "Alice")])
+
+        with patch.dict("sys.modules", {"pyodbc": pyodbc}):
+            adapter.fetch(mssql_resolved_source, mssql_config)
+            rows = adapter.fetch(mssql_resolved_source, mssql_config, stream=True)
+
+            assert len(pyodbc.connections) == 2
+            cached, stream_conn = pyodbc.connections
+            assert list(rows) == [{"ID": 1, "NAME": "Alice"}]
+
+        stream_conn.close.assert_called_once()
+        cached.close.assert_not_called()
+        assert stream_conn not in adapter._thread_connections().connections.values()
+
+    def test_connections_are_per_thread(self, mssql_resolved_source, mssql_config):
+        """Test each thread gets its own connection and close_connections reaches all."""
+        adapter = MSSQLAdapter()
+        pyodbc = _mock_pyodbc(rows=[(1, "Alice")])
+        barrier = threading.Barrier(2)
+        results = []
+
+        def worker():
+            barrier.wait()
+            results.append(adapter.fetch(mssql_resolved_source, mssql_config))
+            adapter.fetch(mssql_resolved_source, mssql_config)
+
+        with patch.dict("sys.modules", {"pyodbc": pyodbc}):
+            threads = [threading.Thread(target=worker) for _ in range(2)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            adapter.fetch(mssql_resolved_source, mssql_config)
+
+        assert results == [[{"ID": 1, "NAME": "Alice"}]] * 2
+        assert len(pyodbc.connections) == 3
+        for conn in pyodbc.connections:
+            conn.cursor.assert_called_once()
+
+        adapter.close_connections()
+        pyodbc.connections[-1].close.assert_called_once()
+        assert adapter._thread_connections().connections == {}
+
+    def test_prepared_cursor_eviction(self, mssql_resolved_source, mssql_config):
+        """Test the oldest prepared cursor is closed once the limit is reached."""
+        adapter = MSSQLAdapter()
+        conn = MagicMock()
+        conn.cursor.side_effect = lambda: MagicMock()
+
+        with patch("moniker_client.adapters.mssql._MAX_PREPARED", 2):
+            first = adapter._prepared_cursor(conn, "SELECT 1")
+            adapter._prepared_cursor(conn, "SELECT 2")
+            assert adapter._prepared_cursor(conn, "SELECT 1") is first
+            adapter._prepared_cursor(conn, "SELECT 3")
+
+        first.close.assert_called_once()
+        assert len(adapter._thread_connections().prepared) == 2
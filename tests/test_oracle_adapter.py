@@ -131,36 +131,50 @@ class TestOracleAdapterFiltering:
         adapter = OracleAdapter()
         query = "SELECT * FROM employees"
         filters = {"dept_id": 10, "status": "active"}
-        result = adapter._inject_where_clause(query, filters)
+        result, binds = adapter._inject_where_clause(query, filters)
         assert "WHERE" in result
-        assert "dept_id = 10" in result
-        assert "status = 'active'" in result
+        assert "dept_id = :p0" in result
+        assert "status = :p1" in result
+        assert binds == {"p0": 10, "p1": "active"}
 
     def test_inject_where_clause_existing(self):
         """Test appending to existing WHERE clause."""
         adapter = OracleAdapter()
         query = "SELECT * FROM employees WHERE salary > 50000"
         filters = {"dept_id": 10}
-        result = adapter._inject_where_clause(query, filters)
+        result, binds = adapter._inject_where_clause(query, filters)
         assert result.count("WHERE") == 1
-        assert "dept_id = 10" in result
+        assert "dept_id = :p0" in result
         assert "salary > 50000" in result
+        assert binds == {"p0": 10}
 
     def test_inject_where_clause_with_list(self):
         """Test IN clause for list values."""
         adapter = OracleAdapter()
         query = "SELECT * FROM employees"
         filters = {"dept_id": [10, 20, 30]}
-        result = adapter._inject_where_clause(query, filters)
-        assert "dept_id IN (10, 20, 30)" in result
+        result, binds = adapter._inject_where_clause(query, filters)
+        assert "dept_id IN (:p0_0, :p0_1, :p0_2)" in result
+        assert binds == {"p0_0": 10, "p0_1": 20, "p0_2": 30}
 
     def test_inject_where_clause_with_string_list(self):
         """Test IN clause for string list values."""
         adapter = OracleAdapter()
         query = "SELECT * FROM employees"
         filters = {"status": ["active", "pending"]}
-        result = adapter._inject_where_clause(query, filters)
-        assert "status IN ('active', 'pending')" in result
+        result, binds = adapter._inject_where_clause(query, filters)
+        assert "status IN (:p0_0, :p0_1)" in result
+        assert binds == {"p0_0": "active", "p0_1": "pending"}
+
+    def test_inject_where_clause_same_sql_for_different_values(self):
+        """Test filter values never change the SQL text."""
+        adapter = OracleAdapter()
+        query = "SELECT * FROM employees"
+        first, _ = adapter._inject_where_clause(query, {"name": "O'Brien"})
+        second, binds = adapter._inject_where_clause(query, {"name": "Smith"})
+        assert first == second
+        assert "Smith" not in second
+        assert binds == {"p0": "Smith"}
 
 
 class TestOracleAdapterLimit:
@@ -203,17 +217,18 @@ class TestOracleAdapterBuildQuery:
                 "limit": 100,
             },
         )
-        query = adapter._build_query(resolved)
+        query, binds = adapter._build_query(resolved)
         assert "AS OF TIMESTAMP" in query
         assert "WHERE" in query
-        assert "dept_id = 10" in query
+        assert "dept_id = :p0" in query
         assert "FETCH FIRST 100 ROWS ONLY" in query
+        assert binds == {"p0": 10}
 
     def test_build_query_no_query(self, mock_resolved_source):
-        """Test building with no query returns None."""
+        """Test building with no query returns None and no binds."""
         adapter = OracleAdapter()
         resolved = mock_resolved_source(query=None)
-        assert adapter._build_query(resolved) is None
+        assert adapter._build_query(resolved) == (None, {})
 
     def test_build_query_moniker_version_as_flashback(self, mock_resolved_source):
         """Test moniker_version is used for flashback."""
@@ -222,7 +237,7 @@ class TestOracleAdapterBuildQuery:
             query="SELECT * FROM employees",
             params={"moniker_version": "2024-01-15 10:30:00"},
         )
-        query = adapter._build_query(resolved)
+        query, _ = adapter._build_query(resolved)
         assert "AS OF TIMESTAMP" in query
 
 
@@ -312,6 +327,87 @@ class TestOracleAdapterFetch:
         assert result.columns == ["ID", "NAME"]
         assert result.source_type == "oracle"
 
+    def test_fetch_columnar(
+        self, mock_resolved_source, mock_config, mock_oracle_connection
+    ):
+        """Test fetch returns one list per column when columnar=True."""
+        adapter = OracleAdapter()
+        resolved = mock_resolved_source(
+            connection={"service_name": "ORCL"},
+            query="SELECT id, name FROM employees",
+        )
+        config = mock_config(oracle_user="user", oracle_password="pass")
+
+        mock_conn = mock_oracle_connection(
+            columns=["ID", "NAME"],
+            rows=[(1, "Alice"), (2, "Bob")],
+        )
+        mock_oracledb = MagicMock()
+        mock_oracledb.connect.return_value = mock_conn
+
+        with patch.dict("sys.modules", {"oracledb": mock_oracledb}):
+            result = adapter.fetch(resolved, config, columnar=True, return_result=True)
+
+        assert result.data == {"ID": [1, 2], "NAME": ["Alice", "Bob"]}
+        assert result.row_count == 2
+
+    def test_fetch_namedtuples(
+        self, mock_resolved_source, mock_config, mock_oracle_connection
+    ):
+        """Test fetch returns namedtuple rows when namedtuples=True."""
+        adapter = OracleAdapter()
+        resolved = mock_resolved_source(
+            connection={"service_name": "ORCL"},
+            query="SELECT id, name FROM employees",
+        )
+        config = mock_config(oracle_user="user", oracle_password="pass")
+
+        mock_conn = mock_oracle_connection(
+            columns=["ID", "NAME"],
+            rows=[(1, "Alice"), (2, "Bob")],
+        )
+        mock_oracledb = MagicMock()
+        mock_oracledb.connect.return_value = mock_conn
+
+        with patch.dict("sys.modules", {"oracledb": mock_oracledb}):
+            result = adapter.fetch(resolved, config, namedtuples=True)
+
+        assert result == [(1, "Alice"), (2, "Bob")]
+        assert result[1].NAME == "Bob"
+        assert result[0]._asdict() == {"ID": 1, "NAME": "Alice"}
+        assert type(result[0]) is type(result[1])
+
+    def test_fetch_stream_uses_fetchmany(
+        self, mock_resolved_source, mock_config, mock_oracle_connection
+    ):
+        """Test stream=True yields dicts batch by batch via fetchmany."""
+        adapter = OracleAdapter()
+        resolved = mock_resolved_source(
+            connection={"service_name": "ORCL"},
+            query="SELECT id, name FROM employees",
+            params={"arraysize": 2},
+        )
+        config = mock_config(oracle_user="user", oracle_password="pass")
+
+        mock_conn = mock_oracle_connection(columns=["ID", "NAME"])
+        cursor = mock_conn.cursor.return_value
+        cursor.fetchmany.side_effect = [[(1, "Alice"), (2, "Bob")], [(3, "Carol")], []]
+        mock_oracledb = MagicMock()
+        mock_oracledb.connect.return_value = mock_conn
+
+        with patch.dict("sys.modules", {"oracledb": mock_oracledb}):
+            rows = list(adapter.fetch(resolved, config, stream=True))
+
+        assert rows == [
+            {"ID": 1, "NAME": "Alice"},
+            {"ID": 2, "NAME": "Bob"},
+            {"ID": 3, "NAME": "Carol"},
+        ]
+        assert cursor.arraysize == 2
+        assert "arraysize" not in cursor.execute.call_args[0][0]
+        cursor.fetchall.assert_not_called()
+        cursor.close.assert_called_once()
+
 
 class TestOracleAdapterErrorHandling:
     """Tests for Oracle error handling."""
@@ -468,17 +564,12 @@ class TestOracleAdapterHealthCheck:
     """Tests for Oracle health check."""
 
     def test_health_check_success(self, mock_resolved_source, mock_config):
-        """Test health check success."""
+        """Test health check on a new connection needs no extra round trip."""
         adapter = OracleAdapter()
         resolved = mock_resolved_source(connection={"service_name": "ORCL"})
         config = mock_config(oracle_user="user", oracle_password="pass")
 
         mock_conn = MagicMock()
-        mock_cursor = MagicMock()
-        mock_cursor.fetchone.return_value = (1,)
-        mock_conn.cursor.return_value = mock_cursor
-        mock_conn.ping.return_value = None
-
         mock_oracledb = MagicMock()
         mock_oracledb.connect.return_value = mock_conn
 
@@ -487,6 +578,52 @@ class TestOracleAdapterHealthCheck:
 
         assert result["healthy"] is True
         assert "latency_ms" in result
+        mock_oracledb.connect.assert_called_once()
+        mock_conn.ping.assert_not_called()
+        mock_conn.cursor.assert_not_called()
+
+    def test_health_check_pings_cached_connection_once(
+        self, mock_resolved_source, mock_config
+    ):
+        """Test health check on a cached connection costs a single ping."""
+        adapter = OracleAdapter()
+        resolved = mock_resolved_source(connection={"service_name": "ORCL"})
+        config = mock_config(oracle_user="user", oracle_password="pass")
+
+        mock_conn = MagicMock()
+        mock_oracledb = MagicMock()
+        mock_oracledb.connect.return_value = mock_conn
+
+        with patch.dict("sys.modules", {"oracledb": mock_oracledb}):
+            adapter.health_check(resolved, config)
+            result = adapter.health_check(resolved, config)
+
+        assert result["healthy"] is True
+        mock_oracledb.connect.assert_called_once()
+        mock_conn.ping.assert_called_once()
+        mock_conn.cursor.assert_not_called()
+
+    def test_health_check_reconnects_stale_connection(
+        self, mock_resolved_source, mock_config
+    ):
+        """Test a cached connection failing its ping is replaced."""
+        adapter = OracleAdapter()
+        resolved = mock_resolved_source(connection={"service_name": "ORCL"})
+        config = mock_config(oracle_user="user", oracle_password="pass")
+
+        stale_conn = MagicMock()
+        stale_conn.ping.side_effect = Exception("ORA-03113: end-of-file on communication channel")
+        fresh_conn = MagicMock()
+        mock_oracledb = MagicMock()
+        mock_oracledb.connect.side_effect = [stale_conn, fresh_conn]
+
+        with patch.dict("sys.modules", {"oracledb": mock_oracledb}):
+            adapter.health_check(resolved, config)
+            result = adapter.health_check(resolved, config)
+
+        assert result["healthy"] is True
+        assert mock_oracledb.connect.call_count == 2
+        fresh_conn.ping.assert_not_called()
 
     def test_health_check_no_credentials(self, mock_resolved_source, mock_config):
         """Test health check fails without credentials."""
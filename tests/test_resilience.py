@@ -0,0 +1,139 @@
+"""Tests for retry backoff and the client circuit breaker."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from moniker_client.resilience import (
+    ClientCircuitBreaker,
+    ClientCircuitState,
+    RetryConfig,
+    _next_delay,
+    retry_with_backoff,
+)
+
+
+class TestBackoffJitter:
+    """Test retry delay calculation."""
+
+    @pytest.mark.parametrize("mode", ["equal", "full", "decorrelated"])
+    def test_delay_stays_within_bounds(self, mode):
+        """Test every jitter mode stays under max_delay_seconds."""
+        config = RetryConfig(base_delay_seconds=0.5, max_delay_seconds=4.0, jitter_mode=mode)
+        delay = config.base_delay_seconds
+        for attempt in range(20):
+            delay = _next_delay(config, attempt, delay)
+            assert 0 <= delay <= config.max_delay_seconds
+
+    def test_decorrelated_grows_from_previous_delay(self):
+        """Test decorrelated jitter draws between base and 3x the previous sleep."""
+        config = RetryConfig(base_delay_seconds=0.5, max_delay_seconds=30.0)
+        with patch("moniker_client.resilience.random.uniform", side_effect=lambda a, b: b):
+            assert _next_delay(config, 0, 0.5) == 1.5
+            assert _next_delay(config, 1, 1.5) == 4.5
+
+    def test_retry_sleeps_between_attempts(self):
+        """Test retry_with_backoff retries connection errors then succeeds."""
+        calls = []
+
+        def flaky():
+            calls.append(1)
+            if len(calls) < 3:
+                raise ConnectionError("down")
+            return "ok"
+
+        with patch("moniker_client.resilience.time.sleep") as sleep:
+            assert retry_with_backoff(flaky, RetryConfig(max_retries=3)) == "ok"
+
+        assert len(calls) == 3
+        assert sleep.call_count == 2
+
+
+class TestRetryableErrors:
+    """Test which errors retry_with_backoff retries."""
+
+    @pytest.mark.parametrize("error", [
+        httpx.ConnectError("refused"),
+        httpx.ReadTimeout("slow"),
+        httpx.RemoteProtocolError("reset"),
+        ConnectionResetError("reset"),
+        TimeoutError("slow"),
+    ])
+    def test_transport_errors_are_retried(self, error):
+        """Test transport failures are retried until attempts run out."""
+        func = MagicMock(side_effect=error)
+
+        with patch("moniker_client.resilience.time.sleep"):
+            with pytest.raises(type(error)):
+                retry_with_backoff(func, RetryConfig(max_retries=2))
+
+        assert func.call_count == 3
+
+    def test_status_errors_retried_only_for_configured_codes(self):
+        """Test HTTP status errors retry on retryable codes only."""
+        request = httpx.Request("GET", "http://svc/resolve/x")
+
+        def status_error(code):
+            response = httpx.Response(code, request=request)
+            return httpx.HTTPStatusError(str(code), request=request, response=response)
+
+        retried = MagicMock(side_effect=[status_error(503), "ok"])
+        not_retried = MagicMock(side_effect=status_error(400))
+
+        with patch("moniker_client.resilience.time.sleep"):
+            assert retry_with_backoff(retried, RetryConfig()) == "ok"
+            with pytest.raises(httpx.HTTPStatusError):
+                retry_with_backoff(not_retried, RetryConfig())
+
+        assert not_retried.call_count == 1
+
+    def test_other_errors_are_not_retried(self):
+        """Test application errors propagate without retrying."""
+        func = MagicMock(side_effect=ValueError("bad"))
+
+        with pytest.raises(ValueError):
+            retry_with_backoff(func, RetryConfig())
+
+        assert func.call_count == 1
+
+
+class TestClientCircuitBreaker:
+    """Test circuit breaker state transitions."""
+
+    def test_closed_fast_path_skips_lock(self):
+        """Test healthy requests never take the breaker lock."""
+        breaker = ClientCircuitBreaker()
+        breaker._lock = MagicMock()
+
+        breaker.before_request()
+        breaker.on_success()
+
+        breaker._lock.__enter__.assert_not_called()
+
+    def test_opens_after_threshold_and_recovers(self):
+        """Test the breaker opens on failures and closes after half-open successes."""
+        breaker = ClientCircuitBreaker(failure_threshold=2, recovery_timeout=0, success_threshold=1)
+
+        breaker.on_failure()
+        breaker.on_success()
+        breaker.on_failure()
+        assert breaker.state == ClientCircuitState.CLOSED
+
+        breaker.on_failure()
+        assert breaker.state == ClientCircuitState.OPEN
+
+        breaker.before_request()
+        assert breaker.state == ClientCircuitState.HALF_OPEN
+        breaker.on_success()
+        assert breaker.state == ClientCircuitState.CLOSED
+
+    def test_open_circuit_rejects_requests(self):
+        """Test requests fail fast while the circuit is open."""
+        breaker = ClientCircuitBreaker(failure_threshold=1, recovery_timeout=60)
+        breaker.on_failure()
+
+        with pytest.raises(ConnectionError):
+            breaker.before_request()
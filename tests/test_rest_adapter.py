@@ -2,13 +2,29 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from moniker_client.adapters import rest
 from moniker_client.adapters.rest import RestAdapter
 
 
+@pytest.fixture(autouse=True)
+def _reset_shared_clients():
+    """Tests patch httpx.Client; drop shared clients created by earlier tests."""
+    rest._CLIENT_CACHE.clear()
+    yield
+    rest._CLIENT_CACHE.clear()
+
+
+@pytest.fixture(autouse=True)
+def _decode_via_response_json(monkeypatch):
+    """Mock responses stub .json(); decode through it even if orjson is installed."""
+    monkeypatch.setattr(rest, "orjson", None)
+
+
 class TestRestAdapterURLConstruction:
     """Tests for REST URL construction."""
 
@@ -28,7 +44,7 @@ class TestRestAdapterURLConstruction:
         with patch("httpx.Client") as mock_client:
             mock_instance = MagicMock()
             mock_instance.request.return_value = mock_response
-            mock_client.return_value.__enter__.return_value = mock_instance
+            mock_client.return_value = mock_instance
             adapter.fetch(resolved, mock_config())
 
         call_args = mock_instance.request.call_args
@@ -51,7 +67,7 @@ class TestRestAdapterURLConstruction:
         with patch("httpx.Client") as mock_client:
             mock_instance = MagicMock()
             mock_instance.request.return_value = mock_response
-            mock_client.return_value.__enter__.return_value = mock_instance
+            mock_client.return_value = mock_instance
             adapter.fetch(resolved, mock_config())
 
         call_args = mock_instance.request.call_args
@@ -74,7 +90,7 @@ class TestRestAdapterURLConstruction:
         with patch("httpx.Client") as mock_client:
             mock_instance = MagicMock()
             mock_instance.request.return_value = mock_response
-            mock_client.return_value.__enter__.return_value = mock_instance
+            mock_client.return_value = mock_instance
             adapter.fetch(resolved, mock_config())
 
         call_args = mock_instance.request.call_args
@@ -112,10 +128,10 @@ class TestRestAdapterQueryParams:
         mock_response.json.return_value = {}
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = mock_response
+            mock_client.return_value.request.return_value = mock_response
             adapter.fetch(resolved, mock_config())
 
-        call_args = mock_client.return_value.__enter__.return_value.request.call_args
+        call_args = mock_client.return_value.request.call_args
         assert call_args[1]["params"] == {"foo": "bar", "baz": 123}
 
     def test_query_params_from_moniker_params_fallback(self, mock_resolved_source, mock_config):
@@ -133,10 +149,10 @@ class TestRestAdapterQueryParams:
         mock_response.json.return_value = {}
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = mock_response
+            mock_client.return_value.request.return_value = mock_response
             adapter.fetch(resolved, mock_config())
 
-        call_args = mock_client.return_value.__enter__.return_value.request.call_args
+        call_args = mock_client.return_value.request.call_args
         assert call_args[1]["params"] == {"legacy": "param"}
 
     def test_query_params_merge_precedence(self, mock_resolved_source, mock_config):
@@ -157,10 +173,10 @@ class TestRestAdapterQueryParams:
         mock_response.json.return_value = {}
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = mock_response
+            mock_client.return_value.request.return_value = mock_response
             adapter.fetch(resolved, mock_config())
 
-        call_args = mock_client.return_value.__enter__.return_value.request.call_args
+        call_args = mock_client.return_value.request.call_args
         params = call_args[1]["params"]
         assert params["key"] == "new_value"  # query_params wins
         assert params["legacy"] == "param"  # moniker_params preserved
@@ -188,10 +204,10 @@ class TestRestAdapterAuth:
         mock_response.json.return_value = {}
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = mock_response
+            mock_client.return_value.request.return_value = mock_response
             adapter.fetch(resolved, config)
 
-        call_args = mock_client.return_value.__enter__.return_value.request.call_args
+        call_args = mock_client.return_value.request.call_args
         assert call_args[1]["headers"]["Authorization"] == "Bearer secret-token"
 
     def test_bearer_auth_from_params(self, mock_resolved_source, mock_config):
@@ -213,10 +229,10 @@ class TestRestAdapterAuth:
         mock_response.json.return_value = {}
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = mock_response
+            mock_client.return_value.request.return_value = mock_response
             adapter.fetch(resolved, config)
 
-        call_args = mock_client.return_value.__enter__.return_value.request.call_args
+        call_args = mock_client.return_value.request.call_args
         assert call_args[1]["headers"]["Authorization"] == "Bearer param-token"
 
     def test_api_key_auth(self, mock_resolved_source, mock_config):
@@ -238,10 +254,10 @@ class TestRestAdapterAuth:
         mock_response.json.return_value = {}
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = mock_response
+            mock_client.return_value.request.return_value = mock_response
             adapter.fetch(resolved, config)
 
-        call_args = mock_client.return_value.__enter__.return_value.request.call_args
+        call_args = mock_client.return_value.request.call_args
         assert call_args[1]["headers"]["X-Custom-Key"] == "my-api-key"
 
     def test_basic_auth(self, mock_resolved_source, mock_config):
@@ -267,13 +283,38 @@ class TestRestAdapterAuth:
         mock_response.json.return_value = {}
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = mock_response
+            mock_client.return_value.request.return_value = mock_response
             adapter.fetch(resolved, config)
 
-        call_args = mock_client.return_value.__enter__.return_value.request.call_args
+        call_args = mock_client.return_value.request.call_args
         expected = "Basic " + base64.b64encode(b"user:pass").decode()
         assert call_args[1]["headers"]["Authorization"] == expected
 
+    def test_auth_header_cached_per_credentials(self, mock_resolved_source, mock_config):
+        """Test auth header is built once per credential set."""
+        adapter = RestAdapter()
+        connection = {"base_url": "https://api.example.com", "auth_type": "bearer"}
+        config = mock_config()
+
+        headers = {}
+        adapter._apply_auth(
+            headers, "bearer", config,
+            mock_resolved_source(connection=connection, params={"bearer_token": "t1"}),
+        )
+        adapter._apply_auth(
+            headers, "bearer", config,
+            mock_resolved_source(connection=connection, params={"bearer_token": "t1"}),
+        )
+        assert headers["Authorization"] == "Bearer t1"
+        assert len(adapter._auth_header_cache) == 1
+
+        # A rotated token produces a fresh header
+        adapter._apply_auth(
+            headers, "bearer", config,
+            mock_resolved_source(connection=connection, params={"bearer_token": "t2"}),
+        )
+        assert headers["Authorization"] == "Bearer t2"
+
 
 class TestRestAdapterRetry:
     """Tests for REST retry logic."""
@@ -296,14 +337,14 @@ class TestRestAdapterRetry:
         mock_response_200.json.return_value = {"success": True}
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.side_effect = [
+            mock_client.return_value.request.side_effect = [
                 mock_response_503,
                 mock_response_200,
             ]
             result = adapter.fetch(resolved, config)
 
         assert result == {"success": True}
-        assert mock_client.return_value.__enter__.return_value.request.call_count == 2
+        assert mock_client.return_value.request.call_count == 2
 
     def test_retry_on_timeout(self, mock_resolved_source, mock_config):
         """Test retry on timeout."""
@@ -322,7 +363,7 @@ class TestRestAdapterRetry:
         mock_response.json.return_value = {"success": True}
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.side_effect = [
+            mock_client.return_value.request.side_effect = [
                 httpx.TimeoutException("timeout"),
                 mock_response,
             ]
@@ -343,10 +384,82 @@ class TestRestAdapterRetry:
         config = mock_config(retry_max_attempts=2, retry_backoff_factor=0.01)
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.side_effect = httpx.TimeoutException("timeout")
+            mock_client.return_value.request.side_effect = httpx.TimeoutException("timeout")
             with pytest.raises(TimeoutError, match="timed out after 2 attempts"):
                 adapter.fetch(resolved, config)
 
+    def test_connect_error_retried_by_transport(self, mock_resolved_source, mock_config):
+        """Test connect failures are retried by the transport, not the retry loop."""
+        import httpx
+
+        adapter = RestAdapter()
+        resolved = mock_resolved_source(
+            source_type="rest",
+            connection={"base_url": "https://api.example.com"},
+            query="/v1/data",
+        )
+        config = mock_config(retry_max_attempts=3, retry_backoff_factor=0.01)
+
+        with patch("httpx.HTTPTransport") as mock_transport, patch("httpx.Client") as mock_client:
+            mock_client.return_value.request.side_effect = httpx.ConnectError("refused")
+            with pytest.raises(ConnectionError, match="after 3 attempts"):
+                adapter.fetch(resolved, config)
+
+        assert mock_transport.call_args[1]["retries"] == 2
+        assert mock_client.return_value.request.call_count == 1
+
+    def test_connect_timeout_not_retried_by_loop(self, mock_resolved_source, mock_config):
+        """Test connect timeouts are left to the transport instead of retried again."""
+        import httpx
+
+        adapter = RestAdapter()
+        resolved = mock_resolved_source(
+            source_type="rest",
+            connection={"base_url": "https://api.example.com"},
+            query="/v1/data",
+        )
+        config = mock_config(retry_max_attempts=3, retry_backoff_factor=0.01)
+
+        with patch("httpx.HTTPTransport") as mock_transport, patch("httpx.Client") as mock_client:
+            mock_client.return_value.request.side_effect = httpx.ConnectTimeout("timed out")
+            with pytest.raises(TimeoutError, match="Connecting to .* after 3 attempts"):
+                adapter.fetch(resolved, config)
+
+        assert mock_transport.call_args[1]["retries"] == 2
+        assert mock_client.return_value.request.call_count == 1
+
+
+    def test_shared_client_does_not_keep_cookies(self):
+        """Test a Set-Cookie on one response is not sent with the next request."""
+        import httpx
+
+        seen = []
+
+        def handler(request):
+            seen.append(request.headers.get("cookie"))
+            return httpx.Response(200, json={}, headers={"Set-Cookie": "session=abc; Path=/"})
+
+        with patch("httpx.HTTPTransport", return_value=httpx.MockTransport(handler)):
+            client = rest._get_client("https://api.example.com/v1/data", 5.0)
+            client.get("https://api.example.com/v1/data")
+            client.get("https://api.example.com/v1/data")
+
+        assert seen == [None, None]
+        assert len(client.cookies) == 0
+
+    def test_backoff_is_jittered_and_capped(self, mock_config):
+        """Test backoff draws from [0, min(factor * 2^(attempt+1), max_delay)]."""
+        import random
+
+        from moniker_client.adapters.rest import _backoff_delay
+
+        config = mock_config(retry_backoff_factor=0.5, retry_max_delay=3.0)
+        random.seed(0)
+        delays = [_backoff_delay(attempt, config) for attempt in range(6)]
+
+        assert all(0 <= d <= min(0.5 * 2 ** (a + 1), 3.0) for a, d in enumerate(delays))
+        assert len(set(delays)) == len(delays)
+
 
 class TestRestAdapterResponsePath:
     """Tests for response path extraction."""
@@ -371,7 +484,7 @@ class TestRestAdapterResponsePath:
         }
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = mock_response
+            mock_client.return_value.request.return_value = mock_response
             result = adapter.fetch(resolved, mock_config())
 
         assert result == [{"id": 1}, {"id": 2}]
@@ -393,7 +506,7 @@ class TestRestAdapterResponsePath:
         }
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = mock_response
+            mock_client.return_value.request.return_value = mock_response
             result = adapter.fetch(resolved, mock_config())
 
         assert result == {"first": True}
@@ -405,6 +518,29 @@ class TestRestAdapterResponsePath:
         assert adapter._extract_path(data, "a.c") is None
         assert adapter._extract_path(data, "x.y.z") is None
 
+    def test_fetch_decodes_with_orjson(self, mock_resolved_source, mock_config, monkeypatch):
+        """Test raw body is parsed with orjson when installed."""
+        orjson = pytest.importorskip("orjson")
+        monkeypatch.setattr(rest, "orjson", orjson)
+        adapter = RestAdapter()
+        resolved = mock_resolved_source(
+            source_type="rest",
+            connection={"base_url": "https://api.example.com"},
+            query="/v1/data",
+            params={"response_path": "data"},
+        )
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = b'{"data": [1, 2, 3]}'
+
+        with patch("httpx.Client") as mock_client:
+            mock_client.return_value.request.return_value = mock_response
+            result = adapter.fetch(resolved, mock_config())
+
+        assert result == [1, 2, 3]
+        mock_response.json.assert_not_called()
+
 
 class TestRestAdapterListChildren:
     """Tests for REST list_children."""
@@ -425,7 +561,7 @@ class TestRestAdapterListChildren:
         mock_response.json.return_value = ["child1", "child2", "child3"]
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.get.return_value = mock_response
+            mock_client.return_value.get.return_value = mock_response
             result = adapter.list_children(resolved, mock_config())
 
         assert result == ["child1", "child2", "child3"]
@@ -449,7 +585,7 @@ class TestRestAdapterListChildren:
         ]
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.get.return_value = mock_response
+            mock_client.return_value.get.return_value = mock_response
             result = adapter.list_children(resolved, mock_config())
 
         assert result == ["item1", "item2"]
@@ -472,7 +608,7 @@ class TestRestAdapterListChildren:
         }
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.get.return_value = mock_response
+            mock_client.return_value.get.return_value = mock_response
             result = adapter.list_children(resolved, mock_config())
 
         assert result == ["a", "b", "c"]
@@ -500,7 +636,7 @@ class TestRestAdapterListChildren:
         )
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.get.side_effect = Exception("Network error")
+            mock_client.return_value.get.side_effect = Exception("Network error")
             result = adapter.list_children(resolved, mock_config())
 
         assert result == []
@@ -524,7 +660,7 @@ class TestRestAdapterHealthCheck:
         mock_response.status_code = 200
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.get.return_value = mock_response
+            mock_client.return_value.get.return_value = mock_response
             result = adapter.health_check(resolved, mock_config())
 
         assert result["healthy"] is True
@@ -542,7 +678,7 @@ class TestRestAdapterHealthCheck:
         mock_response.status_code = 500
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.get.return_value = mock_response
+            mock_client.return_value.get.return_value = mock_response
             result = adapter.health_check(resolved, mock_config())
 
         assert result["healthy"] is False
@@ -572,7 +708,7 @@ class TestRestAdapterHealthCheck:
         )
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.get.side_effect = httpx.TimeoutException("timeout")
+            mock_client.return_value.get.side_effect = httpx.TimeoutException("timeout")
             result = adapter.health_check(resolved, mock_config())
 
         assert result["healthy"] is False
@@ -596,7 +732,7 @@ class TestRestAdapterResult:
         mock_response.json.return_value = [{"id": 1}, {"id": 2}]
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = mock_response
+            mock_client.return_value.request.return_value = mock_response
             from moniker_client.adapters.base import AdapterResult
             result = adapter.fetch(resolved, mock_config(), return_result=True)
 
@@ -630,7 +766,7 @@ class TestRestAdapterResponseValidation:
         mock_response.json.return_value = [{"id": 1}]
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = mock_response
+            mock_client.return_value.request.return_value = mock_response
             # Should not raise
             result = adapter.fetch(resolved, mock_config())
 
@@ -659,8 +795,139 @@ class TestRestAdapterResponseValidation:
         try:
             import jsonschema  # noqa: F401
             with patch("httpx.Client") as mock_client:
-                mock_client.return_value.__enter__.return_value.request.return_value = mock_response
+                mock_client.return_value.request.return_value = mock_response
                 with pytest.raises(ValueError, match="validation failed"):
                     adapter.fetch(resolved, mock_config())
         except ImportError:
             pytest.skip("jsonschema not installed")
+
+    def test_validator_compiled_once_per_schema(self, mock_resolved_source, mock_config):
+        """Test a repeated schema object reuses its compiled validator without re-serializing."""
+        pytest.importorskip("jsonschema")
+        adapter = RestAdapter()
+        schema = {"type": "array", "items": {"type": "object"}}
+
+        with patch("json.dumps", side_effect=AssertionError("schema serialized")):
+            adapter._validate_response([{"id": 1}], schema)
+            validator = rest._schema_validator(schema)
+            adapter._validate_response([{"id": 2}], schema)
+
+        assert rest._schema_validator(schema) is validator
+
+    def test_invalid_schema_not_blamed_on_response(self):
+        """Test a malformed schema is reported as such, not as a validation failure."""
+        pytest.importorskip("jsonschema")
+        adapter = RestAdapter()
+
+        with pytest.raises(ValueError, match="Invalid response_schema") as excinfo:
+            adapter._validate_response([{"id": 1}], {"type": 12})
+
+        assert "validation failed" not in str(excinfo.value)
+
+
+class TestRestAdapterAsync:
+    """Tests for the async fetch path."""
+
+    def test_afetch_concurrent(self, mock_resolved_source, mock_config):
+        """Test afetch results with asyncio.gather share one AsyncClient."""
+        adapter = RestAdapter()
+        resolved = [
+            mock_resolved_source(
+                source_type="rest",
+                connection={"base_url": "https://api.example.com"},
+                query=f"/v1/data/{i}",
+                params={"response_path": "value"},
+            )
+            for i in range(3)
+        ]
+
+        def respond(method, url, **kwargs):
+            response = MagicMock()
+            response.status_code = 200
+            response.json.return_value = {"value": url.rsplit("/", 1)[1]}
+            return response
+
+        async def run():
+            return await asyncio.gather(
+                *(adapter.afetch(r, mock_config()) for r in resolved)
+            )
+
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_client.return_value.request = AsyncMock(side_effect=respond)
+            results = asyncio.run(run())
+
+        assert results == ["0", "1", "2"]
+        assert mock_client.call_count == 1
+
+    def test_afetch_retries_on_503(self, mock_resolved_source, mock_config):
+        """Test afetch retries transient status codes."""
+        adapter = RestAdapter()
+        resolved = mock_resolved_source(
+            source_type="rest",
+            connection={"base_url": "https://api.example.com"},
+            query="/v1/data",
+        )
+        config = mock_config(retry_max_attempts=3, retry_backoff_factor=0.01)
+
+        mock_response_503 = MagicMock()
+        mock_response_503.status_code = 503
+        mock_response_200 = MagicMock()
+        mock_response_200.status_code = 200
+        mock_response_200.json.return_value = {"success": True}
+
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_client.return_value.request = AsyncMock(
+                side_effect=[mock_response_503, mock_response_200]
+            )
+            result = asyncio.run(adapter.afetch(resolved, config))
+
+        assert result == {"success": True}
+        assert mock_client.return_value.request.call_count == 2
+
+    def test_alist_children(self, mock_resolved_source, mock_config):
+        """Test async children listing."""
+        adapter = RestAdapter()
+        resolved = mock_resolved_source(
+            source_type="rest",
+            connection={
+                "base_url": "https://api.example.com",
+                "children_endpoint": "/v1/children",
+            },
+        )
+
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"items": [{"name": "a"}, "b"]}
+
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_client.return_value.get = AsyncMock(return_value=mock_response)
+            children = asyncio.run(adapter.alist_children(resolved, mock_config()))
+
+        assert children == ["a", "b"]
+
+    def test_health_check_many(self, mock_resolved_source, mock_config):
+        """Test batch health checks fan out and keep input order."""
+        import httpx
+
+        resolved = [
+            mock_resolved_source(
+                source_type="rest",
+                connection={"base_url": f"https://api.example.com/{name}/"},
+            )
+            for name in ("up", "down", "slow")
+        ] + [mock_resolved_source(source_type="rest", connection={})]
+
+        async def respond(url, **kwargs):
+            if "slow" in url:
+                raise httpx.TimeoutException("timeout")
+            response = MagicMock()
+            response.status_code = 200 if "up" in url else 503
+            return response
+
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_client.return_value.get = AsyncMock(side_effect=respond)
+            results = asyncio.run(rest.health_check_many(resolved, mock_config()))
+
+        assert [r["healthy"] for r in results] == [True, False, False, False]
+        assert results[2]["message"] == "Health check timed out"
+        assert results[3]["message"] == "base_url not configured"
+        assert mock_client.call_count == 1